@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""This module contains the conversion of whole arrays of texts and datetimes in Qt display formats.
+
+NumPy is needed for the functions of this module, it can be installed with the "arrays" extra:
+
+$ pip install ClearableDateTimeEdit[arrays]
+"""
+__all__ = ["formatMany", "parseMany"]
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ClearableDateTimeEdit.Formats import (
+    DAY_NAMES,
+    MAXIMUM,
+    MONTH_NAMES,
+    DateTimeFormat,
+    Section,
+    compileFormat,
+)
+from ClearableDateTimeEdit.Settings import Mode
+
+# NumPy is imported on first use, see _numpy.
+np = None
+
+_FIXED_WIDTH_KINDS = {"day": 2, "month": 2, "hour24": 2, "minute": 2, "second": 2, "msec": 3}
+_PARTS = {"day": "day", "month": "month", "hour24": "hour", "minute": "minute", "second": "second", "msec": "msec"}
+
+
+def _numpy():
+    """Imports NumPy on first use, so importing the module does not load it.
+
+    Raises:
+        ImportError if NumPy is not installed.
+
+    Returns:
+        NumPy module.
+
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for array conversions, install it with 'pip install numpy'") from None
+        np = numpy
+    return np
+
+
+def _fixedWidthLayout(dtFormat: DateTimeFormat) -> Optional[Tuple[List[Tuple[Section, int]], int]]:
+    """Gets the position of every section if all sections of the format have a fixed width.
+
+    Args:
+        dtFormat (DateTimeFormat): Compiled display format.
+
+    Returns:
+        Optional[Tuple[List[Tuple[Section, int]], int]]: Sections with their start positions and the length of the
+            texts or None if a section has a variable width, e.g. "d", day and month names or AM/PM.
+
+    """
+    layout = []
+    position = 0
+    for section in dtFormat.sections:
+        if section.kind == "literal":
+            width = len(section.text)
+        elif section.kind == "year":
+            width = section.count
+        elif _FIXED_WIDTH_KINDS.get(section.kind) == section.count:
+            width = section.count
+        else:
+            return None
+        layout.append((section, position))
+        position += width
+    return layout, position
+
+
+def _asStrings(texts: Iterable):
+    """Converts given texts into a NumPy unicode array, entries which are no strings become empty strings.
+
+    Args:
+        texts (Iterable): List or NumPy array of texts.
+
+    Returns:
+        NumPy unicode array.
+
+    """
+    array = np.asarray(texts)
+    if array.dtype.kind == "U":
+        return array.ravel()
+    return np.array([text if isinstance(text, str) else "" for text in array.ravel()], dtype=str)
+
+
+def parseMany(texts: Iterable, fmt: str, mode: Mode = Mode.datetime):
+    """Converts texts in given display format into datetimes.
+
+    Notes:
+        If all sections of the format have a fixed width, e.g. "dd.MM.yyyy HH:mm:ss", the texts are converted in
+        vectorized NumPy passes over their characters. Other formats are converted text by text with the compiled
+        display format. Parts missing in the format are 1900-01-01 00:00:00.000 like in QDateTime.fromString, in time
+        mode the date is 1970-01-01 and in date mode the time is dropped.
+
+    Args:
+        texts (Iterable): List or NumPy array of texts.
+        fmt (str): Qt display format, e.g. "dd.MM.yyyy HH:mm:ss".
+        mode (Mode, optional): Mode of the values.
+
+    Raises:
+        ImportError if NumPy is not installed.
+
+    Returns:
+        Tuple of a datetime64[ms] array, NaT for invalid texts, and a boolean array which is True for valid texts.
+
+    """
+    _numpy()
+    dtFormat = compileFormat(fmt)
+    strings = _asStrings(texts)
+    default = datetime(1970, 1, 1) if mode == Mode.time else datetime(1900, 1, 1)
+    layout = _fixedWidthLayout(dtFormat)
+    if layout is None:
+        values = np.full(strings.shape, np.datetime64("NaT"), dtype="datetime64[ms]")
+        for i, text in enumerate(strings.tolist()):
+            dt = dtFormat.fromText(text, default)
+            if dt is not None:
+                values[i] = np.datetime64(dt, "ms")
+        valid = ~np.isnat(values)
+    else:
+        values, valid = _parseFixedWidth(strings, *layout, default)
+    if mode == Mode.date:
+        values = values.astype("datetime64[D]").astype("datetime64[ms]")
+    return values, valid
+
+
+def _parseFixedWidth(strings, layout: List[Tuple[Section, int]], length: int, default: datetime):
+    """Converts texts in a display format whose sections all have a fixed width into datetimes.
+
+    Args:
+        strings: NumPy unicode array of texts.
+        layout (List[Tuple[Section, int]]): Sections with their start positions.
+        length (int): Length of the texts.
+        default (datetime): Datetime whose parts are used for the sections missing in the display format.
+
+    Returns:
+        Tuple of a datetime64[ms] array and a boolean array which is True for valid texts.
+
+    """
+    valid = np.char.str_len(strings) == length
+    codes = np.zeros((strings.size, length), dtype=np.uint32)
+    if length:
+        codes[valid] = strings[valid].astype("<U%d" % length).view(np.uint32).reshape(-1, length)
+    digits = codes.astype(np.int64) - ord("0")
+    parts: Dict[str, object] = {}
+    for section, position in layout:
+        if section.kind == "literal":
+            for offset, char in enumerate(section.text):
+                valid &= codes[:, position + offset] == ord(char)
+            continue
+        number = np.zeros(strings.size, dtype=np.int64)
+        for offset in range(section.count):
+            digit = digits[:, position + offset]
+            valid &= (digit >= 0) & (digit <= 9)
+            number = number * 10 + digit
+        part = ("year" if section.count == 4 else "year2") if section.kind == "year" else _PARTS[section.kind]
+        valid &= number <= MAXIMUM[part]
+        if part in parts:
+            valid &= parts[part] == number
+        else:
+            parts[part] = number
+    year = parts.get("year", np.full(strings.size, default.year, dtype=np.int64))
+    if "year2" in parts:
+        if "year" in parts:
+            valid &= year % 100 == parts["year2"]
+        else:
+            year = 1900 + parts["year2"]
+    month = parts.get("month", default.month)
+    day = parts.get("day", default.day)
+    valid &= (year >= 1) & (month >= 1) & (day >= 1)
+    year = np.where(valid, year, 1970)
+    month = np.where(valid, month, 1)
+    day = np.where(valid, day, 1)
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    month_days = ((months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")).astype(np.int64)
+    valid &= day <= month_days
+    msecs = (
+        (parts.get("hour", default.hour) * 60 + parts.get("minute", default.minute)) * 60
+        + parts.get("second", default.second)
+    ) * 1000 + parts.get("msec", default.microsecond // 1000)
+    values = months.astype("datetime64[D]").astype("datetime64[ms]") + ((day - 1) * 86400000 + msecs).astype(
+        "timedelta64[ms]"
+    )
+    values[~valid] = np.datetime64("NaT")
+    return values, valid
+
+
+def formatMany(values: Iterable, fmt: str):
+    """Converts datetimes into texts in given display format.
+
+    Notes:
+        The sections are formatted in vectorized NumPy passes over all values. NaT values are converted into empty
+        strings like values before year 1 or after year 9999. Formats with time zone sections are converted value by
+        value with the compiled display format.
+
+    Args:
+        values (Iterable): NumPy datetime64 array or list of datetimes.
+        fmt (str): Qt display format, e.g. "dd.MM.yyyy HH:mm:ss".
+
+    Raises:
+        ImportError if NumPy is not installed.
+
+    Returns:
+        NumPy unicode array of texts.
+
+    """
+    _numpy()
+    dtFormat = compileFormat(fmt)
+    values = np.asarray(values, dtype="datetime64[ms]").ravel()
+    missing = np.isnat(values)
+    if any(section.kind == "timeZone" for section in dtFormat.sections):
+        texts = ["" if value is None else dtFormat.toText(value) for value in values.astype("datetime64[us]").tolist()]
+        return np.array(texts, dtype=str)
+    # Values outside of the range of datetime are formatted as empty strings.
+    missing |= (values < np.datetime64("0001-01-01", "ms")) | (values >= np.datetime64("10000-01-01", "ms"))
+    safe = np.where(missing, np.datetime64(0, "ms"), values)
+    years = safe.astype("datetime64[Y]")
+    months = safe.astype("datetime64[M]")
+    days = safe.astype("datetime64[D]")
+    parts = {
+        "year": years.astype(np.int64) + 1970,
+        "month": (months - years.astype("datetime64[M]")).astype(np.int64) + 1,
+        "day": (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+        "weekday": (days.astype(np.int64) + 3) % 7,
+    }
+    msecs = (safe - days.astype("datetime64[ms]")).astype(np.int64)
+    parts["hour"] = msecs // 3600000
+    parts["minute"] = msecs // 60000 % 60
+    parts["second"] = msecs // 1000 % 60
+    parts["msec"] = msecs % 1000
+    layout = _fixedWidthLayout(dtFormat)
+    if layout is None:
+        texts = np.full(values.shape, "", dtype=str)
+        for section in dtFormat.sections:
+            texts = np.char.add(texts, _formatSection(section, parts, values.size))
+    else:
+        texts = _formatFixedWidth(parts, *layout)
+    texts[missing] = ""
+    return texts
+
+
+def _formatFixedWidth(parts: Dict[str, object], layout: List[Tuple[Section, int]], length: int):
+    """Formats datetimes in a display format whose sections all have a fixed width.
+
+    Notes:
+        The characters are written into a matrix of code points which is viewed as unicode array, so no string is
+        created per value.
+
+    Args:
+        parts (Dict[str, object]): Integer arrays of the datetime parts.
+        layout (List[Tuple[Section, int]]): Sections with their start positions.
+        length (int): Length of the texts.
+
+    Returns:
+        NumPy unicode array of texts.
+
+    """
+    size = parts["year"].size
+    if not length:
+        return np.full(size, "", dtype=str)
+    codes = np.zeros((size, length), dtype=np.uint32)
+    for section, position in layout:
+        if section.kind == "literal":
+            for offset, char in enumerate(section.text):
+                codes[:, position + offset] = ord(char)
+            continue
+        if section.kind == "year":
+            number = parts["year"] % 10**section.count
+        else:
+            number = parts[_PARTS[section.kind]]
+        for offset in range(section.count):
+            codes[:, position + offset] = number // 10 ** (section.count - 1 - offset) % 10 + ord("0")
+    return codes.view("<U%d" % length).ravel()
+
+
+@lru_cache(maxsize=8)
+def _numberTexts(fmt: str, size: int):
+    """Gets the texts of the numbers from 0 to size - 1, used to format numbers by indexing.
+
+    Args:
+        fmt (str): Format of the numbers, e.g. "%02d".
+        size (int): Number of texts.
+
+    Returns:
+        NumPy unicode array of texts.
+
+    """
+    return np.array([fmt % number for number in range(size)])
+
+
+def _formatSection(section: Section, parts: Dict[str, object], size: int):
+    """Formats given section of all values.
+
+    Args:
+        section (Section): Section of the display format.
+        parts (Dict[str, object]): Integer arrays of the datetime parts.
+        size (int): Number of values.
+
+    Returns:
+        NumPy unicode array with the text of the section.
+
+    """
+    kind = section.kind
+    pad = "%02d" if section.count == 2 else "%d"
+    if kind == "literal":
+        return np.full(size, section.text)
+    if kind == "dayName":
+        names = np.array([name[: 3 if section.count == 3 else None] for name in DAY_NAMES])
+        return names[parts["weekday"]]
+    if kind == "monthName":
+        names = np.array([name[: 3 if section.count == 3 else None] for name in MONTH_NAMES])
+        return names[parts["month"] - 1]
+    if kind == "year":
+        if section.count == 4:
+            return _numberTexts("%04d", 10000)[parts["year"]]
+        return _numberTexts("%02d", 100)[parts["year"] % 100]
+    if kind == "hour12":
+        return _numberTexts(pad, 13)[(parts["hour"] + 11) % 12 + 1]
+    if kind == "msec":
+        if section.count == 3:
+            return _numberTexts("%03d", 1000)[parts["msec"]]
+        texts = np.array([("%03d" % number).rstrip("0") or "0" for number in range(1000)])
+        return texts[parts["msec"]]
+    if kind == "amPm":
+        am, pm = ("AM", "PM") if section.text == "AP" else ("am", "pm")
+        return np.where(parts["hour"] >= 12, pm, am)
+    return _numberTexts(pad, 60)[parts[_PARTS.get(kind, kind)]]
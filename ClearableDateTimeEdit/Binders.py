@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""The module contains the binder loading records into many ClearableDateTimeEdit fields in one batched pass."""
+
+__all__ = ["ClearableDateTimeBinder"]
+
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from PySide2 import QtCore
+from PySide2.QtCore import QDate, QDateTime, QObject, QTime
+
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+_MISSING = object()
+
+
+class ClearableDateTimeBinder(QObject):
+    """ClearableDateTimeBinder binds ClearableDateTimeEdit fields to names and applies values, clears and ranges of a
+    whole record to them in one batched pass.
+
+    Notes:
+        During a pass the signals of the fields are blocked and their windows are not repainted. valuesChanged is
+        sent once at the end with the previous and new datetime (None if empty) of every changed field, also if the
+        pass stops with an error, e.g. for an unsupported value, after some fields have been changed.
+
+    """
+
+    valuesChanged = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super(ClearableDateTimeBinder, self).__init__(parent)
+        self.__fields: Dict[str, ClearableDateTimeEdit] = {}
+
+    def addField(self, name: str, edit: ClearableDateTimeEdit):
+        """Binds given field to given name.
+
+        Args:
+            name (str): Name of the field, e.g. the key of the field in the records.
+            edit (ClearableDateTimeEdit): Field.
+
+        Raises:
+            TypeError if given field is not ClearableDateTimeEdit.
+
+        """
+        if not isinstance(edit, ClearableDateTimeEdit):
+            edit_type = str(type(edit)).split("'")[1]
+            raise TypeError(
+                f"""'ClearableDateTimeBinder.addField' called with wrong argument types:\n\t
+                ClearableDateTimeBinder.addField(str, {edit_type})\n\t\t
+                Supported signatures:\n\t
+                ClearableDateTimeBinder.addField(str, ClearableDateTimeEdit)"""
+            )
+        self.__fields[name] = edit
+
+    def removeField(self, name: str):
+        """Removes the field bound to given name.
+
+        Args:
+            name (str): Name of the field.
+
+        """
+        self.__fields.pop(name, None)
+
+    def field(self, name: str) -> Optional[ClearableDateTimeEdit]:
+        """Gets the field bound to given name.
+
+        Args:
+            name (str): Name of the field.
+
+        Returns:
+            Optional[ClearableDateTimeEdit]: Field or None if no field is bound to the name.
+
+        """
+        return self.__fields.get(name)
+
+    def fieldNames(self) -> List[str]:
+        """Gets the names of all bound fields.
+
+        Returns:
+            List[str]: Names of the fields in the order they have been added.
+
+        """
+        return list(self.__fields)
+
+    def load(self, record, clearMissing: bool = False):
+        """Applies the values of given record to the bound fields, None clears a field.
+
+        Args:
+            record: Mapping or object with attributes named like the fields. Values can be QDateTime, QDate, QTime,
+                datetime, date, time or None.
+            clearMissing (bool, optional): Flag for clearing fields missing in the record, otherwise they are kept.
+
+        """
+        with self.__batch(self.__fields) as edits:
+            for name, edit in edits:
+                if isinstance(record, Mapping):
+                    value = record.get(name, _MISSING)
+                else:
+                    value = getattr(record, name, _MISSING)
+                if value is _MISSING:
+                    if clearMissing:
+                        edit.clear()
+                    continue
+                self.__setValue(edit, value)
+
+    def clear(self, names: Optional[Iterable[str]] = None):
+        """Clears given fields.
+
+        Args:
+            names (Optional[Iterable[str]], optional): Names of the fields, all fields are cleared if not given.
+
+        """
+        with self.__batch(self.__fields if names is None else names) as edits:
+            for _, edit in edits:
+                edit.clear()
+
+    def setRanges(self, ranges: Mapping[str, Tuple]):
+        """Sets minimum and maximum of the fields, values out of range are moved into the range.
+
+        Args:
+            ranges (Mapping[str, Tuple]): Pairs of minimum and maximum as QDateTime, QDate or QTime by field name.
+
+        """
+        with self.__batch(ranges) as edits:
+            for name, edit in edits:
+                minimum, maximum = ranges[name]
+                if isinstance(minimum, QDateTime):
+                    edit.setDateTimeRange(minimum, maximum)
+                elif isinstance(minimum, QDate):
+                    edit.setMinimumDate(minimum)
+                    edit.setMaximumDate(maximum)
+                else:
+                    edit.setTimeRange(minimum, maximum)
+
+    def snapshot(self) -> Dict[str, Union[QDate, QDateTime, QTime, None]]:
+        """Gets the values of all bound fields depending on their mode.
+
+        Returns:
+            Dict[str, Union[QDate, QDateTime, QTime, None]]: Date, datetime or time by field name, None for empty
+                fields.
+
+        """
+        mode_value_map = {
+            Mode.time.value: ClearableDateTimeEdit.time,
+            Mode.date.value: ClearableDateTimeEdit.date,
+            Mode.datetime.value: ClearableDateTimeEdit.dateTime,
+        }
+        return {name: mode_value_map[edit.mode().value](edit) for name, edit in self.__fields.items()}
+
+    @contextmanager
+    def __batch(self, names: Iterable[str]) -> Iterator[List[Tuple[str, ClearableDateTimeEdit]]]:
+        """Suspends signals and repaints of the fields with given names and sends valuesChanged for the changed
+        fields at the end, also if the pass raises.
+
+        Args:
+            names (Iterable[str]): Names of the fields, unknown names are skipped.
+
+        Yields:
+            List[Tuple[str, ClearableDateTimeEdit]]: Names and fields.
+
+        """
+        edits = [(name, self.__fields[name]) for name in names if name in self.__fields]
+        old_values = {}
+        coalescing = []
+        for name, edit in edits:
+            if edit.coalesceChanges():
+                # Changes pending from before the pass are sent before the signals are blocked.
+                edit.setCoalesceChanges(False)
+                coalescing.append(edit)
+            old_values[name] = edit.dateTime()
+        windows = {edit.window() for _, edit in edits}
+        windows = [window for window in windows if window.updatesEnabled()]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        blocked = [edit.blockSignals(True) for _, edit in edits]
+        try:
+            yield edits
+        finally:
+            for (_, edit), was_blocked in zip(edits, blocked):
+                edit.blockSignals(was_blocked)
+            for edit in coalescing:
+                edit.setCoalesceChanges(True)
+            for window in windows:
+                window.setUpdatesEnabled(True)
+            changes = {}
+            for name, edit in edits:
+                new_value = edit.dateTime()
+                if new_value != old_values[name]:
+                    changes[name] = (old_values[name], new_value)
+            if changes:
+                self.valuesChanged.emit(changes)
+
+    @staticmethod
+    def __setValue(edit: ClearableDateTimeEdit, value):
+        """Sets given value in given field.
+
+        Args:
+            edit (ClearableDateTimeEdit): Field.
+            value: QDateTime, QDate, QTime, datetime, date, time or None to clear the field.
+
+        Raises:
+            TypeError if the type of given value is not supported.
+
+        """
+        if value is None:
+            edit.clear()
+        elif isinstance(value, QDateTime):
+            edit.setDateTime(value)
+        elif isinstance(value, QDate):
+            edit.setDate(value)
+        elif isinstance(value, QTime):
+            edit.setTime(value)
+        elif isinstance(value, datetime):
+            edit.setDateTime(
+                QDateTime(
+                    QDate(value.year, value.month, value.day),
+                    QTime(value.hour, value.minute, value.second, value.microsecond // 1000),
+                )
+            )
+        elif isinstance(value, date):
+            edit.setDate(QDate(value.year, value.month, value.day))
+        elif isinstance(value, time):
+            edit.setTime(QTime(value.hour, value.minute, value.second, value.microsecond // 1000))
+        else:
+            value_type = str(type(value)).split("'")[1]
+            raise TypeError(
+                f"""'ClearableDateTimeBinder.load' called with wrong value types:\n\t
+                ClearableDateTimeBinder.load({value_type})\n\t\t
+                Supported value types:\n\t
+                PySide2.QtCore.QDateTime, PySide2.QtCore.QDate, PySide2.QtCore.QTime, datetime, date, time, None"""
+            )
@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+"""This module contains the value, range and validation logic of the DateTimeEdit widget.
+
+The module does not depend on Qt, so form data can be validated the way the widget does it without a QApplication:
+
+>>> from ClearableDateTimeEdit.Core import DateTimeController
+>>> from ClearableDateTimeEdit.Settings import Mode
+>>> controller = DateTimeController(Mode.date)
+>>> controller.validate("24.12.2022")
+datetime.datetime(2022, 12, 24, 0, 0)
+"""
+__all__ = ["DEFAULT_FORMATS", "DateTimeController", "Part", "ValueChange"]
+from datetime import date, datetime, time
+from enum import IntFlag
+from typing import NamedTuple, Optional, Tuple
+
+from ClearableDateTimeEdit.Formats import DateTimeFormat, compileFormat
+from ClearableDateTimeEdit.Intervals import IntervalIndex
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.TimeZones import TimeZone
+
+DEFAULT_FORMATS = {
+    Mode.date: "dd.MM.yyyy",
+    Mode.datetime: "dd.MM.yyyy HH:mm:ss",
+    Mode.time: "HH:mm:ss",
+}
+
+# Limits and initial value of QDateTimeEdit.
+_MINIMUM_DATETIME = datetime(1752, 9, 14)
+_MAXIMUM_DATETIME = datetime(9999, 12, 31, 23, 59, 59, 999000)
+_INITIAL_DATETIME = datetime(2000, 1, 1)
+# Index without disabled intervals, shared by all controllers without them.
+_NO_DISABLED_INTERVALS = IntervalIndex()
+
+
+class Part(IntFlag):
+    """Parts of a datetime, combined as flags in ValueChange.changedParts."""
+
+    none = 0
+    year = 1
+    month = 2
+    day = 4
+    hour = 8
+    minute = 16
+    second = 32
+    msec = 64
+    date = year | month | day
+    time = hour | minute | second | msec
+    all = date | time
+
+
+_PART_VALUES = (
+    (Part.year, lambda dt: dt.year),
+    (Part.month, lambda dt: dt.month),
+    (Part.day, lambda dt: dt.day),
+    (Part.hour, lambda dt: dt.hour),
+    (Part.minute, lambda dt: dt.minute),
+    (Part.second, lambda dt: dt.second),
+    (Part.msec, lambda dt: dt.microsecond // 1000),
+)
+
+
+class ValueChange(NamedTuple):
+    """Change of the committed value of a DateTimeEdit, None stands for an empty DateTimeEdit."""
+
+    old: Optional[datetime]
+    new: Optional[datetime]
+
+    @property
+    def changed(self) -> bool:
+        """Whether the committed value has changed.
+
+        Returns:
+            bool: True if old and new value are different, False otherwise.
+
+        """
+        return self.old != self.new
+
+    @property
+    def changedParts(self) -> Part:
+        """Gets the parts which differ between old and new value, all parts if only one of them is empty.
+
+        Returns:
+            Part: Flags of the changed parts.
+
+        """
+        if self.old is None or self.new is None:
+            return Part.none if self.old is self.new else Part.all
+        parts = Part.none
+        for part, value in _PART_VALUES:
+            if value(self.old) != value(self.new):
+                parts |= part
+        return parts
+
+    @property
+    def dateChanged(self) -> bool:
+        """Whether a new date has been committed, i.e. the new value is not empty and its date is another one.
+
+        Returns:
+            bool: True if the date has changed, False otherwise.
+
+        """
+        return self.new is not None and (self.old is None or self.old.date() != self.new.date())
+
+    @property
+    def timeChanged(self) -> bool:
+        """Whether a new time has been committed, i.e. the new value is not empty and its time is another one.
+
+        Returns:
+            bool: True if the time has changed, False otherwise.
+
+        """
+        return self.new is not None and (self.old is None or self.old.time() != self.new.time())
+
+
+class DateTimeController:
+    """This class contains the state of a DateTimeEdit: display format, range, current and committed value.
+
+    Notes:
+        The range follows QDateTimeEdit: it is 1752-09-14 00:00:00.000 to 9999-12-31 23:59:59.999 by default, the
+        date and time setters only change the date or time of the minimum or maximum datetime and values are moved
+        into the range. In time mode, the times of the minimum and maximum datetime bound the time of every day, like
+        the time lists of the pop-up, unless the minimum time is later than the maximum time. In date and datetime mode
+        only the datetimes bound the value, like in QDateTimeEdit. The current value is kept when the DateTimeEdit is
+        cleared and fills the parts missing in the display format when text is parsed.
+
+        Texts whose datetime lies in a disabled interval or is skipped in the time zone are not valid. The setters of
+        the value do not check the disabled intervals, like the value is not checked when the intervals are changed.
+
+    """
+
+    def __init__(self, mode: Mode = Mode.datetime):
+        self.__mode = mode
+        self.__format = DEFAULT_FORMATS[self.__mode]
+        self.__dtFormat = compileFormat(self.__format)
+        self.__minimum = _MINIMUM_DATETIME
+        self.__maximum = _MAXIMUM_DATETIME
+        # Bounds of the time of every day in time mode, None if the minimum time is later than the maximum time.
+        self.__timeRange: Optional[Tuple[time, time]] = (self.__minimum.time(), self.__maximum.time())
+        self.__disabled = _NO_DISABLED_INTERVALS
+        self.__timeZone: Optional[TimeZone] = None
+        self.__current = _INITIAL_DATETIME
+        self.__value: Optional[datetime] = None
+        self.__text = ""
+
+    def mode(self) -> Mode:
+        """Gets the mode as enum "Mode".
+
+        Returns:
+            Mode: Current mode.
+
+        """
+        return self.__mode
+
+    def setMode(self, mode: Mode):
+        """Sets the mode and resets the display format to the default format of the mode.
+
+        Args:
+            mode (Mode): Mode as enum "Mode".
+
+        """
+        self.__mode = mode
+        self.setDisplayFormat(DEFAULT_FORMATS[self.__mode])
+
+    def displayFormat(self) -> str:
+        """Gets the display format.
+
+        Returns:
+            str: Display format.
+
+        """
+        return self.__format
+
+    def setDisplayFormat(self, fmt: str):
+        """Sets the display format.
+
+        Args:
+            fmt (str): New display format.
+
+        """
+        self.__format = fmt
+        self.__dtFormat = compileFormat(self.__format)
+        self.__text = self.__dtFormat.toText(self.__value) if self.__value is not None else ""
+
+    def dateTimeFormat(self) -> DateTimeFormat:
+        """Gets the compiled display format.
+
+        Returns:
+            DateTimeFormat: Compiled display format.
+
+        """
+        return self.__dtFormat
+
+    def current(self) -> datetime:
+        """Gets the current datetime, which is kept when the value is cleared.
+
+        Returns:
+            datetime: Current datetime.
+
+        """
+        return self.__current
+
+    def value(self) -> Optional[datetime]:
+        """Gets the committed datetime.
+
+        Returns:
+            Optional[datetime]: Committed datetime or None if the DateTimeEdit is empty.
+
+        """
+        return self.__value
+
+    def isEmpty(self) -> bool:
+        """Checks whether no value is committed.
+
+        Returns:
+            bool: True if the DateTimeEdit is empty, False otherwise.
+
+        """
+        return self.__value is None
+
+    def text(self) -> str:
+        """Gets the committed datetime in display format.
+
+        Notes:
+            The text is formatted when a value is committed or the display format is changed, so it can be compared
+            with the text of the line edit on every focus change.
+
+        Returns:
+            str: Committed datetime as text or an empty string if the DateTimeEdit is empty.
+
+        """
+        return self.__text
+
+    def toText(self, dt: datetime) -> str:
+        """Converts given datetime into text in display format.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            str: Datetime as text.
+
+        """
+        return self.__dtFormat.toText(dt)
+
+    def parse(self, text: str) -> Optional[datetime]:
+        """Converts given text in display format into datetime, parts missing in the display format are taken from
+        the current datetime.
+
+        Args:
+            text (str): Text in display format.
+
+        Returns:
+            Optional[datetime]: Datetime or None if the text is not valid.
+
+        """
+        return self.__dtFormat.fromText(text, self.__current)
+
+    def validate(self, text: str) -> Optional[datetime]:
+        """Converts given text into the datetime that would be committed for it, i.e. moved into the range.
+
+        Args:
+            text (str): Text in display format.
+
+        Returns:
+            Optional[datetime]: Datetime or None if the text is not valid or its datetime is not accepted.
+
+        """
+        dt = self.parse(text)
+        if dt is None:
+            return None
+        dt = self.bound(dt)
+        return dt if self.accepts(dt) else None
+
+    def fit(self, dt: datetime) -> Optional[datetime]:
+        """Restricts given datetime to the parts shown in the display format, the other parts are taken from the
+        current datetime.
+
+        Args:
+            dt (datetime): Datetime, e.g. selected in the calendar pop-up.
+
+        Returns:
+            Optional[datetime]: Datetime that is committed for the text of given datetime or None if the parts do not
+                form a valid datetime.
+
+        """
+        return self.__dtFormat.fit(dt, self.__current)
+
+    def bound(self, dt: datetime) -> datetime:
+        """Moves given datetime into the range, in time mode its time is moved between minimum and maximum time on the
+        same day.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            datetime: Datetime between minimum and maximum datetime.
+
+        """
+        dt = min(max(dt, self.__minimum), self.__maximum)
+        if self.__mode == Mode.time and self.__timeRange is not None:
+            minimum, maximum = self.__timeRange
+            if dt.time() < minimum:
+                return datetime.combine(dt.date(), minimum)
+            if dt.time() > maximum:
+                return datetime.combine(dt.date(), maximum)
+        return dt
+
+    def setValue(self, dt: Optional[datetime]) -> ValueChange:
+        """Commits given datetime after moving it into the range.
+
+        Args:
+            dt (Optional[datetime]): Datetime or None to clear the value.
+
+        Returns:
+            ValueChange: Previous and new committed datetime.
+
+        """
+        old = self.__value
+        if dt is not None:
+            self.__current = self.bound(dt)
+            self.__value = self.__current
+            self.__text = self.__dtFormat.toText(self.__value)
+        else:
+            self.__value = None
+            self.__text = ""
+        return ValueChange(old, self.__value)
+
+    def setDate(self, d: date) -> ValueChange:
+        """Commits given date with the time of the current datetime.
+
+        Args:
+            d (date): Date.
+
+        Returns:
+            ValueChange: Previous and new committed datetime.
+
+        """
+        return self.setValue(datetime.combine(d, self.__current.time()))
+
+    def setTime(self, t: time) -> ValueChange:
+        """Commits given time with the date of the current datetime.
+
+        Args:
+            t (time): Time.
+
+        Returns:
+            ValueChange: Previous and new committed datetime.
+
+        """
+        return self.setValue(datetime.combine(self.__current.date(), t))
+
+    def commitText(self, text: str) -> Optional[ValueChange]:
+        """Commits given text, an empty text clears the value.
+
+        Args:
+            text (str): Text in display format.
+
+        Returns:
+            Optional[ValueChange]: Previous and new committed datetime or None if the text is not valid or its datetime
+                is not accepted.
+
+        """
+        if not text:
+            return self.clear()
+        dt = self.validate(text)
+        return self.setValue(dt) if dt is not None else None
+
+    def clear(self) -> ValueChange:
+        """Clears the committed value, the current datetime is kept.
+
+        Returns:
+            ValueChange: Previous and new committed datetime.
+
+        """
+        return self.setValue(None)
+
+    def disabledIntervals(self) -> IntervalIndex:
+        """Gets the disabled intervals.
+
+        Returns:
+            IntervalIndex: Index of the disabled intervals.
+
+        """
+        return self.__disabled
+
+    def setDisabledIntervals(self, intervals: Optional[IntervalIndex]):
+        """Sets the disabled intervals, the committed value is kept.
+
+        Args:
+            intervals (Optional[IntervalIndex]): Index of the disabled intervals, None enables all datetimes.
+
+        """
+        self.__disabled = intervals if intervals is not None else _NO_DISABLED_INTERVALS
+
+    def isDisabled(self, dt: datetime) -> bool:
+        """Checks whether given datetime lies in a disabled interval.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            bool: True if the datetime is disabled, False otherwise.
+
+        """
+        return self.__disabled.contains(dt)
+
+    def timeZone(self) -> Optional[TimeZone]:
+        """Gets the time zone of the datetimes.
+
+        Returns:
+            Optional[TimeZone]: Time zone or None if the datetimes have no time zone.
+
+        """
+        return self.__timeZone
+
+    def setTimeZone(self, zone: Optional[TimeZone]):
+        """Sets the time zone of the datetimes, which are wall times of the zone then. The values are kept.
+
+        Args:
+            zone (Optional[TimeZone]): Time zone or None if the datetimes have no time zone.
+
+        """
+        self.__timeZone = zone
+
+    def accepts(self, dt: datetime) -> bool:
+        """Checks whether given datetime can be committed for an entered text or a selection, i.e. it is neither
+        disabled nor skipped when the clocks of the time zone are put forward.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            bool: True if the datetime is accepted, False otherwise.
+
+        """
+        if self.__disabled.contains(dt):
+            return False
+        return self.__timeZone is None or not self.__timeZone.isMissing(dt)
+
+    def minimumDateTime(self) -> datetime:
+        """Gets the minimum datetime.
+
+        Returns:
+            datetime: Minimum datetime.
+
+        """
+        return self.__minimum
+
+    def maximumDateTime(self) -> datetime:
+        """Gets the maximum datetime.
+
+        Returns:
+            datetime: Maximum datetime.
+
+        """
+        return self.__maximum
+
+    def setDateTimeRange(self, min: datetime, max: datetime):
+        """Sets the minimum and maximum datetime and moves the values into the range.
+
+        Args:
+            min (datetime): Minimum datetime.
+            max (datetime): Maximum datetime, the minimum datetime is used if it is smaller.
+
+        """
+        self.__minimum = min
+        self.__maximum = max if max > min else min
+        self.__timeRange = (min.time(), self.__maximum.time()) if min.time() <= self.__maximum.time() else None
+        self.__current = self.bound(self.__current)
+        if self.__value is not None and self.__value != self.__current:
+            self.setValue(self.__current)
+
+    def setMinimumDateTime(self, dt: datetime):
+        """Sets the minimum datetime, the maximum datetime is raised to it if necessary.
+
+        Args:
+            dt (datetime): Minimum datetime.
+
+        """
+        self.setDateTimeRange(dt, max(self.__maximum, dt))
+
+    def setMaximumDateTime(self, dt: datetime):
+        """Sets the maximum datetime, the minimum datetime is lowered to it if necessary.
+
+        Args:
+            dt (datetime): Maximum datetime.
+
+        """
+        self.setDateTimeRange(min(self.__minimum, dt), dt)
+
+    def clearMinimumDateTime(self):
+        """Resets the minimum datetime to 1752-09-14 00:00:00.000."""
+        self.setMinimumDateTime(_MINIMUM_DATETIME)
+
+    def clearMaximumDateTime(self):
+        """Resets the maximum datetime to 9999-12-31 23:59:59.999."""
+        self.setMaximumDateTime(_MAXIMUM_DATETIME)
+
+    def minimumDate(self) -> date:
+        """Gets the date of the minimum datetime.
+
+        Returns:
+            date: Minimum date.
+
+        """
+        return self.__minimum.date()
+
+    def maximumDate(self) -> date:
+        """Gets the date of the maximum datetime.
+
+        Returns:
+            date: Maximum date.
+
+        """
+        return self.__maximum.date()
+
+    def minimumTime(self) -> time:
+        """Gets the time of the minimum datetime.
+
+        Returns:
+            time: Minimum time.
+
+        """
+        return self.__minimum.time()
+
+    def maximumTime(self) -> time:
+        """Gets the time of the maximum datetime.
+
+        Returns:
+            time: Maximum time.
+
+        """
+        return self.__maximum.time()
+
+    def setMinimumDate(self, d: date):
+        """Sets the date of the minimum datetime.
+
+        Args:
+            d (date): Minimum date.
+
+        """
+        self.setMinimumDateTime(datetime.combine(d, self.__minimum.time()))
+
+    def setMaximumDate(self, d: date):
+        """Sets the date of the maximum datetime.
+
+        Args:
+            d (date): Maximum date.
+
+        """
+        self.setMaximumDateTime(datetime.combine(d, self.__maximum.time()))
+
+    def setMinimumTime(self, t: time):
+        """Sets the time of the minimum datetime.
+
+        Args:
+            t (time): Minimum time.
+
+        """
+        self.setMinimumDateTime(datetime.combine(self.__minimum.date(), t))
+
+    def setMaximumTime(self, t: time):
+        """Sets the time of the maximum datetime.
+
+        Args:
+            t (time): Maximum time.
+
+        """
+        self.setMaximumDateTime(datetime.combine(self.__maximum.date(), t))
+
+    def clearMinimumDate(self):
+        """Resets the date of the minimum datetime to 1752-09-14."""
+        self.setMinimumDate(_MINIMUM_DATETIME.date())
+
+    def clearMaximumDate(self):
+        """Resets the date of the maximum datetime to 9999-12-31."""
+        self.setMaximumDate(_MAXIMUM_DATETIME.date())
+
+    def clearMinimumTime(self):
+        """Resets the time of the minimum datetime to 00:00:00.000."""
+        self.setMinimumTime(_MINIMUM_DATETIME.time())
+
+    def clearMaximumTime(self):
+        """Resets the time of the maximum datetime to 23:59:59.999."""
+        self.setMaximumTime(_MAXIMUM_DATETIME.time())
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""The module contains the implementation of the item delegate for nullable date/time values in item views."""
+
+__all__ = ["ClearableDateTimeDelegate"]
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from PySide2.QtCore import (
+    QAbstractItemModel,
+    QDate,
+    QDateTime,
+    QLocale,
+    QModelIndex,
+    Qt,
+    QTime,
+)
+from PySide2.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QWidget
+from shiboken2 import isValid
+
+from ClearableDateTimeEdit.popup.Helpers import helperClass
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.TimeZones import TimeZone, timeZone
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class ClearableDateTimeDelegate(QStyledItemDelegate):
+    """ClearableDateTimeDelegate paints date, datetime or time values of item views in the display format of the
+    ClearableDateTimeEdit and edits them with a ClearableDateTimeEdit.
+
+    Notes:
+        Cells are painted without any widget, empty or invalid values are painted as empty cells. Editors are kept in
+        a small pool after they have been closed and are recycled by createEditor, so the editing cost does not depend
+        on the number of rows.
+
+    """
+
+    def __init__(self, parent=None, mode: Mode = Mode.datetime):
+        super(ClearableDateTimeDelegate, self).__init__(parent)
+        self.__mode = mode
+        self.__format = helperClass(self.__mode).defaultFormat
+        self.__displayTimeZone: Optional[TimeZone] = None
+        self.__editorPoolSize = 4
+        self.__editors: List[ClearableDateTimeEdit] = []
+
+    def mode(self) -> Mode:
+        """Gets the mode of the editors as enum "Mode".
+
+        Returns:
+            Mode: Mode of the editors.
+
+        """
+        return self.__mode
+
+    def setMode(self, mode: Mode):
+        """Sets the mode of the editors and resets the display format to the default format of the mode.
+
+        Args:
+            mode (Mode): Mode as enum "Mode".
+
+        """
+        self.__mode = mode
+        self.__format = helperClass(self.__mode).defaultFormat
+
+    def displayFormat(self) -> str:
+        """Gets the display format of cells and editors.
+
+        Returns:
+            String: Display format.
+
+        """
+        return self.__format
+
+    def setDisplayFormat(self, format: str):
+        """Sets the display format of cells and editors.
+
+        Args:
+            format (str): New display format.
+
+        """
+        self.__format = format
+
+    def displayTimeZone(self) -> Optional[str]:
+        """Gets the IANA key of the time zone in which datetimes are displayed and edited.
+
+        Returns:
+            Optional[str]: IANA key or None if the datetimes are displayed in their time specification.
+
+        """
+        return self.__displayTimeZone.key() if self.__displayTimeZone is not None else None
+
+    def setDisplayTimeZone(self, key: Optional[str]):
+        """Sets the time zone in which datetimes are displayed and edited in datetime mode, the editors write UTC
+        datetimes into the model. The conversions look up the cached transitions of the zone, see TimeZones.
+
+        Args:
+            key (Optional[str]): IANA key, e.g. "Europe/Berlin", None to display the datetimes in their time
+                specification.
+
+        Raises:
+            zoneinfo.ZoneInfoNotFoundError if the zone is not known.
+
+        """
+        self.__displayTimeZone = timeZone(key) if key is not None else None
+
+    def editorPoolSize(self) -> int:
+        """Gets the maximum number of closed editors kept for recycling.
+
+        Returns:
+            int: Maximum number of pooled editors.
+
+        """
+        return self.__editorPoolSize
+
+    def setEditorPoolSize(self, size: int):
+        """Sets the maximum number of closed editors kept for recycling.
+
+        Args:
+            size (int): Maximum number of pooled editors.
+
+        """
+        self.__editorPoolSize = size
+        while len(self.__editors) > self.__editorPoolSize:
+            self.__editors.pop().deleteLater()
+
+    def displayText(self, value, locale: QLocale) -> str:
+        """Converts given model value into the text painted in the cell.
+
+        Args:
+            value: Value of the model, QDateTime, QDate, QTime or None.
+            locale (QLocale): Locale of the view.
+
+        Returns:
+            str: Value in display format or an empty string for empty values.
+
+        """
+        if value is None:
+            return ""
+        zone = self.__displayTimeZone if self.__mode == Mode.datetime else None
+        if zone is not None and isinstance(value, QDateTime) and value.isValid():
+            utc = value if value.timeSpec() == Qt.UTC else value.toUTC()
+            # Only the offset is looked up, the wall time is computed by Qt without converting the value to Python.
+            offset = zone.utcOffset(_EPOCH + timedelta(milliseconds=utc.toMSecsSinceEpoch()))
+            value = utc.addSecs(int(offset.total_seconds()))
+        if isinstance(value, (QDateTime, QDate, QTime)):
+            return value.toString(self.__format) if value.isValid() else ""
+        return super(ClearableDateTimeDelegate, self).displayText(value, locale)
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        """Creates an editor or takes a recycled one from the pool of closed editors.
+
+        Args:
+            parent (QWidget): Parent of the editor.
+            option (QStyleOptionViewItem): Style options of the cell.
+            index (QModelIndex): Index of the edited cell.
+
+        Returns:
+            QWidget: ClearableDateTimeEdit as editor.
+
+        """
+        editor = None
+        while self.__editors and editor is None:
+            editor = self.__editors.pop()
+            if not isValid(editor):
+                editor = None
+        if editor is None:
+            editor = ClearableDateTimeEdit(parent, self.__mode)
+            editor.setPopupShared(True)
+        else:
+            if editor.parentWidget() is not parent:
+                editor.setParent(parent)
+            if editor.mode() != self.__mode:
+                editor.setMode(self.__mode)
+        if editor.displayFormat() != self.__format:
+            editor.setDisplayFormat(self.__format)
+        if editor.displayTimeZone() != self.displayTimeZone():
+            editor.setDisplayTimeZone(self.displayTimeZone())
+        editor.setFrame(False)
+        return editor
+
+    def destroyEditor(self, editor: QWidget, index: QModelIndex):
+        """Puts the closed editor into the pool of editors or destroys it if the pool is full.
+
+        Args:
+            editor (QWidget): Closed editor.
+            index (QModelIndex): Index of the edited cell.
+
+        """
+        if isinstance(editor, ClearableDateTimeEdit) and len(self.__editors) < self.__editorPoolSize:
+            editor.hide()
+            editor.clear()
+            self.__editors.append(editor)
+        else:
+            super(ClearableDateTimeDelegate, self).destroyEditor(editor, index)
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex):
+        """Loads the value of given index into the editor.
+
+        Args:
+            editor (QWidget): ClearableDateTimeEdit.
+            index (QModelIndex): Index of the edited cell.
+
+        """
+        value = index.data(Qt.EditRole)
+        if isinstance(value, QDateTime) and value.isValid():
+            editor.setDateTime(value)
+        elif isinstance(value, QDate) and value.isValid():
+            editor.setDate(value)
+        elif isinstance(value, QTime) and value.isValid():
+            editor.setTime(value)
+        else:
+            editor.clear()
+
+    def setModelData(self, editor: QWidget, model: QAbstractItemModel, index: QModelIndex):
+        """Writes the value of the editor into the model, None if the editor has been cleared.
+
+        Args:
+            editor (QWidget): ClearableDateTimeEdit.
+            model (QAbstractItemModel): Model of the view.
+            index (QModelIndex): Index of the edited cell.
+
+        """
+        editor.interpretText()
+        mode_value_map = {
+            Mode.time.value: editor.time,
+            Mode.date.value: editor.date,
+            Mode.datetime.value: editor.dateTime,
+        }
+        model.setData(index, mode_value_map.get(editor.mode().value, editor.dateTime)(), Qt.EditRole)
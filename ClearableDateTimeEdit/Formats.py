@@ -0,0 +1,635 @@
+# -*- coding: utf-8 -*-
+"""This module contains the engine converting datetimes to and from text in Qt display formats.
+
+The engine does not depend on Qt, so it can be used without a QApplication.
+"""
+__all__ = [
+    "DAY_NAMES",
+    "MAXIMUM",
+    "MONTH_NAMES",
+    "DateTimeFormat",
+    "ParseCache",
+    "Section",
+    "compileFormat",
+    "parseCache",
+]
+import re
+import threading
+from calendar import monthrange
+from collections import OrderedDict
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# English names of the days and months, which are used by the display formats like in Qt.
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_DEFAULT_DATETIME = datetime(1900, 1, 1)
+# Maximum values of the datetime parts.
+MAXIMUM = {
+    "year": 9999,
+    "year2": 99,
+    "month": 12,
+    "day": 31,
+    "weekday": 6,
+    "hour": 23,
+    "hour12": 12,
+    "minute": 59,
+    "second": 59,
+    "msec": 999,
+    "pm": 1,
+}
+# Variable width numbers take a second digit only if the value stays in range, like in Qt.
+_NUMBER_PATTERNS = {
+    "day": r"[0-2]\d|3[01]|\d",
+    "month": r"0\d|1[0-2]|\d",
+    "hour12": r"0\d|1[0-2]|\d",
+    "hour24": r"[01]\d|2[0-3]|\d",
+    "minute": r"[0-5]\d|\d",
+    "second": r"[0-5]\d|\d",
+}
+# Datetime attributes kept by DateTimeFormat.fit for the sections of the display format.
+_FIT_PARTS = {
+    "day": "day",
+    "month": "month",
+    "monthName": "month",
+    "year": "year",
+    "hour12": "hour",
+    "hour24": "hour",
+    "minute": "minute",
+    "second": "second",
+    "msec": "microsecond",
+}
+
+
+class Section(NamedTuple):
+    """Section of a display format.
+
+    Notes:
+        kind is one of "literal", "day", "dayName", "month", "monthName", "year", "hour12", "hour24", "minute",
+        "second", "msec", "amPm" or "timeZone". For literals, text is the literal text, for "amPm" it is "AP" or "ap"
+        depending on the case of the output.
+
+    """
+
+    kind: str
+    count: int
+    text: str = ""
+
+
+def _tokenize(fmt: str) -> List[Section]:
+    """Splits a Qt display format into sections like QDateTime.toString does.
+
+    Args:
+        fmt (str): Qt display format, e.g. "dd.MM.yyyy HH:mm:ss".
+
+    Returns:
+        List[Section]: Sections of the format.
+
+    """
+    sections = []
+    literal = []
+
+    def add(section: Section):
+        if literal:
+            sections.append(Section("literal", 0, "".join(literal)))
+            literal.clear()
+        sections.append(section)
+
+    i = 0
+    n = len(fmt)
+    while i < n:
+        char = fmt[i]
+        if char == "'":
+            if i + 1 < n and fmt[i + 1] == "'":
+                literal.append("'")
+                i += 2
+                continue
+            i += 1
+            while i < n:
+                if fmt[i] == "'":
+                    if i + 1 < n and fmt[i + 1] == "'":
+                        literal.append("'")
+                        i += 2
+                        continue
+                    break
+                literal.append(fmt[i])
+                i += 1
+            i += 1
+            continue
+        repeat = 1
+        while i + repeat < n and fmt[i + repeat] == char:
+            repeat += 1
+        if char in "dM":
+            count = min(repeat, 4)
+            kind = {"d": ("day", "dayName"), "M": ("month", "monthName")}[char][count > 2]
+            add(Section(kind, count))
+        elif char in "hHms":
+            count = min(repeat, 2)
+            add(Section({"h": "hour12", "H": "hour24", "m": "minute", "s": "second"}[char], count))
+        elif char == "y" and repeat >= 2:
+            count = 4 if repeat >= 4 else 2
+            add(Section("year", count))
+        elif char == "z":
+            count = 3 if repeat >= 3 else 1
+            add(Section("msec", count))
+        elif char in "aA":
+            count = 2 if i + 1 < n and fmt[i + 1] in "pP" else 1
+            add(Section("amPm", count, "AP" if char == "A" else "ap"))
+        elif char == "t":
+            count = 1
+            add(Section("timeZone", count))
+        else:
+            count = 1
+            literal.append(char)
+        i += count
+    if literal:
+        sections.append(Section("literal", 0, "".join(literal)))
+    if not any(section.kind == "amPm" for section in sections):
+        sections = [Section("hour24", s.count) if s.kind == "hour12" else s for s in sections]
+    return sections
+
+
+class ParseCache:
+    """This class contains a size-bounded cache of parse results which discards the least recently used results.
+
+    Notes:
+        Keys contain the display format and the text, so changing the display format never returns stale results.
+        Parsing does not depend on the time specification, it is applied after parsing.
+
+    """
+
+    def __init__(self, maxSize: int = 4096):
+        self.__maxSize = maxSize
+        self.__enabled = True
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def isEnabled(self) -> bool:
+        """Gets whether parse results are cached.
+
+        Returns:
+            bool: True if the cache is enabled, False otherwise.
+
+        """
+        return self.__enabled
+
+    def setEnabled(self, enable: bool):
+        """Enables or disables the cache, cached results are discarded when the cache is disabled.
+
+        Args:
+            enable (bool): Flag to enable the cache.
+
+        """
+        self.__enabled = enable
+        if not enable:
+            self.clear()
+
+    def maxSize(self) -> int:
+        """Gets the maximum number of cached results.
+
+        Returns:
+            int: Maximum number of cached results.
+
+        """
+        return self.__maxSize
+
+    def setMaxSize(self, maxSize: int):
+        """Sets the maximum number of cached results and discards the least recently used results above it.
+
+        Args:
+            maxSize (int): Maximum number of cached results.
+
+        """
+        with self.__lock:
+            self.__maxSize = maxSize
+            self.__evict()
+
+    def clear(self):
+        """Discards all cached results."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Gets the counters of the cache.
+
+        Returns:
+            Dict[str, int]: Number of hits, misses, evictions, current size and maximum size.
+
+        """
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "size": len(self.__entries),
+            "maxSize": self.__maxSize,
+        }
+
+    def resetStats(self):
+        """Resets the hit, miss and eviction counters."""
+        self.__hits = self.__misses = self.__evictions = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Looks up the result stored for given key.
+
+        Args:
+            key (Hashable): Key of the result.
+
+        Returns:
+            Tuple[bool, Any]: True and the result if it has been found, False and None otherwise.
+
+        """
+        if not self.__enabled:
+            return False, None
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+            except KeyError:
+                self.__misses += 1
+                return False, None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return True, value
+
+    def insert(self, key: Hashable, value: Any):
+        """Stores given result.
+
+        Args:
+            key (Hashable): Key of the result.
+            value (Any): Result.
+
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            self.__entries[key] = value
+            self.__evict()
+
+    def __evict(self):
+        """Discards the least recently used results above the maximum size."""
+        while len(self.__entries) > max(self.__maxSize, 0):
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+
+_parseCache = ParseCache()
+
+
+def parseCache() -> ParseCache:
+    """Gets the process-wide cache of parse results used by all compiled display formats.
+
+    Returns:
+        ParseCache: Process-wide parse cache.
+
+    """
+    return _parseCache
+
+
+class DateTimeFormat:
+    """This class contains a Qt display format compiled into a parser and a formatter.
+
+    Notes:
+        The results are the same as the ones of QDateTime.fromString and QDateTime.toString for the format. Day and
+        month names are the English ones, as used by Qt with the C locale. Time zone sections are ignored while
+        parsing.
+
+    """
+
+    def __init__(self, fmt: str):
+        self.__format = fmt
+        self.__sections = _tokenize(fmt)
+        self.__fields = [section for section in self.__sections if section.kind != "literal"]
+        self.__parts = {_FIT_PARTS[s.kind] for s in self.__fields if s.kind in _FIT_PARTS}
+        self.__regex = re.compile(self.__pattern())
+        self.__formatters = [self.__formatter(section) for section in self.__sections]
+
+    @property
+    def format(self) -> str:
+        """Gets the display format.
+
+        Returns:
+             str: Display format.
+
+        """
+        return self.__format
+
+    @property
+    def sections(self) -> List[Section]:
+        """Gets the sections of the display format.
+
+        Returns:
+             List[Section]: Sections of the display format.
+
+        """
+        return list(self.__sections)
+
+    @property
+    def hasDate(self) -> bool:
+        """Gets whether the display format contains a date section.
+
+        Returns:
+             bool: True if day, month or year is displayed, False otherwise.
+
+        """
+        return any(s.kind in ("day", "dayName", "month", "monthName", "year") for s in self.__fields)
+
+    @property
+    def hasTime(self) -> bool:
+        """Gets whether the display format contains a time section.
+
+        Returns:
+             bool: True if hour, minute, second or millisecond is displayed, False otherwise.
+
+        """
+        return any(s.kind in ("hour12", "hour24", "minute", "second", "msec") for s in self.__fields)
+
+    def fit(self, dt: datetime, default: datetime) -> Optional[datetime]:
+        """Keeps the parts of given datetime shown in the display format and takes the other parts from the default.
+
+        Notes:
+            The result is the datetime that is committed for the text of the datetime, without formatting and parsing
+            the text. Day names and AM/PM alone do not keep the day or hour.
+
+        Args:
+            dt (datetime): Datetime.
+            default (datetime): Datetime whose parts are used for the parts missing in the display format.
+
+        Returns:
+            Optional[datetime]: Datetime restricted to the display format or None if the parts do not form a valid
+                datetime, e.g. day 31 shown without the month of a default in February.
+
+        """
+        parts = {part: getattr(dt, part) for part in self.__parts}
+        if "microsecond" in parts:
+            parts["microsecond"] = parts["microsecond"] // 1000 * 1000
+        try:
+            return default.replace(**parts)
+        except ValueError:
+            return None
+
+    def __pattern(self) -> str:
+        """Builds the regular expression matching the display format.
+
+        Notes:
+            Variable width sections are matched atomically via a lookahead and a back reference, so like Qt the parser
+            takes as many characters as possible and does not backtrack into a section.
+
+        Returns:
+            str: Regular expression with one group per section which is not a literal.
+
+        """
+        parts = []
+        group = 0
+        for section in self.__sections:
+            if section.kind == "literal":
+                parts.append(re.escape(section.text))
+                continue
+            if section.kind in _NUMBER_PATTERNS:
+                atom = r"\d{2}" if section.count == 2 else _NUMBER_PATTERNS[section.kind]
+            elif section.kind == "year":
+                atom = r"\d{%d}" % section.count
+            elif section.kind == "msec":
+                atom = r"\d{3}" if section.count == 3 else r"\d{1,3}"
+            elif section.kind in ("dayName", "monthName"):
+                names = DAY_NAMES if section.kind == "dayName" else MONTH_NAMES
+                names = names if section.count == 4 else [name[:3] for name in names]
+                atom = "(?i:%s)" % "|".join(sorted(names, key=len, reverse=True))
+            elif section.kind == "amPm":
+                atom = "(?i:am|pm)"
+            else:
+                atom = r"[A-Za-z0-9+:\-]*"
+            group += 1
+            parts.append(r"(?=(%s))\%d" % (atom, group))
+        return "".join(parts)
+
+    @staticmethod
+    def __formatter(section: Section) -> Callable[[datetime], str]:
+        """Gets the function formatting given section of a datetime.
+
+        Args:
+            section (Section): Section of the display format.
+
+        Returns:
+            Callable[[datetime], str]: Function returning the text of the section.
+
+        """
+        kind = section.kind
+        pad = "%02d" if section.count == 2 else "%d"
+        if kind == "literal":
+            return lambda dt, text=section.text: text
+        if kind == "day":
+            return lambda dt: pad % dt.day
+        if kind == "dayName":
+            return lambda dt: DAY_NAMES[dt.weekday()][: 3 if section.count == 3 else None]
+        if kind == "month":
+            return lambda dt: pad % dt.month
+        if kind == "monthName":
+            return lambda dt: MONTH_NAMES[dt.month - 1][: 3 if section.count == 3 else None]
+        if kind == "year":
+            return (lambda dt: "%04d" % dt.year) if section.count == 4 else (lambda dt: "%02d" % (dt.year % 100))
+        if kind == "hour24":
+            return lambda dt: pad % dt.hour
+        if kind == "hour12":
+            return lambda dt: pad % ((dt.hour + 11) % 12 + 1)
+        if kind == "minute":
+            return lambda dt: pad % dt.minute
+        if kind == "second":
+            return lambda dt: pad % dt.second
+        if kind == "msec":
+            if section.count == 3:
+                return lambda dt: "%03d" % (dt.microsecond // 1000)
+            return lambda dt: ("%03d" % (dt.microsecond // 1000)).rstrip("0") or "0"
+        if kind == "amPm":
+            upper = section.text == "AP"
+            return lambda dt: ("PM" if dt.hour >= 12 else "AM") if upper else ("pm" if dt.hour >= 12 else "am")
+        return lambda dt: dt.astimezone().tzname() or ""
+
+    def toText(self, value: Union[datetime, date, time]) -> str:
+        """Converts given datetime, date or time into text.
+
+        Args:
+            value (Union[datetime, date, time]): Datetime, date or time. Missing parts are taken from 1900-01-01
+                00:00:00.000.
+
+        Returns:
+            str: Value in display format.
+
+        """
+        if not isinstance(value, datetime):
+            if isinstance(value, date):
+                value = datetime(value.year, value.month, value.day)
+            else:
+                value = datetime.combine(_DEFAULT_DATETIME.date(), value)
+        return "".join([formatter(value) for formatter in self.__formatters])
+
+    def fromText(self, text: str, default: Optional[datetime] = None) -> Optional[datetime]:
+        """Converts given text into datetime.
+
+        Args:
+            text (str): Text in display format.
+            default (Optional[datetime], optional): Datetime whose parts are used for the sections missing in the
+                display format. Defaults to 1900-01-01 00:00:00.000 like QDateTime.fromString.
+
+        Returns:
+            Optional[datetime]: Datetime or None if the text does not match the display format or is no valid datetime.
+
+        """
+        known = self.parseSections(text)
+        if known is None:
+            return None
+        return self.fromSections(known, default)
+
+    @staticmethod
+    def fromSections(known: Dict[str, int], default: Optional[datetime] = None) -> Optional[datetime]:
+        """Combines the values of the datetime parts displayed in the format into datetime.
+
+        Args:
+            known (Dict[str, int]): Values by datetime part, as returned by parseSections.
+            default (Optional[datetime], optional): Datetime whose parts are used for the sections missing in the
+                display format. Defaults to 1900-01-01 00:00:00.000 like QDateTime.fromString.
+
+        Returns:
+            Optional[datetime]: Datetime or None if the values do not form a valid datetime.
+
+        """
+        default = default or _DEFAULT_DATETIME
+        year = known.get("year", default.year)
+        if "year2" in known:
+            if "year" not in known:
+                year = 1900 + known["year2"]
+            elif year % 100 != known["year2"]:
+                return None
+        hour = known.get("hour", default.hour)
+        if "hour12" in known:
+            hour12 = known["hour12"] % 12 + (12 if known.get("pm") else 0)
+            if "hour" in known and hour != hour12:
+                return None
+            hour = hour12
+        elif "pm" in known and "hour" in known and (hour >= 12) != known["pm"]:
+            return None
+        elif "pm" in known:
+            hour = hour % 12 + (12 if known["pm"] else 0)
+        try:
+            result = datetime(
+                year,
+                known.get("month", default.month),
+                known.get("day", default.day),
+                hour,
+                known.get("minute", default.minute),
+                known.get("second", default.second),
+                known.get("msec", default.microsecond // 1000) * 1000,
+            )
+        except ValueError:
+            return None
+        if "weekday" in known and result.weekday() != known["weekday"]:
+            if "day" in known:
+                return None
+            # Like Qt, the day of week moves the day to the nearest matching day in the same month.
+            day = result.day + known["weekday"] - result.weekday()
+            if day <= 0:
+                day += 7
+            elif day > monthrange(result.year, result.month)[1]:
+                day -= 7
+            result = result.replace(day=day)
+        return result
+
+    def parseSections(self, text: str) -> Optional[Dict[str, int]]:
+        """Splits given text into the values of the datetime parts displayed in the format.
+
+        Notes:
+            Results are stored in the process-wide parse cache, see parseCache(). The returned dictionary is shared
+            with the cache and must not be changed.
+
+        Args:
+            text (str): Text in display format.
+
+        Returns:
+            Optional[Dict[str, int]]: Values by datetime part or None if the text does not match the display format.
+
+        """
+        cache = _parseCache
+        key = (self.__format, text)
+        found, known = cache.lookup(key)
+        if found:
+            return known
+        match = self.__regex.fullmatch(text)
+        if match is not None:
+            known = {}
+            for section, value in zip(self.__fields, match.groups()):
+                part, number = self.sectionValue(section, value)
+                if part is None:
+                    continue
+                if number > MAXIMUM[part] or known.setdefault(part, number) != number:
+                    known = None
+                    break
+        cache.insert(key, known)
+        return known
+
+    @staticmethod
+    def sectionValue(section: Section, text: str) -> Tuple[Optional[str], int]:
+        """Converts the text matched by given section into a number.
+
+        Args:
+            section (Section): Section of the display format.
+            text (str): Text matched by the section.
+
+        Returns:
+            Tuple[Optional[str], int]: Key of the datetime part and its value, the key is None for ignored sections.
+
+        """
+        kind = section.kind
+        if kind in ("day", "month", "minute", "second", "hour12"):
+            return kind, int(text)
+        if kind == "hour24":
+            return "hour", int(text)
+        if kind == "year":
+            return ("year", int(text)) if section.count == 4 else ("year2", int(text))
+        if kind == "msec":
+            return "msec", int(text) if section.count == 3 else int(text.ljust(3, "0"))
+        if kind == "dayName":
+            return "weekday", [name[: len(text)].lower() for name in DAY_NAMES].index(text.lower())
+        if kind == "monthName":
+            return "month", [name[: len(text)].lower() for name in MONTH_NAMES].index(text.lower()) + 1
+        if kind == "amPm":
+            return "pm", int(text.lower() == "pm")
+        return None, 0
+
+
+@lru_cache(maxsize=64)
+def compileFormat(fmt: str) -> DateTimeFormat:
+    """Compiles given Qt display format, formats already compiled are shared.
+
+    Args:
+        fmt (str): Qt display format, e.g. "dd.MM.yyyy HH:mm:ss".
+
+    Returns:
+        DateTimeFormat: Compiled display format.
+
+    """
+    return DateTimeFormat(fmt)
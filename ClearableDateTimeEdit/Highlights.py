@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""This module contains the index of the highlighted dates of the calendar pop-ups, e.g. holidays or booked days.
+
+The index is built once from dates and date intervals per category and looked up with one dictionary access per
+calendar cell. It is immutable, so one index can be shared by many DateTimeEdits and replacing all highlighted dates is
+a single assignment. The module does not depend on Qt:
+
+>>> from datetime import date
+>>> from ClearableDateTimeEdit.Highlights import DateCategoryIndex
+>>> index = DateCategoryIndex({"holiday": [date(2022, 12, 25)], "booked": [(date(2022, 12, 24), date(2022, 12, 31))]})
+>>> index.category(date(2022, 12, 25)), index.category(date(2022, 12, 26))
+('holiday', 'booked')
+"""
+__all__ = ["DateCategoryIndex"]
+from typing import Dict, Hashable, Iterable, Mapping, Optional, Tuple
+
+# Julian day of date.min.toordinal() - 1, converts the Julian days of QDate to ordinals of datetime.date.
+_JULIAN_DAY_OFFSET = 1721425
+
+
+def _ordinal(day) -> int:
+    """Gets the proleptic Gregorian ordinal of given date.
+
+    Args:
+        day (date or QDate): Date.
+
+    Raises:
+        TypeError if given value is neither date nor QDate.
+
+    Returns:
+        int: Ordinal, 1 for 1 January of year 1.
+
+    """
+    if hasattr(day, "toordinal"):
+        return day.toordinal()
+    if hasattr(day, "toJulianDay"):
+        return day.toJulianDay() - _JULIAN_DAY_OFFSET
+    day_type = str(type(day)).split("'")[1]
+    raise TypeError(
+        f"""'DateCategoryIndex' called with wrong date types:\n\t
+        DateCategoryIndex({day_type})\n\t\t
+        Supported types:\n\t
+        datetime.date, PySide2.QtCore.QDate or a tuple of both as interval"""
+    )
+
+
+class DateCategoryIndex(object):
+    """DateCategoryIndex maps dates to categories with constant lookup time.
+
+    Notes:
+        Intervals are given as (first, last) tuples including both dates and are expanded when the index is built, so
+        the memory grows with the number of highlighted days, not with the number of lookups. A date listed for several
+        categories belongs to the first of them.
+
+    """
+
+    def __init__(self, categories: Optional[Mapping[Hashable, Iterable]] = None):
+        """Builds the index.
+
+        Args:
+            categories (Optional[Mapping[Hashable, Iterable]], optional): Dates, QDates and (first, last) intervals of
+                both by category.
+
+        Raises:
+            TypeError if a date is neither date nor QDate.
+            ValueError if the first date of an interval is after the last one.
+
+        """
+        super(DateCategoryIndex, self).__init__()
+        categories = dict(categories or {})
+        days: Dict[int, Hashable] = {}
+        # Later categories are overwritten by earlier ones.
+        for category, entries in reversed(list(categories.items())):
+            category_days = {}
+            for entry in entries:
+                if isinstance(entry, tuple):
+                    first, last = (_ordinal(day) for day in entry)
+                    if first > last:
+                        raise ValueError(f"Interval {entry} of category {category!r} ends before it starts")
+                    category_days.update(dict.fromkeys(range(first, last + 1), category))
+                else:
+                    category_days[_ordinal(entry)] = category
+            days.update(category_days)
+        self.__days = days
+        self.__categories: Tuple[Hashable, ...] = tuple(categories)
+
+    def __len__(self) -> int:
+        return len(self.__days)
+
+    def categories(self) -> Tuple[Hashable, ...]:
+        """Gets the categories in the order of their precedence.
+
+        Returns:
+            Tuple[Hashable, ...]: Categories.
+
+        """
+        return self.__categories
+
+    def category(self, day) -> Optional[Hashable]:
+        """Gets the category of given date.
+
+        Args:
+            day (date or QDate): Date.
+
+        Raises:
+            TypeError if given value is neither date nor QDate.
+
+        Returns:
+            Optional[Hashable]: Category or None if the date is not highlighted.
+
+        """
+        return self.__days.get(_ordinal(day))
+
+    def categoryAt(self, ordinal: int) -> Optional[Hashable]:
+        """Gets the category of the date with given ordinal, used for painting the calendar cells.
+
+        Args:
+            ordinal (int): Proleptic Gregorian ordinal of the date.
+
+        Returns:
+            Optional[Hashable]: Category or None if the date is not highlighted.
+
+        """
+        return self.__days.get(ordinal)
+
+    @staticmethod
+    def ordinalOfJulianDay(julianDay: int) -> int:
+        """Converts the Julian day of a QDate to the ordinal of the date.
+
+        Args:
+            julianDay (int): Julian day, e.g. of QDate.toJulianDay.
+
+        Returns:
+            int: Proleptic Gregorian ordinal.
+
+        """
+        return julianDay - _JULIAN_DAY_OFFSET
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""This module contains the icons of the DateTimeEdit modes and their process-wide cache.
+
+The SVG files are package resources read with importlib.resources, so they are found independently of the working
+directory, the operating system and zipped installations.
+"""
+__all__ = ["ICON_FILES", "clearIconCache", "icon", "iconData", "iconPath"]
+from functools import lru_cache
+from importlib import resources
+from typing import Dict, Optional, Tuple
+
+from PySide2.QtCore import QByteArray, QSize, Qt
+from PySide2.QtGui import QGuiApplication, QIcon, QPainter, QPixmap
+from PySide2.QtSvg import QSvgRenderer
+
+from ClearableDateTimeEdit.Settings import Mode
+
+ICON_FILES = {
+    Mode.date: "datepicker-widget-icons_calendar.svg",
+    Mode.datetime: "datepicker-widget-icons_calendar+clock.svg",
+    Mode.time: "datepicker-widget-icons_clock.svg",
+}
+_ICON_PACKAGE = "ClearableDateTimeEdit"
+_ICON_DIRECTORY = ("resources", "icon")
+_icons: Dict[Tuple[str, float, int, int], QIcon] = {}
+
+
+def _iconResource(mode: Mode):
+    """Gets the package resource of the SVG file of the icon for given mode.
+
+    Args:
+        mode (Mode): Mode of DateTimeEdit.
+
+    Returns:
+        Traversable of the SVG file.
+
+    """
+    traversable = resources.files(_ICON_PACKAGE)
+    for name in _ICON_DIRECTORY + (ICON_FILES[mode],):
+        traversable = traversable.joinpath(name)
+    return traversable
+
+
+def iconPath(mode: Mode) -> str:
+    """Gets the path of the SVG file of the icon for given mode.
+
+    Args:
+        mode (Mode): Mode of DateTimeEdit.
+
+    Returns:
+        str: Path of the SVG file.
+
+    """
+    return str(_iconResource(mode))
+
+
+@lru_cache(maxsize=None)
+def iconData(mode: Mode) -> bytes:
+    """Reads the SVG data of the icon for given mode once per process.
+
+    Args:
+        mode (Mode): Mode of DateTimeEdit.
+
+    Returns:
+        bytes: SVG data.
+
+    """
+    return _iconResource(mode).read_bytes()
+
+
+def icon(mode: Mode, size: QSize = QSize(16, 16), devicePixelRatio: Optional[float] = None) -> QIcon:
+    """Gets the icon for given mode, the SVG is parsed and rasterized once per mode, size and device pixel ratio.
+
+    Args:
+        mode (Mode): Mode of DateTimeEdit.
+        size (QSize, optional): Size of the icon in device independent pixels.
+        devicePixelRatio (Optional[float], optional): Device pixel ratio of the screen, the ratio of the application
+            is used if not given.
+
+    Returns:
+        QIcon: Icon shared by all DateTimeEdits.
+
+    """
+    if devicePixelRatio is None:
+        devicePixelRatio = QGuiApplication.instance().devicePixelRatio()
+    key = (mode.value, devicePixelRatio, size.width(), size.height())
+    cached_icon = _icons.get(key)
+    if cached_icon is None:
+        pixmap = QPixmap(size * devicePixelRatio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        QSvgRenderer(QByteArray(iconData(mode))).render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        cached_icon = QIcon(pixmap)
+        _icons[key] = cached_icon
+    return cached_icon
+
+
+def clearIconCache():
+    """Removes all rendered icons from the cache, e.g. after the icon files have been exchanged."""
+    _icons.clear()
+    iconData.cache_clear()
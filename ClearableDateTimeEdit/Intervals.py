@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""This module contains the index of disabled datetime intervals, e.g. closed periods or maintenance windows.
+
+The intervals are sorted and merged once when the index is built, so a datetime is checked with one binary search. The
+module does not depend on Qt:
+
+>>> from datetime import date, datetime
+>>> from ClearableDateTimeEdit.Intervals import IntervalIndex
+>>> holidays = (date(2022, 12, 24), date(2022, 12, 26))
+>>> index = IntervalIndex([holidays, (datetime(2023, 1, 2, 8), datetime(2023, 1, 2, 10))])
+>>> index.contains(datetime(2022, 12, 25, 12)), index.contains(datetime(2023, 1, 2, 11))
+(True, False)
+"""
+__all__ = ["IntervalIndex"]
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Tuple
+
+# Smallest step between two datetimes, intervals closer than it are merged.
+_RESOLUTION = timedelta(microseconds=1)
+
+
+def _bound(value, last: bool) -> datetime:
+    """Converts given bound of an interval into datetime.
+
+    Args:
+        value (date, datetime, QDate or QDateTime): Bound, dates stand for the whole day.
+        last (bool): True for the last bound of an interval, whose dates end at the end of the day.
+
+    Raises:
+        TypeError if given value is neither date nor datetime.
+
+    Returns:
+        datetime: Bound as datetime.
+
+    """
+    if hasattr(value, "toPython"):
+        value = value.toPython()
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time.max if last else time.min)
+    value_type = str(type(value)).split("'")[1]
+    raise TypeError(
+        f"""'IntervalIndex' called with wrong bound types:\n\t
+        IntervalIndex({value_type})\n\t\t
+        Supported types:\n\t
+        datetime.date, datetime.datetime, PySide2.QtCore.QDate or PySide2.QtCore.QDateTime"""
+    )
+
+
+class IntervalIndex(object):
+    """IntervalIndex contains disjoint, sorted datetime intervals with logarithmic lookup time.
+
+    Notes:
+        Intervals are given as (first, last) tuples including both bounds. Dates stand for whole days, so (date(2022,
+        12, 24), date(2022, 12, 26)) disables three days. Overlapping and adjacent intervals are merged.
+
+    """
+
+    def __init__(self, intervals: Iterable[Tuple] = ()):
+        """Builds the index.
+
+        Args:
+            intervals (Iterable[Tuple], optional): (first, last) tuples of dates, datetimes, QDates or QDateTimes.
+
+        Raises:
+            TypeError if a bound is neither date nor datetime.
+            ValueError if an interval ends before it starts.
+
+        """
+        super(IntervalIndex, self).__init__()
+        bounds = []
+        for first, last in intervals:
+            bound = (_bound(first, False), _bound(last, True))
+            if bound[0] > bound[1]:
+                raise ValueError(f"Interval ({first}, {last}) ends before it starts")
+            bounds.append(bound)
+        bounds.sort()
+        self.__starts: List[datetime] = []
+        self.__ends: List[datetime] = []
+        for start, end in bounds:
+            if self.__ends and start <= self.__ends[-1] + _RESOLUTION:
+                if end > self.__ends[-1]:
+                    self.__ends[-1] = end
+            else:
+                self.__starts.append(start)
+                self.__ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.__starts)
+
+    def __iter__(self):
+        return zip(self.__starts, self.__ends)
+
+    def contains(self, dt: datetime) -> bool:
+        """Checks whether given datetime lies in an interval.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            bool: True if the datetime is disabled, False otherwise.
+
+        """
+        index = bisect_right(self.__starts, dt) - 1
+        return index >= 0 and dt <= self.__ends[index]
+
+    def covers(self, first: datetime, last: datetime) -> bool:
+        """Checks whether all datetimes from first to last lie in the intervals.
+
+        Args:
+            first (datetime): First datetime.
+            last (datetime): Last datetime.
+
+        Returns:
+            bool: True if the whole range is disabled, False otherwise.
+
+        """
+        index = bisect_right(self.__starts, first) - 1
+        return index >= 0 and last <= self.__ends[index]
+
+    def coversDate(self, day: date) -> bool:
+        """Checks whether the whole day lies in the intervals, used for painting the calendar cells.
+
+        Args:
+            day (date): Date.
+
+        Returns:
+            bool: True if the whole day is disabled, False otherwise.
+
+        """
+        return self.covers(datetime.combine(day, time.min), datetime.combine(day, time.max))
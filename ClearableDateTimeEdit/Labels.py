@@ -0,0 +1,530 @@
+# -*- coding: utf-8 -*-
+"""The module contains the implementation of the paint-only label for nullable date/time values."""
+
+__all__ = ["ClearableDateTimeLabel"]
+
+from datetime import datetime
+from typing import Optional
+
+from PySide2 import QtCore
+from PySide2.QtCore import QDate, QDateTime, QEvent, QObject, QRect, QSize, Qt, QTime
+from PySide2.QtGui import (
+    QIcon,
+    QKeyEvent,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPalette,
+    QResizeEvent,
+)
+from PySide2.QtWidgets import QWidget
+
+from ClearableDateTimeEdit import Icons
+from ClearableDateTimeEdit.Core import DateTimeController, ValueChange
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.Values import DateTimeValue
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+# Margin around the text and the icon.
+_MARGIN = 4
+_ICON_SIZE = QSize(16, 16)
+# Datetime with the widest digits of most fonts, used for the size hint.
+_SIZE_HINT_DATETIME = datetime(2000, 12, 28, 23, 58, 58, 888000)
+
+
+class ClearableDateTimeLabel(QWidget):
+    """ClearableDateTimeLabel paints a date, datetime or time value in the display format of the ClearableDateTimeEdit
+    and switches to a ClearableDateTimeEdit when it is clicked.
+
+    Notes:
+        The label has no child widgets, it paints the text of its value, or the placeholder text if it is empty, and
+        the icon of its mode. A ClearableDateTimeEdit with a shared pop-up is built on click, Enter, Space or F2 and
+        destroyed when it loses the focus or Escape is pressed, values committed in it are taken over at once.
+        valueChanged(old, new, changedParts) is sent like by the ClearableDateTimeEdit, also for changes made with the
+        setters. Read-only labels are not editable and do not take the focus.
+
+    """
+
+    valueChanged = QtCore.Signal(
+        (object, object, object), (QDateTime, QDateTime, int), (DateTimeValue, DateTimeValue, int)
+    )
+
+    def __init__(self, parent=None, mode: Mode = Mode.datetime):
+        super(ClearableDateTimeLabel, self).__init__(parent)
+        self.__mode = mode
+        self.__controller = DateTimeController(self.__mode)
+        self.__timeSpec = Qt.LocalTime
+        self.__placeholderText = ""
+        self.__readOnly = False
+        # The editor is built when the label is clicked and destroyed when editing is finished.
+        self.__editor: Optional[ClearableDateTimeEdit] = None
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setCursor(Qt.PointingHandCursor)
+
+    def mode(self) -> Mode:
+        """Gets the mode of the label as enum "Mode".
+
+        Returns:
+            Mode: Mode of the label.
+
+        """
+        return self.__mode
+
+    def setMode(self, mode: Mode):
+        """Sets mode of the label and resets the display format to the default format of the mode.
+
+        Args:
+            mode (Mode): Mode as enum "Mode".
+
+        Raises:
+            TypeError if the type of given mode is not Mode.
+
+        """
+        if not isinstance(mode, Mode):
+            mode_type = str(type(mode)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeLabel.setMode' called with wrong argument types:\n\t
+                DateTimeLabel.setMode({mode_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeLabel.setMode(Mode)"""
+            )
+        self.__closeEditor()
+        self.__mode = mode
+        self.__controller.setMode(self.__mode)
+        self.updateGeometry()
+        self.update()
+
+    def displayFormat(self) -> str:
+        """Gets current display format.
+
+        Returns:
+            str: Current display format.
+
+        """
+        return self.__controller.displayFormat()
+
+    def setDisplayFormat(self, format: str):
+        """Sets the display format, e.g. the display format of a ClearableDateTimeEdit.
+
+        Args:
+            format (str): New display format.
+
+        """
+        self.__controller.setDisplayFormat(format)
+        if self.__editor is not None:
+            self.__editor.setDisplayFormat(format)
+        self.updateGeometry()
+        self.update()
+
+    def placeholderText(self) -> str:
+        """Gets the text painted if the label is empty.
+
+        Returns:
+            str: Placeholder text.
+
+        """
+        return self.__placeholderText
+
+    def setPlaceholderText(self, text: str):
+        """Sets the text painted if the label is empty.
+
+        Args:
+            text (str): Placeholder text.
+
+        """
+        self.__placeholderText = text
+        self.update()
+
+    def isReadOnly(self) -> bool:
+        """Whether the label can not be edited.
+
+        Returns:
+            bool: True if the label is read-only, False otherwise.
+
+        """
+        return self.__readOnly
+
+    def setReadOnly(self, readOnly: bool):
+        """Sets whether the label can be edited, an open editor is closed.
+
+        Args:
+            readOnly (bool): True if the label is read-only, False otherwise.
+
+        """
+        self.__readOnly = readOnly
+        if self.__readOnly:
+            self.__closeEditor()
+        self.setFocusPolicy(Qt.NoFocus if self.__readOnly else Qt.StrongFocus)
+        self.setCursor(Qt.ArrowCursor if self.__readOnly else Qt.PointingHandCursor)
+
+    def timeSpec(self) -> Qt.TimeSpec:
+        """Returns the time specification of the datetime.
+
+        Returns:
+            Qt.TimeSpec: Time specification.
+
+        """
+        return self.__timeSpec
+
+    def setTimeSpec(self, spec: Qt.TimeSpec):
+        """Sets the time specification used in this datetime to spec.
+
+        Args:
+            spec (Qt.TimeSpec): New time specification.
+
+        """
+        self.__timeSpec = spec
+
+    def editor(self) -> Optional[ClearableDateTimeEdit]:
+        """Gets the editor while the label is edited.
+
+        Returns:
+            Optional[ClearableDateTimeEdit]: Open editor or None.
+
+        """
+        return self.__editor
+
+    def date(self) -> Optional[QDate]:
+        """Gets the date of the label or None if it is empty.
+
+        Returns:
+            Optional[QDate]: Date or None.
+
+        """
+        value = self.__controller.value()
+        return QDate(value.year, value.month, value.day) if value is not None else None
+
+    def dateTime(self) -> Optional[QDateTime]:
+        """Gets the datetime of the label or None if it is empty.
+
+        Returns:
+            Optional[QDateTime]: Datetime or None.
+
+        """
+        value = self.__controller.value()
+        return self.__toQDateTime(value) if value is not None else None
+
+    def time(self) -> Optional[QTime]:
+        """Gets the time of the label or None if it is empty.
+
+        Returns:
+            Optional[QTime]: Time or None.
+
+        """
+        value = self.__controller.value()
+        return QTime(value.hour, value.minute, value.second, value.microsecond // 1000) if value is not None else None
+
+    def value(self) -> DateTimeValue:
+        """Gets the value of the label as compact immutable value, which is null if the label is empty.
+
+        Returns:
+            DateTimeValue: Value in the mode of the label.
+
+        """
+        return DateTimeValue.fromDateTime(self.__controller.value(), self.__mode)
+
+    def setDate(self, date: QDate):
+        """Sets given date with the time of the current datetime.
+
+        Args:
+            date (QDate): Given date.
+
+        Raises:
+            TypeError if given date is not QDate.
+
+        """
+        if not isinstance(date, QDate):
+            date_type = str(type(date)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeLabel.setDate' called with wrong argument types:\n\t
+                DateTimeLabel.setDate({date_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeLabel.setDate(PySide2.QtCore.QDate)"""
+            )
+        self.__commit(self.__controller.setDate(date.toPython()))
+
+    def setDateTime(self, dt: QDateTime):
+        """Sets given datetime, invalid datetimes set the current datetime like in QDateTimeEdit.
+
+        Args:
+            dt (QDateTime): Given datetime.
+
+        Raises:
+            TypeError if given datetime is not QDateTime.
+
+        """
+        if not isinstance(dt, QDateTime):
+            dt_type = str(type(dt)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeLabel.setDateTime' called with wrong argument types:\n\t
+                DateTimeLabel.setDateTime({dt_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeLabel.setDateTime(PySide2.QtCore.QDateTime)"""
+            )
+        self.__commit(
+            self.__controller.setValue(self.__fromQDateTime(dt) if dt.isValid() else self.__controller.current())
+        )
+
+    def setTime(self, time: QTime):
+        """Sets given time with the date of the current datetime.
+
+        Args:
+            time (QTime): Given time.
+
+        Raises:
+            TypeError if given time is not QTime.
+
+        """
+        if not isinstance(time, QTime):
+            time_type = str(type(time)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeLabel.setTime' called with wrong argument types:\n\t
+                DateTimeLabel.setTime({time_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeLabel.setTime(PySide2.QtCore.QTime)"""
+            )
+        self.__commit(self.__controller.setTime(time.toPython()))
+
+    def setValue(self, value: DateTimeValue):
+        """Sets given compact value, a null value clears the label.
+
+        Args:
+            value (DateTimeValue): Given value.
+
+        Raises:
+            TypeError if given value is not DateTimeValue.
+
+        """
+        if not isinstance(value, DateTimeValue):
+            value_type = str(type(value)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeLabel.setValue' called with wrong argument types:\n\t
+                DateTimeLabel.setValue({value_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeLabel.setValue(ClearableDateTimeEdit.Values.DateTimeValue)"""
+            )
+        if value.isNull():
+            self.__commit(self.__controller.clear())
+        elif value.mode() == Mode.date:
+            self.__commit(self.__controller.setDate(value.toDateTime().date()))
+        elif value.mode() == Mode.time:
+            self.__commit(self.__controller.setTime(value.toDateTime().time()))
+        else:
+            self.__commit(self.__controller.setValue(value.toDateTime()))
+
+    def clear(self):
+        """Clears the value of the label."""
+        self.__commit(self.__controller.clear())
+
+    def sizeHint(self) -> QSize:
+        """Gets the size of the label which shows a datetime in display format and the icon.
+
+        Returns:
+            QSize: Size hint.
+
+        """
+        metrics = self.fontMetrics()
+        text = self.__controller.toText(_SIZE_HINT_DATETIME)
+        width = max(metrics.horizontalAdvance(text), metrics.horizontalAdvance(self.__placeholderText))
+        return QSize(width + _ICON_SIZE.width() + _MARGIN * 3, max(metrics.height(), _ICON_SIZE.height()) + _MARGIN * 2)
+
+    def minimumSizeHint(self) -> QSize:
+        """Gets the size of the label which shows the icon only.
+
+        Returns:
+            QSize: Minimum size hint.
+
+        """
+        return QSize(_ICON_SIZE.width() + _MARGIN * 2, max(self.fontMetrics().height(), _ICON_SIZE.height()))
+
+    def paintEvent(self, event: QPaintEvent):
+        """Paints the text of the value or the placeholder text and the icon of the mode.
+
+        Args:
+            event (QPaintEvent): Paint event.
+
+        """
+        if self.__editor is not None:
+            return
+        painter = QPainter(self)
+        rect = self.rect()
+        icon_rect = QRect(
+            rect.right() - _MARGIN - _ICON_SIZE.width() + 1,
+            rect.top() + (rect.height() - _ICON_SIZE.height()) // 2,
+            _ICON_SIZE.width(),
+            _ICON_SIZE.height(),
+        )
+        icon_mode = QIcon.Normal if self.isEnabled() else QIcon.Disabled
+        Icons.icon(self.__mode, _ICON_SIZE, self.devicePixelRatioF()).paint(
+            painter, icon_rect, Qt.AlignCenter, icon_mode
+        )
+        text = self.__controller.text()
+        if text:
+            painter.setPen(self.palette().color(QPalette.WindowText))
+        else:
+            text = self.__placeholderText
+            painter.setPen(self.palette().color(QPalette.PlaceholderText))
+        if text:
+            metrics = self.fontMetrics()
+            width = rect.width() - _ICON_SIZE.width() - _MARGIN * 3
+            # The baseline is placed so that the text is centred vertically, as with Qt.AlignVCenter.
+            baseline = rect.top() + (rect.height() + metrics.ascent() - metrics.descent()) // 2
+            painter.drawText(rect.left() + _MARGIN, baseline, metrics.elidedText(text, Qt.ElideRight, width))
+
+    def resizeEvent(self, event: QResizeEvent):
+        """Resizes the open editor with the label.
+
+        Args:
+            event (QResizeEvent): Resize event.
+
+        """
+        if self.__editor is not None:
+            self.__editor.setGeometry(self.rect())
+        super(ClearableDateTimeLabel, self).resizeEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent):
+        """Opens the editor when the label is clicked with the left mouse button.
+
+        Args:
+            event (QMouseEvent): Mouse event.
+
+        """
+        if event.button() == Qt.LeftButton and not self.__readOnly:
+            self.__openEditor()
+            event.accept()
+            return
+        super(ClearableDateTimeLabel, self).mousePressEvent(event)
+
+    def keyPressEvent(self, event: QKeyEvent):
+        """Opens the editor when Enter, Space or F2 is pressed.
+
+        Args:
+            event (QKeyEvent): Key event.
+
+        """
+        if event.key() in [Qt.Key_Enter, Qt.Key_Return, Qt.Key_Space, Qt.Key_F2] and not self.__readOnly:
+            self.__openEditor()
+            event.accept()
+            return
+        super(ClearableDateTimeLabel, self).keyPressEvent(event)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Closes the editor when it loses the focus to another widget or Escape is pressed, the focus may move to the
+        pop-up of the editor.
+
+        Args:
+            watched (QObject): Watched object.
+            event (QEvent): Event.
+
+        Returns:
+            bool: True if the event has been handled, False otherwise.
+
+        """
+        if watched is self.__editor:
+            if event.type() == QEvent.FocusOut and event.reason() != Qt.PopupFocusReason:
+                self.__editor.interpretText()
+                self.__closeEditor()
+            elif event.type() == QEvent.KeyPress and event.key() == Qt.Key_Escape:
+                self.__closeEditor()
+                self.setFocus(Qt.OtherFocusReason)
+                return True
+            elif event.type() == QEvent.KeyPress and event.key() in [Qt.Key_Enter, Qt.Key_Return]:
+                self.__editor.interpretText()
+                self.__closeEditor()
+                self.setFocus(Qt.OtherFocusReason)
+                return True
+        return super(ClearableDateTimeLabel, self).eventFilter(watched, event)
+
+    def __openEditor(self):
+        """Builds the editor over the label and loads the format and value of the label into it."""
+        if self.__editor is not None:
+            return
+        editor = ClearableDateTimeEdit(self, self.__mode)
+        editor.setPopupShared(True)
+        editor.setTimeSpec(self.__timeSpec)
+        if editor.displayFormat() != self.__controller.displayFormat():
+            editor.setDisplayFormat(self.__controller.displayFormat())
+        if not self.__controller.isEmpty():
+            editor.setDateTime(self.__toQDateTime(self.__controller.value()))
+        editor.valueChanged.connect(self.__takeEditorValue)
+        editor.installEventFilter(self)
+        editor.setGeometry(self.rect())
+        self.__editor = editor
+        editor.show()
+        editor.setFocus(Qt.MouseFocusReason)
+        editor.selectAll()
+
+    def __closeEditor(self):
+        """Destroys the editor, the committed values have been taken over already."""
+        if self.__editor is None:
+            return
+        editor, self.__editor = self.__editor, None
+        editor.removeEventFilter(self)
+        editor.valueChanged.disconnect(self.__takeEditorValue)
+        editor.hide()
+        editor.deleteLater()
+        self.update()
+
+    def __takeEditorValue(self, old: Optional[QDateTime], new: Optional[QDateTime], parts: int):
+        """Takes over the value committed in the editor.
+
+        Args:
+            old (Optional[QDateTime]): Previous datetime of the editor.
+            new (Optional[QDateTime]): New datetime of the editor or None if it has been cleared.
+            parts (int): Changed parts.
+
+        """
+        self.__commit(self.__controller.setValue(self.__fromQDateTime(new) if new is not None else None))
+
+    def __commit(self, change: ValueChange):
+        """Repaints the label and sends valueChanged with all overloads if the value has changed.
+
+        Args:
+            change (ValueChange): Previous and new value.
+
+        """
+        if not change.changed:
+            return
+        self.update()
+        old_dt = self.__toQDateTime(change.old) if change.old is not None else None
+        new_dt = self.__toQDateTime(change.new) if change.new is not None else None
+        parts = change.changedParts
+        self.valueChanged.emit(old_dt, new_dt, parts)
+        self.valueChanged[QDateTime, QDateTime, int].emit(
+            old_dt if old_dt is not None else QDateTime(), new_dt if new_dt is not None else QDateTime(), int(parts)
+        )
+        self.valueChanged[DateTimeValue, DateTimeValue, int].emit(
+            DateTimeValue.fromDateTime(change.old, self.__mode),
+            DateTimeValue.fromDateTime(change.new, self.__mode),
+            int(parts),
+        )
+
+    def __toQDateTime(self, dt: datetime) -> QDateTime:
+        """Converts given datetime into QDateTime with the time specification of the label.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            QDateTime: Datetime as QDateTime.
+
+        """
+        return QDateTime(
+            QDate(dt.year, dt.month, dt.day),
+            QTime(dt.hour, dt.minute, dt.second, dt.microsecond // 1000),
+            self.__timeSpec,
+        )
+
+    def __fromQDateTime(self, dt: QDateTime) -> datetime:
+        """Converts given QDateTime into datetime in the time specification of the label.
+
+        Args:
+            dt (QDateTime): Datetime.
+
+        Returns:
+            datetime: Datetime without time zone.
+
+        """
+        if dt.timeSpec() != self.__timeSpec:
+            dt = dt.toTimeSpec(self.__timeSpec)
+        return datetime.combine(dt.date().toPython(), dt.time().toPython())
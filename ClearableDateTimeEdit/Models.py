@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""This module contains the table model of NumPy datetime64 columns, e.g. the columns of a pandas DataFrame.
+
+NumPy is needed for the model, it can be installed with the "arrays" extra:
+
+$ pip install ClearableDateTimeEdit[arrays]
+"""
+__all__ = ["DateTime64TableModel"]
+from collections import OrderedDict
+from datetime import date, datetime, time
+from typing import Optional, Sequence
+
+from PySide2.QtCore import QAbstractTableModel, QDate, QDateTime, QModelIndex, Qt, QTime
+
+from ClearableDateTimeEdit import Arrays
+from ClearableDateTimeEdit.Core import DEFAULT_FORMATS
+from ClearableDateTimeEdit.Settings import Mode
+
+# NumPy is imported with the first model, see Arrays._numpy.
+np = None
+
+
+class DateTime64TableModel(QAbstractTableModel):
+    """DateTime64TableModel shows datetime64 arrays as columns of a table without copying them.
+
+    Notes:
+        The cells are formatted in blocks of rows with Arrays.formatMany when they are shown, only the texts of the
+        recently shown blocks are kept. NaT stands for an empty cell. The edit role gives QDateTime, QDate or QTime
+        depending on the mode, or None for NaT, so the cells can be edited with a ClearableDateTimeDelegate. Edited
+        values are written into the arrays in place, cleared cells become NaT. Arrays changed from outside have to be
+        announced with notifyDataChanged.
+
+    """
+
+    def __init__(
+        self,
+        columns: Sequence = (),
+        headers: Optional[Sequence[str]] = None,
+        mode: Mode = Mode.datetime,
+        parent=None,
+    ):
+        """Creates the model.
+
+        Args:
+            columns (Sequence, optional): One-dimensional datetime64 arrays of the same length, e.g.
+                DataFrame["column"].values, which are used without copying them.
+            headers (Optional[Sequence[str]], optional): Headers of the columns.
+            mode (Mode, optional): Mode of the values, which defines the default display format and the type of the
+                edit role.
+            parent (QObject, optional): Parent.
+
+        Raises:
+            ImportError if NumPy is not installed.
+            TypeError if a column is not a datetime64 array.
+            ValueError if the columns have different lengths.
+
+        """
+        super(DateTime64TableModel, self).__init__(parent)
+        global np
+        np = Arrays._numpy()
+        self.__mode = mode
+        self.__format = DEFAULT_FORMATS[self.__mode]
+        self.__blockSize = 64
+        self.__maximumBlocks = 64
+        # Texts of the recently shown blocks by column and block, the least recently used block is removed first.
+        self.__texts: "OrderedDict[tuple, object]" = OrderedDict()
+        self.__columns = []
+        self.__headers = []
+        self.__rows = 0
+        self.setColumns(columns, headers)
+
+    def column(self, column: int):
+        """Gets the array of given column.
+
+        Args:
+            column (int): Column.
+
+        Returns:
+            datetime64 array of the column.
+
+        """
+        return self.__columns[column]
+
+    def setColumns(self, columns: Sequence, headers: Optional[Sequence[str]] = None):
+        """Replaces all columns, the arrays are used without copying them.
+
+        Args:
+            columns (Sequence): One-dimensional datetime64 arrays of the same length.
+            headers (Optional[Sequence[str]], optional): Headers of the columns.
+
+        Raises:
+            TypeError if a column is not a datetime64 array.
+            ValueError if the columns have different lengths.
+
+        """
+        arrays = [np.asarray(column) for column in columns]
+        for index, array in enumerate(arrays):
+            if array.dtype.kind != "M" or array.ndim != 1:
+                raise TypeError(f"Column {index} is a {array.ndim}-dimensional {array.dtype} array, not datetime64")
+        if len({array.size for array in arrays}) > 1:
+            raise ValueError(f"Columns have different lengths {[array.size for array in arrays]}")
+        self.beginResetModel()
+        self.__columns = arrays
+        self.__headers = list(headers) if headers is not None else [str(index) for index in range(len(arrays))]
+        self.__rows = arrays[0].size if arrays else 0
+        self.__texts.clear()
+        self.endResetModel()
+
+    def mode(self) -> Mode:
+        """Gets the mode of the values as enum "Mode".
+
+        Returns:
+            Mode: Mode of the values.
+
+        """
+        return self.__mode
+
+    def displayFormat(self) -> str:
+        """Gets the display format of the cells.
+
+        Returns:
+            str: Display format.
+
+        """
+        return self.__format
+
+    def setDisplayFormat(self, format: str):
+        """Sets the display format of the cells, e.g. the display format of a ClearableDateTimeEdit.
+
+        Args:
+            format (str): New display format.
+
+        """
+        if format != self.__format:
+            self.__format = format
+            self.notifyDataChanged()
+
+    def notifyDataChanged(self, first: int = 0, last: Optional[int] = None):
+        """Announces that the arrays have been changed from outside, the texts of the rows are formatted again.
+
+        Args:
+            first (int, optional): First changed row.
+            last (Optional[int], optional): Last changed row, the last row of the table if not given.
+
+        """
+        last = self.__rows - 1 if last is None else last
+        if not self.__columns or last < first:
+            return
+        blocks = range(first // self.__blockSize, last // self.__blockSize + 1)
+        for key in [key for key in self.__texts if key[1] in blocks]:
+            del self.__texts[key]
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.__columns) - 1))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Gets the number of rows.
+
+        Args:
+            parent (QModelIndex, optional): Parent index, only the invalid root index has rows.
+
+        Returns:
+            int: Number of rows.
+
+        """
+        return 0 if parent.isValid() else self.__rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Gets the number of columns.
+
+        Args:
+            parent (QModelIndex, optional): Parent index, only the invalid root index has columns.
+
+        Returns:
+            int: Number of columns.
+
+        """
+        return 0 if parent.isValid() else len(self.__columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Gets the header of given column, the rows are numbered by the view.
+
+        Args:
+            section (int): Column or row.
+            orientation (Qt.Orientation): Orientation of the header.
+            role (int, optional): Data role.
+
+        Returns:
+            Header of the column or None.
+
+        """
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.__headers):
+            return self.__headers[section]
+        return super(DateTime64TableModel, self).headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Gets the flags of given cell, cells of writeable arrays are editable.
+
+        Args:
+            index (QModelIndex): Cell.
+
+        Returns:
+            Qt.ItemFlags: Flags of the cell.
+
+        """
+        flags = super(DateTime64TableModel, self).flags(index)
+        if index.isValid() and self.__columns[index.column()].flags.writeable:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Gets the text of given cell in display format or its value for editing.
+
+        Args:
+            index (QModelIndex): Cell.
+            role (int, optional): Data role.
+
+        Returns:
+            Text for the display role, QDateTime, QDate, QTime or None for the edit role, None for other roles.
+
+        """
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.__text(index.row(), index.column())
+        if role == Qt.EditRole:
+            value = self.__columns[index.column()][index.row()].astype("datetime64[ms]").item()
+            # NaT is None, values outside of the range of datetime are integers.
+            return self.__toQt(value) if isinstance(value, datetime) else None
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """Writes given value into the array of the cell, None or invalid values clear the cell.
+
+        Args:
+            index (QModelIndex): Cell.
+            value: QDateTime, QDate, QTime, datetime, date or None.
+            role (int, optional): Data role, only the edit role can be set.
+
+        Returns:
+            bool: True if the value has been written, False otherwise.
+
+        """
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        array = self.__columns[index.column()]
+        if not array.flags.writeable:
+            return False
+        array[index.row()] = self.__toDateTime64(value, array[index.row()])
+        key = (index.column(), index.row() // self.__blockSize)
+        self.__texts.pop(key, None)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def __text(self, row: int, column: int) -> str:
+        """Gets the text of given cell from the formatted block of its rows.
+
+        Args:
+            row (int): Row.
+            column (int): Column.
+
+        Returns:
+            str: Text of the cell, an empty string for NaT.
+
+        """
+        block = row // self.__blockSize
+        key = (column, block)
+        texts = self.__texts.get(key)
+        if texts is None:
+            start = block * self.__blockSize
+            texts = Arrays.formatMany(self.__columns[column][start : start + self.__blockSize], self.__format).tolist()
+            self.__texts[key] = texts
+            if len(self.__texts) > self.__maximumBlocks:
+                self.__texts.popitem(last=False)
+        else:
+            self.__texts.move_to_end(key)
+        return texts[row - block * self.__blockSize]
+
+    def __toQt(self, value: datetime):
+        """Converts given datetime into the Qt type of the mode.
+
+        Args:
+            value (datetime): Datetime.
+
+        Returns:
+            QDateTime, QDate or QTime.
+
+        """
+        qdate = QDate(value.year, value.month, value.day)
+        qtime = QTime(value.hour, value.minute, value.second, value.microsecond // 1000)
+        if self.__mode == Mode.date:
+            return qdate
+        if self.__mode == Mode.time:
+            return qtime
+        return QDateTime(qdate, qtime)
+
+    @staticmethod
+    def __toDateTime64(value, previous):
+        """Converts given value into datetime64, a time is combined with the date of the previous value.
+
+        Args:
+            value: QDateTime, QDate, QTime, datetime, date or None.
+            previous: Previous datetime64 value of the cell.
+
+        Returns:
+            datetime64 value, NaT for None or invalid values.
+
+        """
+        if isinstance(value, (QDateTime, QDate, QTime)):
+            value = value.toPython() if value.isValid() else None
+        if value is None:
+            return np.datetime64("NaT")
+        if isinstance(value, time):
+            day = previous.astype("datetime64[D]").item() if not np.isnat(previous) else date(1970, 1, 1)
+            value = datetime.combine(day, value)
+        elif not isinstance(value, datetime):
+            value = datetime.combine(value, time())
+        return np.datetime64(value, "us")
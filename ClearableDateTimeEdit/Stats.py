@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""This module contains the opt-in latency statistics of the hot paths of the DateTimeEdit.
+
+The hot paths are instrumented by replacing the methods of the classes with timing wrappers when the statistics are
+enabled. The original methods are restored when they are disabled, so the widgets run without any overhead then.
+
+Examples:
+    >>> enableStats(callback=lambda sample: print(sample))
+    >>> ...
+    >>> for record in stats():
+    ...     print(record["path"], record["mode"], record["count"], record["p95Us"])
+    >>> disableStats()
+"""
+__all__ = [
+    "HOT_PATHS",
+    "LatencyHistogram",
+    "Sample",
+    "disableStats",
+    "enableStats",
+    "isStatsEnabled",
+    "resetStats",
+    "stats",
+]
+import functools
+import math
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ClearableDateTimeEdit.popup import TimeWidget
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+# Instrumented methods by path name, private methods are given by their mangled names.
+HOT_PATHS = {
+    "openPopup": (ClearableDateTimeEdit, "_ClearableDateTimeEdit__openCalendar"),
+    "submit": (ClearableDateTimeEdit, "_ClearableDateTimeEdit__submit"),
+    "editingFinished": (ClearableDateTimeEdit, "_ClearableDateTimeEdit__editingFinished"),
+    "setDateTime": (ClearableDateTimeEdit, "setDateTime"),
+    "setupTime": (TimeWidget, "setupTime"),
+}
+# Upper bounds of the histogram buckets in microseconds, 8 buckets per doubling from 1 us to about 2 min.
+_BUCKET_BOUNDS = [2.0 ** (index / 8.0) for index in range(8 * 27)]
+
+
+class Sample(NamedTuple):
+    """Latency of one call of a hot path."""
+
+    path: str
+    widget: str
+    mode: Optional[str]
+    seconds: float
+
+
+class LatencyHistogram(object):
+    """LatencyHistogram counts latencies in logarithmic buckets, so percentiles are available with constant memory and
+    a relative error below 9 %.
+    """
+
+    def __init__(self):
+        super(LatencyHistogram, self).__init__()
+        self.__buckets = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.__count = 0
+        self.__totalUs = 0.0
+        self.__maximumUs = 0.0
+
+    def add(self, latencyUs: float):
+        """Adds given latency.
+
+        Args:
+            latencyUs (float): Latency in microseconds.
+
+        """
+        self.__buckets[bisect_left(_BUCKET_BOUNDS, latencyUs)] += 1
+        self.__count += 1
+        self.__totalUs += latencyUs
+        if latencyUs > self.__maximumUs:
+            self.__maximumUs = latencyUs
+
+    def count(self) -> int:
+        """Gets the number of latencies.
+
+        Returns:
+            int: Number of latencies.
+
+        """
+        return self.__count
+
+    def percentile(self, percent: float) -> float:
+        """Gets the latency below which given percentage of the latencies lie.
+
+        Args:
+            percent (float): Percentage between 0 and 100.
+
+        Returns:
+            float: Upper bound of the bucket of the percentile in microseconds, 0.0 if no latency has been added.
+
+        """
+        if not self.__count:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100.0 * self.__count))
+        cumulative = 0
+        for index, bucket in enumerate(self.__buckets):
+            cumulative += bucket
+            if cumulative >= rank:
+                if index == len(_BUCKET_BOUNDS):
+                    break
+                return min(_BUCKET_BOUNDS[index], self.__maximumUs)
+        return self.__maximumUs
+
+    def summary(self) -> Dict[str, float]:
+        """Gets the number of latencies, their mean, maximum and percentiles.
+
+        Returns:
+            Dict[str, float]: Figures in microseconds by name.
+
+        """
+        return {
+            "count": self.__count,
+            "meanUs": round(self.__totalUs / self.__count, 3) if self.__count else 0.0,
+            "p50Us": round(self.percentile(50), 3),
+            "p95Us": round(self.percentile(95), 3),
+            "p99Us": round(self.percentile(99), 3),
+            "maxUs": round(self.__maximumUs, 3),
+        }
+
+
+_histograms: Dict[Tuple[str, str, Optional[str]], LatencyHistogram] = {}
+_originals: Dict[str, Callable] = {}
+_callback: Optional[Callable[[Sample], None]] = None
+
+
+def _modeOf(widget) -> Optional[str]:
+    """Gets the mode of given DateTimeEdit or of the pop-up containing given time widget.
+
+    Args:
+        widget (QWidget): DateTimeEdit or time widget.
+
+    Returns:
+        Optional[str]: Value of the mode or None if the widget has no mode.
+
+    """
+    for candidate in (widget, widget.parentWidget()):
+        mode = getattr(candidate, "mode", None)
+        if callable(mode):
+            return mode().value
+    return None
+
+
+def _instrument(path: str, method: Callable) -> Callable:
+    """Wraps given method into a function recording the latency of each call.
+
+    Args:
+        path (str): Name of the hot path.
+        method (Callable): Original method.
+
+    Returns:
+        Callable: Wrapper of the method.
+
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            key = (path, type(self).__name__, _modeOf(self))
+            histogram = _histograms.get(key)
+            if histogram is None:
+                histogram = _histograms[key] = LatencyHistogram()
+            histogram.add(seconds * 1e6)
+            if _callback is not None:
+                _callback(Sample(key[0], key[1], key[2], seconds))
+
+    return wrapper
+
+
+def enableStats(callback: Optional[Callable[[Sample], None]] = None):
+    """Starts recording the latencies of the hot paths, the recorded latencies are kept.
+
+    Args:
+        callback (Optional[Callable[[Sample], None]], optional): Function called with every recorded latency, e.g. to
+            send them to a monitoring system.
+
+    """
+    global _callback
+    _callback = callback
+    for path, (cls, name) in HOT_PATHS.items():
+        if path not in _originals:
+            _originals[path] = getattr(cls, name)
+            setattr(cls, name, _instrument(path, _originals[path]))
+
+
+def disableStats():
+    """Stops recording and restores the original methods, the recorded latencies are kept."""
+    global _callback
+    _callback = None
+    for path, (cls, name) in HOT_PATHS.items():
+        original = _originals.pop(path, None)
+        if original is not None:
+            setattr(cls, name, original)
+
+
+def isStatsEnabled() -> bool:
+    """Checks whether the latencies are recorded.
+
+    Returns:
+        bool: True if the hot paths are instrumented.
+
+    """
+    return bool(_originals)
+
+
+def resetStats():
+    """Removes all recorded latencies."""
+    _histograms.clear()
+
+
+def stats() -> List[Dict]:
+    """Gets the recorded latencies per hot path, widget class and mode.
+
+    Returns:
+        List[Dict]: Path, widget class, mode, number of calls, mean, maximum and the percentiles 50, 95 and 99 in
+            microseconds, sorted by path, widget class and mode.
+
+    """
+    records = []
+    for (path, widget, mode), histogram in sorted(_histograms.items(), key=lambda item: str(item[0])):
+        record = {"path": path, "widget": widget, "mode": mode}
+        record.update(histogram.summary())
+        records.append(record)
+    return records
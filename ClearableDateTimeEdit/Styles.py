@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""This module contains the styling and the translated texts shared by all DateTimeEdits and their pop-ups.
+
+Setting a style sheet on a widget parses the sheet and polishes the widget and all its children again. The pop-ups
+therefore get one style sheet for all their parts, whose rules are selected by object name, and the DateTimeEdits
+themselves are styled without style sheets by one proxy style for all pop-up buttons.
+"""
+__all__ = [
+    "POPUP_STYLE_SHEET",
+    "TIME_WIDGET_STYLE_SHEET",
+    "PopupButtonStyle",
+    "clearTranslationCache",
+    "popupButtonStyle",
+    "translate",
+]
+from functools import lru_cache
+from typing import Optional
+
+from PySide2.QtCore import QSize
+from PySide2.QtWidgets import (
+    QApplication,
+    QProxyStyle,
+    QStyle,
+    QStyleOption,
+    QWidget,
+)
+
+# The rules without selector of the former per-widget style sheets applied to the children of the widgets too.
+TIME_WIDGET_STYLE_SHEET = """
+QLabel#timeLabel {
+    background-color: rgb(0, 122, 212);
+    color: rgb(255, 255, 255);
+    margin: 0px;
+}
+QLabel#hourLabel, QLabel#minLabel, QLabel#secLabel, QLabel#msecLabel, QLabel#msecListLabel {
+    border: 1px solid grey;
+}
+#hourListWidget, #hourListWidget * {
+    margin: 0px;
+}
+"""
+POPUP_STYLE_SHEET = """
+#calendarWidget, #calendarWidget * {
+    margin: 0px;
+}
+"""
+# Proxy style of the pop-up buttons, created with the first DateTimeEdit.
+_popupButtonStyle: Optional["PopupButtonStyle"] = None
+
+
+class PopupButtonStyle(QProxyStyle):
+    """PopupButtonStyle draws the pop-up buttons of the DateTimeEdits as bare icons without frame and margins, like
+    the former style sheet "border: 0px; padding: 0px;" did.
+    """
+
+    def drawPrimitive(self, element: QStyle.PrimitiveElement, option: QStyleOption, painter, widget=None):
+        """Skips the panel and the frame of the tool buttons and draws all other elements with the base style.
+
+        Args:
+            element (QStyle.PrimitiveElement): Element to draw.
+            option (QStyleOption): Style options of the element.
+            painter (QPainter): Painter.
+            widget (QWidget, optional): Widget of the element.
+
+        """
+        if element in (QStyle.PE_PanelButtonTool, QStyle.PE_FrameButtonTool, QStyle.PE_FrameFocusRect):
+            return
+        super(PopupButtonStyle, self).drawPrimitive(element, option, painter, widget)
+
+    def pixelMetric(self, metric: QStyle.PixelMetric, option: QStyleOption = None, widget: QWidget = None) -> int:
+        """Removes the margins and the pressed shift of the tool buttons.
+
+        Args:
+            metric (QStyle.PixelMetric): Metric.
+            option (QStyleOption, optional): Style options.
+            widget (QWidget, optional): Widget.
+
+        Returns:
+            int: Value of the metric.
+
+        """
+        if metric in (QStyle.PM_ButtonMargin, QStyle.PM_ButtonShiftHorizontal, QStyle.PM_ButtonShiftVertical):
+            return 0
+        return super(PopupButtonStyle, self).pixelMetric(metric, option, widget)
+
+    def sizeFromContents(
+        self, contentsType: QStyle.ContentsType, option: QStyleOption, contentsSize: QSize, widget: QWidget = None
+    ) -> QSize:
+        """Sizes the tool buttons to their icons.
+
+        Args:
+            contentsType (QStyle.ContentsType): Type of the contents.
+            option (QStyleOption): Style options.
+            contentsSize (QSize): Size of the contents.
+            widget (QWidget, optional): Widget.
+
+        Returns:
+            QSize: Size of the element.
+
+        """
+        if contentsType == QStyle.CT_ToolButton:
+            return QSize(contentsSize)
+        return super(PopupButtonStyle, self).sizeFromContents(contentsType, option, contentsSize, widget)
+
+
+def popupButtonStyle() -> PopupButtonStyle:
+    """Gets the proxy style shared by the pop-up buttons of all DateTimeEdits.
+
+    Returns:
+        PopupButtonStyle: Proxy style owned by the application.
+
+    """
+    global _popupButtonStyle
+    if _popupButtonStyle is None:
+        _popupButtonStyle = PopupButtonStyle()
+        # The application deletes the style after its widgets.
+        _popupButtonStyle.setParent(QApplication.instance())
+        _popupButtonStyle.destroyed.connect(_forgetPopupButtonStyle)
+    return _popupButtonStyle
+
+
+def _forgetPopupButtonStyle():
+    """Drops the reference to the deleted proxy style, so that a new application gets a new one."""
+    global _popupButtonStyle
+    _popupButtonStyle = None
+
+
+@lru_cache(maxsize=None)
+def translate(context: str, sourceText: str) -> str:
+    """Translates given text once per process.
+
+    Args:
+        context (str): Translation context, e.g. "TimeWidget".
+        sourceText (str): Text to translate.
+
+    Returns:
+        str: Translated text.
+
+    Notes:
+        clearTranslationCache has to be called after translators have been installed or removed.
+
+    """
+    return QApplication.translate(context, sourceText, None, -1)
+
+
+def clearTranslationCache():
+    """Removes all translated texts from the cache, e.g. after the language of the application has been changed."""
+    translate.cache_clear()
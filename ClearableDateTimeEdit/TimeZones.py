@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""This module contains the cached time zones used to display UTC values in the wall time of an IANA time zone.
+
+The UTC offsets of a zone are precomputed per year as a table of transitions, so a conversion is a binary search in a
+short list instead of a full time zone computation. The zones and their tables are shared by all DateTimeEdits and
+delegates of the process. The module does not depend on Qt. The zones are loaded with zoneinfo of Python 3.9, systems
+without tz database like Windows need the tzdata package, which is installed with the "timezones" extra:
+
+$ pip install ClearableDateTimeEdit[timezones]
+
+>>> from datetime import datetime
+>>> from ClearableDateTimeEdit.TimeZones import timeZone
+>>> berlin = timeZone("Europe/Berlin")
+>>> berlin.toLocal(datetime(2022, 12, 24, 17))
+datetime.datetime(2022, 12, 24, 18, 0)
+>>> berlin.isMissing(datetime(2022, 3, 27, 2, 30)), berlin.isAmbiguous(datetime(2022, 10, 30, 2, 30))
+(True, True)
+"""
+__all__ = ["TimeZone", "clearTimeZoneCache", "timeZone"]
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+_DAY = timedelta(days=1)
+_SECOND = timedelta(seconds=1)
+
+
+def _zoneInfo(key: str):
+    """Loads the zone with given key with zoneinfo, which is imported on first use.
+
+    Args:
+        key (str): IANA key.
+
+    Raises:
+        ImportError if zoneinfo is not available, i.e. before Python 3.9.
+        zoneinfo.ZoneInfoNotFoundError if the zone is not known.
+
+    Returns:
+        zoneinfo.ZoneInfo: Zone.
+
+    """
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:
+        raise ImportError("zoneinfo of Python 3.9 or later is required for time zones") from None
+    return ZoneInfo(key)
+
+
+def _shifted(dt: datetime, delta: timedelta) -> datetime:
+    """Adds given time difference to given datetime, the result is clamped to the datetimes Python can represent.
+
+    Args:
+        dt (datetime): Datetime.
+        delta (timedelta): Time difference.
+
+    Returns:
+        datetime: Shifted datetime.
+
+    """
+    try:
+        return dt + delta
+    except OverflowError:
+        return datetime.max if delta > timedelta(0) else datetime.min
+
+
+class TimeZone(object):
+    """TimeZone converts naive UTC datetimes into the naive wall time of an IANA time zone and back.
+
+    Notes:
+        Wall times which are skipped when the clocks are put forward (gaps) or which occur twice when they are put
+        back (folds) are resolved with the fold attribute of PEP 495: fold 0 takes the offset before the transition,
+        i.e. the earlier of two occurrences, and fold 1 the offset after it. Transitions less than two days apart are
+        not supported, no IANA zone has them.
+
+    """
+
+    def __init__(self, key: str):
+        """Loads the time zone.
+
+        Args:
+            key (str): IANA key, e.g. "Europe/Berlin".
+
+        Raises:
+            ImportError if zoneinfo is not available, i.e. before Python 3.9.
+            zoneinfo.ZoneInfoNotFoundError if the zone is not known.
+
+        """
+        super(TimeZone, self).__init__()
+        self.__key = key
+        self.__zone = _zoneInfo(key)
+        # Start of the year and the transitions in it as naive UTC datetimes and the offsets beginning with them.
+        self.__years: Dict[int, Tuple[List[datetime], List[timedelta]]] = {}
+
+    def key(self) -> str:
+        """Gets the IANA key of the zone.
+
+        Returns:
+            str: IANA key.
+
+        """
+        return self.__key
+
+    def __offset(self, utc: datetime) -> timedelta:
+        """Computes the UTC offset at given UTC datetime with zoneinfo.
+
+        Args:
+            utc (datetime): Naive UTC datetime.
+
+        Returns:
+            timedelta: UTC offset.
+
+        """
+        try:
+            return utc.replace(tzinfo=timezone.utc).astimezone(self.__zone).utcoffset()
+        except OverflowError:
+            # The wall time lies beyond the datetimes of Python, the offset of the neighbouring day is used.
+            return self.__offset(utc - _DAY if utc.year > 1 else utc + _DAY)
+
+    def __year(self, year: int) -> Tuple[List[datetime], List[timedelta]]:
+        """Gets the transition table of given year, which is computed on first use.
+
+        Args:
+            year (int): Year in UTC.
+
+        Returns:
+            Tuple[List[datetime], List[timedelta]]: Naive UTC datetimes from which the offsets apply and the offsets.
+
+        """
+        table = self.__years.get(year)
+        if table is not None:
+            return table
+        start = datetime(year, 1, 1)
+        samples = [start + _DAY * day for day in range((datetime(year, 12, 31) - start).days + 1)]
+        samples.append(datetime(year, 12, 31, 23, 59, 59))
+        starts, offsets = [start], [self.__offset(start)]
+        for before, after in zip(samples, samples[1:]):
+            offset = self.__offset(after)
+            if offset == offsets[-1]:
+                continue
+            # The transition lies between both samples, it is searched on whole seconds like the transitions of the
+            # tz database, so the table starts exactly at the transition.
+            low, high = before, after
+            while high - low > _SECOND:
+                middle = low + _SECOND * ((high - low) // _SECOND // 2)
+                if self.__offset(middle) == offset:
+                    high = middle
+                else:
+                    low = middle
+            starts.append(high)
+            offsets.append(offset)
+        table = self.__years[year] = (starts, offsets)
+        return table
+
+    def utcOffset(self, utc: datetime) -> timedelta:
+        """Gets the UTC offset at given UTC datetime.
+
+        Args:
+            utc (datetime): Naive UTC datetime.
+
+        Returns:
+            timedelta: UTC offset, e.g. 1 hour for Europe/Berlin in winter.
+
+        """
+        starts, offsets = self.__year(utc.year)
+        return offsets[bisect_right(starts, utc) - 1]
+
+    def toLocal(self, utc: datetime) -> datetime:
+        """Converts given UTC datetime into the wall time of the zone.
+
+        Args:
+            utc (datetime): Naive UTC datetime.
+
+        Returns:
+            datetime: Naive wall time, its fold attribute is 1 for the second occurrence of a repeated wall time.
+
+        """
+        starts, offsets = self.__year(utc.year)
+        index = bisect_right(starts, utc) - 1
+        local = _shifted(utc, offsets[index])
+        # The wall times shown within the length of a fold after the clocks have been put back are shown twice.
+        if index and offsets[index] < offsets[index - 1] and utc - starts[index] < offsets[index - 1] - offsets[index]:
+            return local.replace(fold=1)
+        return local
+
+    def toUtc(self, local: datetime, fold: int = None) -> datetime:
+        """Converts given wall time of the zone into UTC.
+
+        Args:
+            local (datetime): Naive wall time.
+            fold (int, optional): 0 for the offset before and 1 for the offset after a transition, the fold attribute
+                of given wall time is used if not given.
+
+        Returns:
+            datetime: Naive UTC datetime. Wall times in a gap are moved by the length of the gap, forwards with fold 0
+                and backwards with fold 1.
+
+        """
+        with_before, with_after = self.__candidates(local)
+        if with_before == with_after:
+            return with_before
+        fold = local.fold if fold is None else fold
+        exists_before, exists_after = self.__exists(with_before, local), self.__exists(with_after, local)
+        if exists_before != exists_after:
+            return with_before if exists_before else with_after
+        return with_after if fold else with_before
+
+    def isAmbiguous(self, local: datetime) -> bool:
+        """Checks whether given wall time occurs twice because the clocks are put back.
+
+        Args:
+            local (datetime): Naive wall time.
+
+        Returns:
+            bool: True if the wall time lies in a fold, False otherwise.
+
+        """
+        with_before, with_after = self.__candidates(local)
+        return with_before != with_after and self.__exists(with_before, local) and self.__exists(with_after, local)
+
+    def isMissing(self, local: datetime) -> bool:
+        """Checks whether given wall time is skipped because the clocks are put forward.
+
+        Args:
+            local (datetime): Naive wall time.
+
+        Returns:
+            bool: True if the wall time lies in a gap, False otherwise.
+
+        """
+        with_before, with_after = self.__candidates(local)
+        if with_before == with_after:
+            return False
+        return not self.__exists(with_before, local) and not self.__exists(with_after, local)
+
+    def __candidates(self, local: datetime) -> Tuple[datetime, datetime]:
+        """Gets the UTC datetimes of given wall time with the offsets one day before and after it.
+
+        Args:
+            local (datetime): Naive wall time.
+
+        Returns:
+            Tuple[datetime, datetime]: UTC datetimes with the offset before and after a nearby transition, both are the
+                same if there is no transition.
+
+        """
+        before = self.utcOffset(_shifted(local, -_DAY))
+        after = self.utcOffset(_shifted(local, _DAY))
+        return _shifted(local, -before), _shifted(local, -after)
+
+    def __exists(self, utc: datetime, local: datetime) -> bool:
+        """Checks whether given UTC datetime is shown as given wall time.
+
+        Args:
+            utc (datetime): Naive UTC datetime.
+            local (datetime): Naive wall time.
+
+        Returns:
+            bool: True if the wall time of the UTC datetime is the given one.
+
+        """
+        return _shifted(utc, self.utcOffset(utc)) == local.replace(fold=0)
+
+
+@lru_cache(maxsize=None)
+def timeZone(key: str) -> TimeZone:
+    """Gets the time zone with given IANA key, it is loaded once per process.
+
+    Args:
+        key (str): IANA key, e.g. "Europe/Berlin".
+
+    Raises:
+        ImportError if zoneinfo is not available, i.e. before Python 3.9.
+        zoneinfo.ZoneInfoNotFoundError if the zone is not known.
+
+    Returns:
+        TimeZone: Time zone with its cached transition tables.
+
+    """
+    return TimeZone(key)
+
+
+def clearTimeZoneCache():
+    """Removes all time zones and their transition tables from the cache, e.g. after the tz database was updated."""
+    timeZone.cache_clear()
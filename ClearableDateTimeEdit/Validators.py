@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""This module contains the validator checking the text of the DateTimeEdits on every keystroke.
+
+The text is scanned section by section with the compiled display format. The sections scanned for the recent texts are
+kept by text, so a keystroke only scans the sections from the first changed character on, also if the DateTimeEdits
+sharing a validator are edited by turns. Validators are shared by all DateTimeEdits with the same display format,
+range and mode.
+"""
+__all__ = ["DateTimeValidator", "clearValidatorCache", "dateTimeValidator"]
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+from PySide2.QtGui import QValidator
+
+from ClearableDateTimeEdit.Formats import (
+    DAY_NAMES,
+    MAXIMUM,
+    MONTH_NAMES,
+    DateTimeFormat,
+    Section,
+    compileFormat,
+)
+from ClearableDateTimeEdit.Settings import Mode
+
+# Results of scanning a section or a text. Intermediate sections are short, empty or out of range, but the scan goes
+# on after them. Partial texts end before the last section.
+_COMPLETE, _INTERMEDIATE, _PARTIAL, _INVALID = range(4)
+# Minimum values of the sections, the other sections start at 0.
+_MINIMUM = {"day": 1, "month": 1, "year": 1}
+# Maximum value of the sections by kind.
+_SECTION_MAXIMUM = {
+    "day": MAXIMUM["day"],
+    "month": MAXIMUM["month"],
+    "hour12": MAXIMUM["hour12"],
+    "hour24": MAXIMUM["hour"],
+    "minute": MAXIMUM["minute"],
+    "second": MAXIMUM["second"],
+    "msec": MAXIMUM["msec"],
+    "year": MAXIMUM["year"],
+}
+_TIME_ZONE_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+:-")
+# Datetimes whose parts are used for the parts missing in the display format, the earliest and the latest completion.
+_EARLIEST = datetime(1752, 1, 1)
+_LATEST = datetime(9999, 12, 31, 23, 59, 59, 999000)
+# Number of recent texts whose scan states are kept by a validator.
+_MAXIMUM_STATES = 16
+
+
+class _ScanState(NamedTuple):
+    """Sections scanned in a text and the state of the text."""
+
+    # Start of every scanned section and the end of the last one.
+    starts: List[int]
+    # Results and datetime parts and values of the scanned sections.
+    results: List[int]
+    values: List[Optional[Tuple[Optional[str], int]]]
+    # Result of the scan and state of the text.
+    result: int
+    state: QValidator.State
+
+
+_NO_STATE = _ScanState([0], [], [], _PARTIAL, QValidator.Intermediate)
+
+
+def _names(section: Section) -> List[str]:
+    """Gets the lower case names matched by given name section.
+
+    Args:
+        section (Section): Section of kind "dayName", "monthName" or "amPm".
+
+    Returns:
+        List[str]: Names, the longest first.
+
+    """
+    if section.kind == "amPm":
+        return ["am", "pm"]
+    names = DAY_NAMES if section.kind == "dayName" else MONTH_NAMES
+    names = names if section.count == 4 else [name[:3] for name in names]
+    return sorted((name.lower() for name in names), key=len, reverse=True)
+
+
+class DateTimeValidator(QValidator):
+    """DateTimeValidator accepts the texts of a display format within a range and empty texts.
+
+    Notes:
+        Only texts with characters which can not match the display format, e.g. "24x" or "24.12.2022x" for
+        "dd.MM.yyyy", are invalid and rejected by the line edit. Sections which are short, empty or out of range,
+        e.g. in "24.1", "24..2022" or "24.13.2022", are intermediate anywhere in the text, so the middle of a value
+        can be edited. Texts whose datetime does not exist, e.g. "31.02.2022", or lies outside of the range are
+        intermediate too, like in time mode times outside of the times of the minimum and maximum datetime. Intermediate
+        texts are not committed. Parts missing in the display format may take any value, e.g. a time of the first day
+        of the range. Disabled intervals and time zones are checked when the text is committed.
+
+    """
+
+    def __init__(self, fmt: str, minimum: datetime, maximum: datetime, mode: Mode = Mode.datetime, parent=None):
+        """Creates the validator.
+
+        Args:
+            fmt (str): Display format.
+            minimum (datetime): Minimum datetime.
+            maximum (datetime): Maximum datetime.
+            mode (Mode, optional): Mode of the DateTimeEdit, the times bound every day in time mode only.
+            parent (QObject, optional): Parent.
+
+        """
+        super(DateTimeValidator, self).__init__(parent)
+        self.__format = compileFormat(fmt)
+        self.__sections = self.__format.sections
+        self.__names = [
+            _names(section) if section.kind in ("dayName", "monthName", "amPm") else None for section in self.__sections
+        ]
+        self.__characters = [frozenset("".join(names)) if names else None for names in self.__names]
+        self.__minimum = minimum
+        self.__maximum = maximum
+        # Bounds of the time of every day in time mode like in DateTimeController.bound, None if not bounded.
+        self.__timeRange = (
+            (minimum.time(), maximum.time()) if mode == Mode.time and minimum.time() <= maximum.time() else None
+        )
+        # Variable width numbers followed by another section without a separator take a second digit only if the value
+        # stays in range, like the regular expression of the display format.
+        self.__trimmed = [
+            index + 1 < len(self.__sections) and self.__sections[index + 1].kind != "literal"
+            for index in range(len(self.__sections))
+        ]
+        # Scan states of the recent texts, the least recently validated text is removed first.
+        self.__states: "OrderedDict[str, _ScanState]" = OrderedDict()
+
+    def displayFormat(self) -> str:
+        """Gets the display format.
+
+        Returns:
+            str: Display format.
+
+        """
+        return self.__format.format
+
+    def minimumDateTime(self) -> datetime:
+        """Gets the minimum datetime.
+
+        Returns:
+            datetime: Minimum datetime.
+
+        """
+        return self.__minimum
+
+    def maximumDateTime(self) -> datetime:
+        """Gets the maximum datetime.
+
+        Returns:
+            datetime: Maximum datetime.
+
+        """
+        return self.__maximum
+
+    def validate(self, text: str, pos: int) -> QValidator.State:
+        """Checks given text, only the sections from the first character changed since a recent text are scanned.
+
+        Args:
+            text (str): Text of the line edit.
+            pos (int): Cursor position.
+
+        Returns:
+            QValidator.State: Acceptable, Intermediate or Invalid.
+
+        """
+        if not text:
+            return QValidator.Acceptable
+        scan = self.__states.get(text)
+        if scan is None:
+            scan = self.__scan(text, pos)
+            self.__states[text] = scan
+            if len(self.__states) > _MAXIMUM_STATES:
+                self.__states.popitem(last=False)
+        else:
+            self.__states.move_to_end(text)
+        return scan.state
+
+    def __scan(self, text: str, pos: int) -> _ScanState:
+        """Scans given text from the first section which may be changed compared with a recent text.
+
+        Args:
+            text (str): Text of the line edit.
+            pos (int): Cursor position, the text before the character in front of it is usually the beginning of the
+                previous text of the same line edit.
+
+        Returns:
+            _ScanState: Sections scanned in the text and its state.
+
+        """
+        prefix = text[: max(pos - 1, 0)]
+        previous, base = "", _NO_STATE
+        for candidate in reversed(self.__states):
+            if candidate.startswith(prefix):
+                previous, base = candidate, self.__states[candidate]
+                break
+        common = len(prefix) if previous else 0
+        while common < len(text) and common < len(previous) and text[common] == previous[common]:
+            common += 1
+        # A section is kept if the character following it is unchanged, it decides where variable sections end.
+        index = len(base.starts) - 1
+        while index > 0 and base.starts[index] >= common:
+            index -= 1
+        starts = base.starts[: index + 1]
+        results = base.results[:index]
+        values = base.values[:index]
+        position = starts[index]
+        result = _COMPLETE
+        while index < len(self.__sections):
+            if position == len(text):
+                result = _PARTIAL
+                break
+            result, end, value = self.__scanSection(index, text, position)
+            if result == _INVALID:
+                break
+            results.append(result)
+            values.append(value)
+            starts.append(end)
+            position = end
+            index += 1
+        else:
+            result = _COMPLETE if position == len(text) else _INVALID
+        return _ScanState(starts, results, values, result, self.__state(results, values, result))
+
+    def __state(
+        self, results: List[int], values: List[Optional[Tuple[Optional[str], int]]], result: int
+    ) -> QValidator.State:
+        """Gets the state of a scanned text.
+
+        Args:
+            results (List[int]): Results of the scanned sections.
+            values (List[Optional[Tuple[Optional[str], int]]]): Datetime parts and values of the scanned sections.
+            result (int): Result of the scan.
+
+        Returns:
+            QValidator.State: Acceptable, Intermediate or Invalid.
+
+        """
+        if result == _INVALID:
+            return QValidator.Invalid
+        if result == _PARTIAL or _INTERMEDIATE in results:
+            return QValidator.Intermediate
+        known = {}
+        for value in values:
+            if value is not None and value[0] is not None and known.setdefault(value[0], value[1]) != value[1]:
+                return QValidator.Intermediate
+        earliest = DateTimeFormat.fromSections(known, _EARLIEST)
+        latest = DateTimeFormat.fromSections(known, _LATEST)
+        if earliest is None and latest is None:
+            return QValidator.Intermediate
+        if earliest is None or latest is None:
+            earliest = latest = earliest or latest
+        if latest < self.__minimum or earliest > self.__maximum:
+            return QValidator.Intermediate
+        if self.__timeRange is not None and (
+            latest.time() < self.__timeRange[0] or earliest.time() > self.__timeRange[1]
+        ):
+            return QValidator.Intermediate
+        return QValidator.Acceptable
+
+    def __scanSection(
+        self, index: int, text: str, position: int
+    ) -> Tuple[int, int, Optional[Tuple[Optional[str], int]]]:
+        """Scans the section with given index at given position like the regular expression of the display format.
+
+        Args:
+            index (int): Index of the section.
+            text (str): Text.
+            position (int): Position of the section in the text.
+
+        Returns:
+            Tuple[int, int, Optional[Tuple[Optional[str], int]]]: Result of the section, its end and the datetime part
+                and value returned by DateTimeFormat.sectionValue.
+
+        """
+        section = self.__sections[index]
+        kind = section.kind
+        if kind == "literal":
+            literal = section.text
+            if text.startswith(literal, position):
+                return _COMPLETE, position + len(literal), None
+            if literal.startswith(text[position:]):
+                return _INTERMEDIATE, len(text), None
+            return _INVALID, position, None
+        if kind in _SECTION_MAXIMUM:
+            return self.__scanNumber(section, text, position, self.__trimmed[index])
+        if kind == "timeZone":
+            end = position
+            while end < len(text) and text[end] in _TIME_ZONE_CHARS:
+                end += 1
+            return _COMPLETE, end, None
+        names = self.__names[index]
+        lowered = text[position : position + len(names[0])].lower()
+        for name in names:
+            if lowered.startswith(name):
+                matched = text[position : position + len(name)]
+                return _COMPLETE, position + len(name), DateTimeFormat.sectionValue(section, matched)
+        # Characters of the names, e.g. of a name whose middle is edited, the following ones have to match the
+        # following sections.
+        characters = self.__characters[index]
+        length = 0
+        while length < len(lowered) and lowered[length] in characters:
+            length += 1
+        return _INTERMEDIATE, position + length, None
+
+    @staticmethod
+    def __scanNumber(
+        section: Section, text: str, position: int, trimmed: bool
+    ) -> Tuple[int, int, Optional[Tuple[Optional[str], int]]]:
+        """Scans a number section, short, empty and out of range numbers are intermediate.
+
+        Args:
+            section (Section): Section of the display format.
+            text (str): Text.
+            position (int): Position of the section in the text.
+            trimmed (bool): Whether a variable width number takes a second digit only if the value stays in range.
+
+        Returns:
+            Tuple[int, int, Optional[Tuple[Optional[str], int]]]: Result of the section, its end and the datetime part
+                and value returned by DateTimeFormat.sectionValue.
+
+        """
+        kind = section.kind
+        maximum = _SECTION_MAXIMUM[kind]
+        minimum = _MINIMUM.get(kind, 0)
+        if kind == "year":
+            width, fixed = section.count, True
+            maximum = maximum if section.count == 4 else 99
+            minimum = minimum if section.count == 4 else 0
+        elif kind == "msec":
+            width, fixed = 3, section.count == 3
+        else:
+            width, fixed = 2, section.count == 2
+        end = position
+        while end < len(text) and end - position < width and text[end].isdigit():
+            end += 1
+        digits = text[position:end]
+        if trimmed and not fixed:
+            while len(digits) > 1 and int(digits) > maximum:
+                digits = digits[:-1]
+            end = position + len(digits)
+        if not digits or fixed and len(digits) < width:
+            return _INTERMEDIATE, end, None
+        number = int(digits)
+        if number < minimum or number > maximum:
+            return _INTERMEDIATE, end, None
+        return _COMPLETE, end, DateTimeFormat.sectionValue(section, digits)
+
+
+@lru_cache(maxsize=64)
+def dateTimeValidator(fmt: str, minimum: datetime, maximum: datetime, mode: Mode = Mode.datetime) -> DateTimeValidator:
+    """Gets the validator shared by all DateTimeEdits with given display format, range and mode.
+
+    Args:
+        fmt (str): Display format.
+        minimum (datetime): Minimum datetime.
+        maximum (datetime): Maximum datetime.
+        mode (Mode, optional): Mode of the DateTimeEdits.
+
+    Returns:
+        DateTimeValidator: Shared validator, it is kept alive by the DateTimeEdits using it.
+
+    """
+    return DateTimeValidator(fmt, minimum, maximum, mode)
+
+
+def clearValidatorCache():
+    """Removes all validators from the cache, the DateTimeEdits keep the validators they use."""
+    dateTimeValidator.cache_clear()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""This module contains the compact, immutable value of a DateTimeEdit, which can be empty.
+
+A DateTimeValue holds the milliseconds since 1970-01-01T00:00, a null flag and the mode in a tuple. It is hashable and
+ordered, so millions of values can be deduplicated, sorted and stored without Qt objects. The module does not depend on
+Qt, Qt is imported when a value is converted into QDateTime only:
+
+>>> from datetime import datetime
+>>> from ClearableDateTimeEdit.Settings import Mode
+>>> from ClearableDateTimeEdit.Values import DateTimeValue
+>>> value = DateTimeValue.fromDateTime(datetime(2022, 12, 24, 18), Mode.date)
+>>> value, value.toDateTime()
+(DateTimeValue(1671840000000, Mode.date), datetime.datetime(2022, 12, 24, 0, 0))
+>>> sorted({value, DateTimeValue(None, Mode.date), DateTimeValue.fromDateTime(datetime(2022, 12, 24), Mode.date)})
+[DateTimeValue(None, Mode.date), DateTimeValue(1671840000000, Mode.date)]
+"""
+__all__ = ["DateTimeValue"]
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional, Union
+
+from ClearableDateTimeEdit.Settings import Mode
+
+_EPOCH = datetime(1970, 1, 1)
+_MSEC = timedelta(milliseconds=1)
+_DAY_MSECS = 86400000
+# Julian day of 1970-01-01.
+_EPOCH_JULIAN_DAY = 2440588
+# Modes in the order of their values, the index of the mode is stored in the value.
+_MODES = (Mode.date, Mode.datetime, Mode.time)
+_MODE_INDEXES = {mode: index for index, mode in enumerate(_MODES)}
+
+
+class DateTimeValue(tuple):
+    """DateTimeValue is the immutable value of a DateTimeEdit, which is empty if it is null.
+
+    Notes:
+        The milliseconds are counted from 1970-01-01T00:00 in the time specification of the DateTimeEdit, i.e. in UTC
+        if a display time zone is set. Values of mode date are truncated to midnight and values of mode time are
+        counted from midnight, so they compare by date or time only. The value is a tuple of the not-null flag, the
+        milliseconds and the index of the mode, so it is compared, sorted and hashed without Python calls. Null values
+        are equal if their modes are and come before all other values when sorted.
+
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, msecs: Optional[int] = None, mode: Mode = Mode.datetime):
+        """Creates the value.
+
+        Args:
+            msecs (Optional[int], optional): Milliseconds since 1970-01-01T00:00, None for a null value.
+            mode (Mode, optional): Mode of the value.
+
+        """
+        if msecs is None:
+            return tuple.__new__(cls, (False, 0, _MODE_INDEXES[mode]))
+        if mode is Mode.date:
+            msecs -= msecs % _DAY_MSECS
+        elif mode is Mode.time:
+            msecs %= _DAY_MSECS
+        return tuple.__new__(cls, (True, msecs, _MODE_INDEXES[mode]))
+
+    @classmethod
+    def fromDateTime(cls, dt: Union[datetime, date, time, None], mode: Mode = Mode.datetime) -> "DateTimeValue":
+        """Creates the value of given datetime.
+
+        Args:
+            dt (Union[datetime, date, time, None]): Datetime, date at midnight, time on 1970-01-01 or None for a null
+                value. Aware datetimes are converted into UTC.
+            mode (Mode, optional): Mode of the value.
+
+        Returns:
+            DateTimeValue: Value.
+
+        """
+        if dt is None:
+            return cls(None, mode)
+        if isinstance(dt, datetime):
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        elif isinstance(dt, date):
+            dt = datetime.combine(dt, time())
+        else:
+            dt = datetime.combine(_EPOCH, dt)
+        return cls((dt - _EPOCH) // _MSEC, mode)
+
+    @classmethod
+    def fromQDateTime(cls, dt, mode: Mode = Mode.datetime) -> "DateTimeValue":
+        """Creates the value of given QDateTime.
+
+        Args:
+            dt (Optional[QDateTime]): Datetime, its date and time are taken as they are. Invalid datetimes and None
+                give a null value.
+            mode (Mode, optional): Mode of the value.
+
+        Returns:
+            DateTimeValue: Value.
+
+        """
+        if dt is None or not dt.isValid():
+            return cls(None, mode)
+        days = dt.date().toJulianDay() - _EPOCH_JULIAN_DAY
+        return cls(days * _DAY_MSECS + dt.time().msecsSinceStartOfDay(), mode)
+
+    def isNull(self) -> bool:
+        """Whether the value is empty.
+
+        Returns:
+            bool: True if the value is null, False otherwise.
+
+        """
+        return not self[0]
+
+    def mode(self) -> Mode:
+        """Gets the mode of the value as enum "Mode".
+
+        Returns:
+            Mode: Mode of the value.
+
+        """
+        return _MODES[self[2]]
+
+    def msecsSinceEpoch(self) -> Optional[int]:
+        """Gets the milliseconds since 1970-01-01T00:00.
+
+        Returns:
+            Optional[int]: Milliseconds or None if the value is null.
+
+        """
+        return self[1] if self[0] else None
+
+    def toDateTime(self) -> Optional[datetime]:
+        """Converts the value into datetime.
+
+        Returns:
+            Optional[datetime]: Naive datetime or None if the value is null.
+
+        """
+        return _EPOCH + timedelta(milliseconds=self[1]) if self[0] else None
+
+    def toQDateTime(self, spec=None):
+        """Converts the value into QDateTime.
+
+        Args:
+            spec (Qt.TimeSpec, optional): Time specification of the QDateTime, local time if not given.
+
+        Returns:
+            QDateTime: Datetime, invalid if the value is null.
+
+        """
+        from PySide2.QtCore import QDate, QDateTime, Qt, QTime
+
+        if not self[0]:
+            return QDateTime()
+        days, msecs = divmod(self[1], _DAY_MSECS)
+        return QDateTime(
+            QDate.fromJulianDay(days + _EPOCH_JULIAN_DAY),
+            QTime.fromMSecsSinceStartOfDay(msecs),
+            Qt.LocalTime if spec is None else spec,
+        )
+
+    def __repr__(self) -> str:
+        return f"DateTimeValue({self.msecsSinceEpoch()}, {self.mode()})"
+
+    def __getnewargs__(self) -> tuple:
+        return self.msecsSinceEpoch(), self.mode()
@@ -3,62 +3,211 @@
 
 __all__ = ["ClearableDateTimeEdit"]
 
-from typing import Union
+from datetime import date, datetime, time
+from typing import Dict, Hashable, Iterable, Mapping, Optional, Tuple, Union
 
-from PySide2 import QtCore, QtGui
+from PySide2 import QtCore
 from PySide2.QtCore import QDate, QDateTime, Qt, QTime
-from PySide2.QtGui import QFocusEvent, QKeyEvent, QResizeEvent
+from PySide2.QtGui import QColor, QFocusEvent, QKeyEvent, QResizeEvent
 from PySide2.QtWidgets import (
     QCalendarWidget,
-    QDateTimeEdit,
     QLineEdit,
     QStyle,
     QToolButton,
 )
 
-from ClearableDateTimeEdit.popup import DateTimePopup, TimeWidget
+from ClearableDateTimeEdit import Arrays, Icons, Styles
+from ClearableDateTimeEdit.Core import DateTimeController, ValueChange
+from ClearableDateTimeEdit.Highlights import DateCategoryIndex
+from ClearableDateTimeEdit.Intervals import IntervalIndex
+from ClearableDateTimeEdit.popup import DateTimePopup, DateTimePopupPool, TimeWidget
 from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.TimeZones import TimeZone, timeZone
+from ClearableDateTimeEdit.Validators import DateTimeValidator, dateTimeValidator
+from ClearableDateTimeEdit.Values import DateTimeValue
+
+# Index without highlighted dates, shared by all DateTimeEdits without highlights.
+_NO_DATE_CATEGORIES = DateCategoryIndex()
 
 
 class ClearableDateTimeEdit(QLineEdit):
     """ClearableDateTimeEdit contains the implementation of the DateTimeEdit widget, with which date, datetime or time
-    can be selected or entered manually and also cleared again."""
-
-    dateChanged = QtCore.Signal(object)
-    dateTimeChanged = QtCore.Signal(object)
+    can be selected or entered manually and also cleared again.
+
+    Notes:
+        Display format, range and value are kept by a DateTimeController, which does not depend on Qt and can be used
+        to validate data the way the widget does it without a QApplication. Typed text is checked on every keystroke
+        by a DateTimeValidator shared by all DateTimeEdits with the same display format, range and mode, characters
+        which can not match the display format are rejected.
+
+        dateChanged, dateTimeChanged, editingFinished and timeChanged are sent when a value is committed in the line
+        edit or the pop-up. valueChanged(old, new, changedParts) is sent once for every change of the committed value,
+        also for changes made with setDate, setDateTime and setTime, with the previous and new datetime (None if
+        empty) and the changed parts as flags of enum "Core.Part". The typed overloads, e.g. dateTimeChanged[QDateTime]
+        and valueChanged[QDateTime, QDateTime, int], send an invalid QDateTime instead of None and can be delivered
+        across threads without wrapping Python objects. dateValueChanged, dateTimeValueChanged, timeValueChanged and
+        the overload valueChanged[DateTimeValue, DateTimeValue, int] send compact immutable values, which are null
+        instead of None.
+
+    """
+
+    dateChanged = QtCore.Signal((object,), (QDate,))
+    dateTimeChanged = QtCore.Signal((object,), (QDateTime,))
     editingFinished = QtCore.Signal(object)
-    timeChanged = QtCore.Signal(object)
+    timeChanged = QtCore.Signal((object,), (QTime,))
+    # PySide maps DateTimeValue to the signature of object, so the compact values have signals of their own.
+    dateValueChanged = QtCore.Signal(DateTimeValue)
+    dateTimeValueChanged = QtCore.Signal(DateTimeValue)
+    timeValueChanged = QtCore.Signal(DateTimeValue)
+    valueChanged = QtCore.Signal(
+        (object, object, object), (QDateTime, QDateTime, int), (DateTimeValue, DateTimeValue, int)
+    )
 
     def __init__(self, parent=None, mode: Mode = Mode.datetime):
         super(ClearableDateTimeEdit, self).__init__(parent)
         self.__mode = mode
         self.__showPopup = True
-        self.__popup = DateTimePopup(self.__mode, self)
-        self.__dateTimeText = ""
-        self.__dateTimeEdit = QDateTimeEdit()
-        self.__dateTimeEdit.setDisplayFormat(self.__popup.dtHelper.format)
+        self.__sharedPopup = False
+        # The pop-up is built on first use only, see __ensurePopup.
+        self.__popup = None
+        self.__controller = DateTimeController(self.__mode)
+        self.__timeSpec = Qt.LocalTime
+        # Time zone in which the UTC values are displayed and entered, only used in datetime mode.
+        self.__displayTimeZone: Optional[TimeZone] = None
+        # Steps of the time lists in the pop-up, milliseconds are entered in a line edit with step 0.
+        self.__timeSteps = {"hour": 1, "minute": 1, "second": 1, "msec": 0}
+        # Highlighted dates of the calendar, the index is immutable and may be shared with other DateTimeEdits.
+        self.__dateCategories = _NO_DATE_CATEGORIES
+        self.__categoryColors: Dict[Hashable, QColor] = {}
+        self.__coalesceChanges = False
+        self.__flushTimer = None
+        # Change pending until the next event loop turn while changes are coalesced.
+        self.__pendingChange: Optional[ValueChange] = None
+        # Validator shared with the DateTimeEdits of the same format and range, see __updateValidator.
+        self.__validator: Optional[DateTimeValidator] = None
+        self.__updateValidator()
         self.__popupBtn = QToolButton(self)
         self.__initUi()
 
     def __initUi(self):
         """Performs ui settings."""
-        self.__popupBtn.setStyleSheet("border: 0px; padding: 0px;")
+        self.__popupBtn.setStyle(Styles.popupButtonStyle())
         self.__popupBtn.setCursor(QtCore.Qt.ArrowCursor)
-        self.__popupBtn.setIcon(QtGui.QIcon(self.__popup.dtHelper.icon))
+        self.__popupBtn.setIcon(Icons.icon(self.__mode, self.__popupBtn.iconSize(), self.devicePixelRatioF()))
+        self.__popupBtn.clicked.connect(self.__openCalendar)
         self.setCalendarPopup(self.__showPopup)
 
         frameWidth = self.style().pixelMetric(QStyle.PM_DefaultFrameWidth)
         buttonSize = self.__popupBtn.sizeHint()
 
-        self.setStyleSheet("QLineEdit {padding-right: %dpx; }" % (buttonSize.width() + frameWidth + 1))
+        # Text margins keep the text clear of the button without the style sheet polish of every DateTimeEdit.
+        self.setTextMargins(0, 0, buttonSize.width() + frameWidth + 1, 0)
         self.setMinimumSize(
             max(self.minimumSizeHint().width(), buttonSize.width() + frameWidth * 2 + 2),
             max(self.minimumSizeHint().height(), buttonSize.height() + frameWidth * 2 + 2),
         )
-        self.__popup.ui.submitButton.clicked.connect(self.__submit)
-        self.__popup.ui.cancelButton.clicked.connect(self.__close)
-        self.__popup.ui.nowButton.clicked.connect(self.__setToday)
-        self.__popup.ui.clearButton.clicked.connect(self.__clear)
+
+    def __updateValidator(self):
+        """Attaches the validator of the current display format and range, which checks the text on every keystroke."""
+        validator = dateTimeValidator(
+            self.__controller.displayFormat(),
+            self.__controller.minimumDateTime(),
+            self.__controller.maximumDateTime(),
+            self.__mode,
+        )
+        if validator is not self.__validator:
+            self.__validator = validator
+            self.setValidator(self.__validator)
+
+    def __ensurePopup(self) -> DateTimePopup:
+        """Builds the calendar pop-up on first use and loads the current format, ranges and value into it.
+
+        Returns:
+            DateTimePopup: Calendar pop-up of the DateTimeEdit.
+
+        """
+        if self.__sharedPopup:
+            popup = DateTimePopupPool.instance().acquire(
+                self.__mode, self, self.__submit, self.__close, self.__setToday, self.__clear
+            )
+            self.__loadPopup(popup)
+            return popup
+        if self.__popup is None:
+            self.__popup = DateTimePopup(self.__mode, self)
+            self.__loadPopup(self.__popup)
+            self.__popup.initUi()
+            self.__popup.ui.submitButton.clicked.connect(self.__submit)
+            self.__popup.ui.cancelButton.clicked.connect(self.__close)
+            self.__popup.ui.nowButton.clicked.connect(self.__setToday)
+            self.__popup.ui.clearButton.clicked.connect(self.__clear)
+        return self.__popup
+
+    def __loadPopup(self, popup: DateTimePopup):
+        """Loads the format, ranges and current value of the DateTimeEdit into given pop-up.
+
+        Args:
+            popup (DateTimePopup): Calendar pop-up.
+
+        """
+        popup.dtHelper.format = self.__controller.displayFormat()
+        popup.timeWidget.setHourStep(self.__timeSteps["hour"])
+        popup.timeWidget.setMinuteStep(self.__timeSteps["minute"])
+        popup.timeWidget.setSecondStep(self.__timeSteps["second"])
+        popup.timeWidget.setMsecStep(self.__timeSteps["msec"])
+        self.__loadRange(popup)
+        popup.setDateCategories(self.__dateCategories, self.__categoryColors)
+        popup.calendarWidget.setDisabledIntervals(self.__controller.disabledIntervals())
+        if self.text():
+            current = self.__toWallDateTime(self.__controller.current())
+            popup.calendarWidget.setSelectedDate(current.date())
+            popup.timeWidget.setTime(current.time())
+        else:
+            popup.reset()
+
+    def __loadRange(self, popup: DateTimePopup):
+        """Loads the range of the DateTimeEdit into given pop-up, which shows wall times like the line edit.
+
+        Args:
+            popup (DateTimePopup): Calendar pop-up.
+
+        """
+        popup.calendarWidget.setDateRange(
+            self.__toQDate(self.__controller.minimumDate()), self.__toQDate(self.__controller.maximumDate())
+        )
+        if self.__mode == Mode.time:
+            minimum_time = self.__toQTime(self.__controller.minimumTime())
+            maximum_time = self.__toQTime(self.__controller.maximumTime())
+        else:
+            # Like in QDateTimeEdit, the times only bound the first and the last day in date and datetime mode.
+            minimum_time, maximum_time = QTime(0, 0), QTime(23, 59, 59, 999)
+        if popup.timeWidget.minimumTime() != minimum_time:
+            popup.timeWidget.setMinimumTime(minimum_time)
+        if popup.timeWidget.maximumTime() != maximum_time:
+            popup.timeWidget.setMaximumTime(maximum_time)
+
+    def __currentPopup(self) -> DateTimePopup:
+        """Gets the pop-up currently used by the DateTimeEdit without loading its data into it.
+
+        Returns:
+            DateTimePopup: Private or shared calendar pop-up.
+
+        """
+        if self.__sharedPopup:
+            return DateTimePopupPool.instance().popup(self.__mode)
+        return self.__popup
+
+    def __loadedPopup(self) -> Optional[DateTimePopup]:
+        """Gets the pop-up holding the data of the DateTimeEdit, i.e. its private pop-up or the shared pop-up if the
+        DateTimeEdit acquired it last.
+
+        Returns:
+            Optional[DateTimePopup]: Calendar pop-up or None if no pop-up holds the data.
+
+        """
+        if self.__sharedPopup:
+            pool = DateTimePopupPool.instance()
+            return pool.popup(self.__mode) if pool.owner(self.__mode) is self else None
+        return self.__popup
 
     def resizeEvent(self, event: QResizeEvent):
         """Moves pop-up button to the right place during the resize event.
@@ -77,60 +226,252 @@ class ClearableDateTimeEdit(QLineEdit):
 
     def __openCalendar(self):
         """Moves the custom calendar widget to the left side of LineEdit and shows it."""
+        popup = self.__ensurePopup()
         point = self.rect().bottomRight()
         global_point = self.mapToGlobal(point)
-        self.__popup.move(global_point - QtCore.QPoint(self.width(), 0))
-        self.__popup.show()
+        popup.move(global_point - QtCore.QPoint(self.width(), 0))
+        popup.show()
 
     def __clear(self):
         """Removes the data entered in the LineEdit."""
+        old_dt = self.__controller.value()
         self.clear()
-        self.__popup.reset()
-        self.__popup.close()
-        self.__dateTimeText = ""
-        self.dateTimeChanged.emit(None)
+        popup = self.__currentPopup()
+        popup.reset()
+        popup.close()
+        self.__emitDateTimeChanged(None)
+        self.__notifyValueChange(ValueChange(old_dt, None))
 
     def __setToday(self):
         """Sets today's date/time in the LineEdit."""
-        self.__popup.setToday()
+        self.__currentPopup().setToday()
         self.__submit()
 
     def __submit(self):
         """Validates the date/time selected in the calendar, inserts it into the LineEdit and closes the calendar
         widget.
         """
-        dt = self.__popup.dtHelper.getDateTime()
-        dt_text = dt.toString(self.__popup.dtHelper.format)
-        is_valid = self.__dateTimeEdit.validate(dt_text, 0)
-        if is_valid[0] == QtGui.QValidator.State.Invalid:
+        popup = self.__currentPopup()
+        dt = popup.dtHelper.getDateTime()
+        # The selection is restricted to the display format without formatting and parsing it.
+        new_dt = self.__controller.fit(self.__selectedDateTime(dt))
+        if new_dt is None:
             dt_type = str(type(dt)).split("'")[1]
-            raise ValueError(f"'{self.__popup.dtHelper.format}' is not acceptable format for '{dt_type}'")
-        self.setText(dt_text)
-        self.__popup.close()
-        self.__dateTimeEdit.setDateTime(self.__dateTimeEdit.dateTimeFromText(dt_text))
-        self.dateTimeChanged.emit(self.__dateTimeEdit.dateTime())
-        self.__checkAndSendSignal(
-            self.__dateTimeEdit.dateTimeFromText(self.__dateTimeText), self.__dateTimeEdit.dateTime()
-        )
-        self.__dateTimeText = dt_text
+            raise ValueError(f"'{self.__controller.displayFormat()}' is not acceptable format for '{dt_type}'")
+        if not self.__controller.accepts(self.__controller.bound(new_dt)):
+            # The pop-up stays open, so that another value can be selected.
+            return
+        change = self.__controller.setValue(new_dt)
+        self.setText(self.__controller.text())
+        popup.close()
+        self.__emitDateTimeChanged(self.__toQDateTime(change.new))
+        self.__checkAndSendSignal(change)
+        self.__notifyValueChange(change)
+
+    def __selectedDateTime(self, value: Union[QDate, QDateTime, QTime]) -> datetime:
+        """Converts the date, time or datetime selected in the calendar pop-up into datetime, the missing date or time
+        is taken from the current datetime.
+
+        Args:
+            value (Union[QDate, QDateTime, QTime]): Selected date, time or datetime.
+
+        Returns:
+            datetime: Selected datetime.
+
+        """
+        current = self.__controller.current()
+        if isinstance(value, QDate):
+            return datetime.combine(value.toPython(), current.time())
+        if isinstance(value, QTime):
+            return datetime.combine(current.date(), value.toPython())
+        # The pop-up shows the wall time of the display time zone.
+        return datetime.combine(value.date().toPython(), value.time().toPython())
 
     def __close(self):
         """Closes the calendar widget."""
-        self.__popup.hide()
+        self.__currentPopup().hide()
+
+    def __checkAndSendSignal(self, change: ValueChange):
+        """Sends a signal with the new date if the committed date has changed. Sends a signal with the new time if the
+        committed time has changed.
+
+        Args:
+            change (ValueChange): Previous and new committed datetime.
+
+        """
+        if change.new is None:
+            return
+        # The dates and times are compared in UTC if a display time zone is set, like date and time return them.
+        old = self.__toPublicDateTime(change.old) if change.old is not None else None
+        new = self.__toPublicDateTime(change.new)
+        if old is None or old.date() != new.date():
+            new_date = self.__toQDate(new)
+            self.dateChanged.emit(new_date)
+            self.dateChanged[QDate].emit(new_date)
+            self.dateValueChanged.emit(DateTimeValue.fromDateTime(new, Mode.date))
+        if old is None or old.time() != new.time():
+            new_time = self.__toQTime(new)
+            self.timeChanged.emit(new_time)
+            self.timeChanged[QTime].emit(new_time)
+            self.timeValueChanged.emit(DateTimeValue.fromDateTime(new, Mode.time))
+
+    def __emitDateTimeChanged(self, dt: Optional[QDateTime]):
+        """Sends the committed datetime with all overloads of dateTimeChanged and with dateTimeValueChanged.
+
+        Args:
+            dt (Optional[QDateTime]): Committed datetime or None if the DateTimeEdit has been cleared.
+
+        """
+        self.dateTimeChanged.emit(dt)
+        self.dateTimeChanged[QDateTime].emit(dt if dt is not None else QDateTime())
+        self.dateTimeValueChanged.emit(DateTimeValue.fromQDateTime(dt, self.__mode))
+
+    def __notifyValueChange(self, change: ValueChange, deferrable: bool = False):
+        """Sends valueChanged for given change, changes made by setters are deferred to the next event loop turn if
+        changes are coalesced.
+
+        Args:
+            change (ValueChange): Previous and new committed datetime.
+            deferrable (bool, optional): Flag for changes which may be coalesced.
 
-    def __checkAndSendSignal(self, old_dt: QDateTime, new_dt: QDateTime):
-        """Sends a signal with a date if the date of the DateTime parameter passed is different. Sends a signal with
-        time if the time of the DateTime parameter is different.
+        """
+        if self.__pendingChange is not None:
+            change = ValueChange(self.__pendingChange.old, change.new)
+        if deferrable and self.__coalesceChanges:
+            if self.__pendingChange is None:
+                self.__flushTimer.start()
+            self.__pendingChange = change
+            return
+        self.__pendingChange = None
+        self.__emitValueChanged(change)
+
+    def __flushValueChange(self):
+        """Sends valueChanged for the change pending since the first coalesced change."""
+        if self.__pendingChange is not None:
+            change = ValueChange(self.__pendingChange.old, self.__controller.value())
+            self.__pendingChange = None
+            self.__emitValueChanged(change)
+
+    def __emitValueChanged(self, change: ValueChange):
+        """Sends given change with all overloads of valueChanged if the value has changed.
 
         Args:
-            old_dt (QDateTime): First QDateTime.
-            new_dt (QDateTime): Second QDateTime.
+            change (ValueChange): Previous and new committed datetime.
 
         """
-        if old_dt.date() != new_dt.date():
-            self.dateChanged.emit(new_dt.date())
-        if old_dt.time() != new_dt.time():
-            self.timeChanged.emit(new_dt.time())
+        if not change.changed:
+            return
+        old_dt = self.__toQDateTime(change.old) if change.old is not None else None
+        new_dt = self.__toQDateTime(change.new) if change.new is not None else None
+        parts = change.changedParts
+        self.valueChanged.emit(old_dt, new_dt, parts)
+        self.valueChanged[QDateTime, QDateTime, int].emit(
+            old_dt if old_dt is not None else QDateTime(), new_dt if new_dt is not None else QDateTime(), int(parts)
+        )
+        self.valueChanged[DateTimeValue, DateTimeValue, int].emit(
+            DateTimeValue.fromQDateTime(old_dt, self.__mode),
+            DateTimeValue.fromQDateTime(new_dt, self.__mode),
+            int(parts),
+        )
+
+    def __toQDateTime(self, dt: datetime) -> QDateTime:
+        """Converts given datetime into QDateTime with the time specification of the DateTimeEdit.
+
+        Args:
+            dt (datetime): Datetime, the wall time of the display time zone if one is set.
+
+        Returns:
+            QDateTime: Datetime as QDateTime, in UTC if a display time zone is set.
+
+        """
+        zone = self.__controller.timeZone()
+        if zone is not None:
+            utc = zone.toUtc(dt)
+            return QDateTime(self.__toQDate(utc), self.__toQTime(utc), Qt.UTC)
+        return QDateTime(self.__toQDate(dt), self.__toQTime(dt), self.__timeSpec)
+
+    def __toWallDateTime(self, dt: datetime) -> QDateTime:
+        """Converts given datetime into QDateTime without conversion into UTC, as shown in the line edit and pop-up.
+
+        Args:
+            dt (datetime): Datetime.
+
+        Returns:
+            QDateTime: Datetime as QDateTime.
+
+        """
+        return QDateTime(self.__toQDate(dt), self.__toQTime(dt), self.__timeSpec)
+
+    def __toPublicDateTime(self, dt: datetime) -> datetime:
+        """Converts given wall time into the datetime whose parts are returned by the getters and sent by the signals.
+
+        Args:
+            dt (datetime): Datetime, the wall time of the display time zone if one is set.
+
+        Returns:
+            datetime: Datetime without time zone, in UTC if a display time zone is set.
+
+        """
+        zone = self.__controller.timeZone()
+        return zone.toUtc(dt) if zone is not None else dt
+
+    def __fromPublicDateTime(self, dt: datetime) -> datetime:
+        """Converts given datetime, e.g. combined from the date or time passed to a setter, into wall time.
+
+        Args:
+            dt (datetime): Datetime without time zone, in UTC if a display time zone is set.
+
+        Returns:
+            datetime: Datetime, the wall time of the display time zone if one is set.
+
+        """
+        zone = self.__controller.timeZone()
+        return zone.toLocal(dt) if zone is not None else dt
+
+    @staticmethod
+    def __toQDate(d: Union[date, datetime]) -> QDate:
+        """Converts given date or the date of given datetime into QDate.
+
+        Args:
+            d (Union[date, datetime]): Date or datetime.
+
+        Returns:
+            QDate: Date as QDate.
+
+        """
+        return QDate(d.year, d.month, d.day)
+
+    @staticmethod
+    def __toQTime(t: Union[time, datetime]) -> QTime:
+        """Converts given time or the time of given datetime into QTime.
+
+        Args:
+            t (Union[time, datetime]): Time or datetime.
+
+        Returns:
+            QTime: Time as QTime.
+
+        """
+        return QTime(t.hour, t.minute, t.second, t.microsecond // 1000)
+
+    def __fromQDateTime(self, dt: QDateTime) -> datetime:
+        """Converts given QDateTime into datetime in the time specification of the DateTimeEdit.
+
+        Args:
+            dt (QDateTime): Datetime.
+
+        Returns:
+            datetime: Datetime without time zone, the wall time of the display time zone if one is set.
+
+        """
+        zone = self.__controller.timeZone()
+        if zone is not None:
+            if dt.timeSpec() != Qt.UTC:
+                dt = dt.toUTC()
+            return zone.toLocal(datetime.combine(dt.date().toPython(), dt.time().toPython()))
+        if dt.timeSpec() != self.__timeSpec:
+            dt = dt.toTimeSpec(self.__timeSpec)
+        return datetime.combine(dt.date().toPython(), dt.time().toPython())
 
     def focusOutEvent(self, event: QFocusEvent):
         """Takes over the entries in LineEdit when the focus is lost if the entries have been changed.
@@ -139,8 +480,7 @@ class ClearableDateTimeEdit(QLineEdit):
             event (QFocusEvent): QFocusEvent.
 
         """
-        if self.text() != self.__dateTimeText:
-            self.__editingFinished()
+        self.interpretText()
         super(ClearableDateTimeEdit, self).focusOutEvent(event)
 
     def keyPressEvent(self, event: QKeyEvent):
@@ -158,22 +498,47 @@ class ClearableDateTimeEdit(QLineEdit):
         """Takes over the entries in LineEdit."""
         if not self.text():
             self.editingFinished.emit(None)
-            self.__dateTimeText = ""
+            self.__notifyValueChange(self.__controller.clear())
         else:
-            dt_valid = self.__dateTimeEdit.validate(self.text(), 0)
-            if dt_valid[0] in [QtGui.QValidator.State.Acceptable, QtGui.QValidator.State.Intermediate]:
-                fixed_dt = self.__dateTimeEdit.fixup(dt_valid[1])
-                if self.__popup.dtHelper.tryConvertDatetime(fixed_dt):
-                    dt = self.__dateTimeEdit.dateTimeFromText(fixed_dt)
-                    self.__dateTimeEdit.setDateTime(dt)
-                    self.__popup.dtHelper.setDateTime(dt)
-                    self.editingFinished.emit(self.__popup.dtHelper.getDateTime())
-                    self.dateTimeChanged.emit(dt)
-                    self.__checkAndSendSignal(
-                        self.__dateTimeEdit.dateTimeFromText(self.__dateTimeText), self.__dateTimeEdit.dateTime()
-                    )
-                    self.__dateTimeText = fixed_dt
-            self.setText(self.__dateTimeText)
+            # Values out of range are moved into the range by the controller.
+            change = self.__controller.commitText(self.text())
+            if change is not None:
+                dt = self.__toQDateTime(change.new)
+                if self.__popup is not None:
+                    self.__popup.dtHelper.setDateTime(self.__toWallDateTime(change.new))
+                self.editingFinished.emit(self.__modeValue(dt))
+                self.__emitDateTimeChanged(dt)
+                self.__checkAndSendSignal(change)
+                self.__notifyValueChange(change)
+            self.setText(self.__controller.text())
+
+    def __modeValue(self, dt: QDateTime) -> Union[QDate, QDateTime, QTime]:
+        """Converts given datetime into the value selectable in the calendar pop-up depending on the mode of the
+        DateTimeEdit.
+
+        Args:
+            dt (QDateTime): Datetime.
+
+        Returns:
+            Union[QDate, QDateTime, QTime]: Date, time or datetime with seconds precision.
+
+        """
+        time = QTime(dt.time().hour(), dt.time().minute(), dt.time().second())
+        if self.__mode == Mode.date:
+            return dt.date()
+        if self.__mode == Mode.time:
+            return time
+        return QDateTime(dt.date(), time, dt.timeSpec())
+
+    def clear(self):
+        """Clears the line edit and the selected date/time without sending any signal."""
+        super(ClearableDateTimeEdit, self).clear()
+        self.__controller.clear()
+
+    def interpretText(self):
+        """Takes over the entries in LineEdit if they have been changed since the last commit."""
+        if self.text() != self.__controller.text():
+            self.__editingFinished()
 
     def timeWidget(self) -> TimeWidget:
         """Returns the time widget used in pop-up.
@@ -182,7 +547,7 @@ class ClearableDateTimeEdit(QLineEdit):
             Time widget used in pop-up.
 
         """
-        return self.__popup.ui.timeWidget
+        return self.__ensurePopup().ui.timeWidget
 
     def calendar(self):
         raise NotImplementedError("Not implemented yet")
@@ -203,43 +568,61 @@ class ClearableDateTimeEdit(QLineEdit):
             Calendar widget used in calendar pop-up.
 
         """
-        return self.__popup.calendarWidget
+        return self.__ensurePopup().calendarWidget
+
+    def categoryColor(self, category: Hashable) -> Optional[QColor]:
+        """Gets the background color of the dates of given category in the calendar.
+
+        Args:
+            category (Hashable): Category.
+
+        Returns:
+            Optional[QColor]: Color or None if the default color is used.
+
+        """
+        return self.__categoryColors.get(category)
 
     def clearMaximumDate(self):
         """Resets maximum date in calendar widget."""
-        self.__dateTimeEdit.clearMaximumDate()
-        max_date = self.__dateTimeEdit.maximumDate()
-        self.__popup.calendarWidget.setMaximumDate(max_date)
+        self.__controller.clearMaximumDate()
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def clearMaximumDateTime(self):
         """Resets maximum date in calendar widget and maximum time in time widget."""
-        self.__dateTimeEdit.clearMaximumDateTime()
-        max_date = self.__dateTimeEdit.maximumDate()
-        self.__popup.calendarWidget.setMaximumDate(max_date)
-        self.__popup.timeWidget.clearMaximumTime()
+        self.__controller.clearMaximumDateTime()
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def clearMaximumTime(self):
         """Resets maximum time in time widget."""
-        self.__dateTimeEdit.clearMaximumTime()
-        self.__popup.timeWidget.clearMaximumTime()
+        self.__controller.clearMaximumTime()
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def clearMinimumDate(self):
         """Resets minimum date in calendar widget."""
-        self.__dateTimeEdit.clearMinimumDate()
-        min_date = self.__dateTimeEdit.minimumDate()
-        self.__popup.calendarWidget.setMinimumDate(min_date)
+        self.__controller.clearMinimumDate()
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def clearMinimumDateTime(self):
         """Resets minimum date in calendar widget and minimum time in time widget."""
-        self.__dateTimeEdit.clearMinimumDateTime()
-        min_date = self.__dateTimeEdit.maximumDate()
-        self.__popup.calendarWidget.setMinimumDate(min_date)
-        self.__popup.timeWidget.clearMinimumTime()
+        self.__controller.clearMinimumDateTime()
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def clearMinimumTime(self):
         """Resets minimum time in time widget."""
-        self.__dateTimeEdit.clearMinimumTime()
-        self.__popup.timeWidget.clearMinimumTime()
+        self.__controller.clearMinimumTime()
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def currentSection(self):
         raise NotImplementedError("Not implemented yet")
@@ -254,10 +637,19 @@ class ClearableDateTimeEdit(QLineEdit):
             Union[QDate, None]: Current selected date or None if line edit is empty.
 
         """
-        if not self.__dateTimeText:
+        if self.__controller.isEmpty():
             return None
         else:
-            return self.__dateTimeEdit.date()
+            return self.__toQDate(self.__toPublicDateTime(self.__controller.value()))
+
+    def dateCategories(self) -> DateCategoryIndex:
+        """Gets the index of the dates highlighted in the calendar.
+
+        Returns:
+            DateCategoryIndex: Index of the highlighted dates.
+
+        """
+        return self.__dateCategories
 
     def dateTime(self) -> Union[QDateTime, None]:
         """Gets current selected datetime or None if LineEdit is empty.
@@ -266,10 +658,28 @@ class ClearableDateTimeEdit(QLineEdit):
             Union[QDateTime, None]: Current selected datetime or None if LineEdit is empty.
 
         """
-        if not self.__dateTimeText:
+        if self.__controller.isEmpty():
             return None
         else:
-            return self.__dateTimeEdit.dateTime()
+            return self.__toQDateTime(self.__controller.value())
+
+    def disabledIntervals(self) -> IntervalIndex:
+        """Gets the disabled intervals.
+
+        Returns:
+            IntervalIndex: Index of the disabled intervals.
+
+        """
+        return self.__controller.disabledIntervals()
+
+    def displayTimeZone(self) -> Optional[str]:
+        """Gets the IANA key of the time zone in which the values are displayed and entered.
+
+        Returns:
+            Optional[str]: IANA key or None if the values are displayed in their time specification.
+
+        """
+        return self.__displayTimeZone.key() if self.__displayTimeZone is not None else None
 
     def displayFormat(self) -> str:
         """Gets current display format.
@@ -278,7 +688,7 @@ class ClearableDateTimeEdit(QLineEdit):
             String: Current display format.
 
         """
-        return self.__popup.dtHelper.format
+        return self.__controller.displayFormat()
 
     def dateTimeFromText(self, text: str) -> QDateTime:
         """Converts given text in QDateTime.
@@ -301,11 +711,36 @@ class ClearableDateTimeEdit(QLineEdit):
                 Supported signatures:\n\t
                 DateTimeEdit.dateTimeFromText(str)"""
             )
-        return self.__dateTimeEdit.dateTimeFromText(text)
+        dt = self.__controller.parse(text)
+        return self.__toQDateTime(dt) if dt is not None else QDateTime()
 
     def displayedSections(self):
         raise NotImplementedError("Not implemented yet")
 
+    def formatMany(self, values):
+        """Converts datetimes into texts in the current display format.
+
+        Args:
+            values: NumPy datetime64 array or list of datetimes, NaT values are converted into empty strings.
+
+        Raises:
+            ImportError if NumPy is not installed.
+
+        Returns:
+            NumPy unicode array of texts.
+
+        """
+        return Arrays.formatMany(values, self.__controller.displayFormat())
+
+    def hourStep(self) -> int:
+        """Gets the step between the hours in the time widget.
+
+        Returns:
+            int: Step in hours.
+
+        """
+        return self.__timeSteps["hour"]
+
     def maximumDate(self) -> QDate:
         """Gets maximum date as QDate.
 
@@ -313,7 +748,7 @@ class ClearableDateTimeEdit(QLineEdit):
             QDate: Maximum date.
 
         """
-        return self.__popup.calendarWidget.maximumDate()
+        return self.__toQDate(self.__toPublicDateTime(self.__controller.maximumDateTime()))
 
     def maximumDateTime(self) -> QDateTime:
         """Gets maximum datetime as QDateTime.
@@ -322,7 +757,7 @@ class ClearableDateTimeEdit(QLineEdit):
             QDateTime: Maximum datetime.
 
         """
-        return self.__dateTimeEdit.maximumDateTime()
+        return self.__toQDateTime(self.__controller.maximumDateTime())
 
     def maximumTime(self) -> QTime:
         """Gets maximum time as QTime.
@@ -331,7 +766,7 @@ class ClearableDateTimeEdit(QLineEdit):
             QTime: Maximum time.
 
         """
-        return self.__popup.timeWidget.maximumTime()
+        return self.__toQTime(self.__toPublicDateTime(self.__controller.maximumDateTime()))
 
     def minimumDate(self) -> QDate:
         """Gets minimum date as QDate.
@@ -340,7 +775,7 @@ class ClearableDateTimeEdit(QLineEdit):
             QDate: Minimum date.
 
         """
-        return self.__popup.calendarWidget.minimumDate()
+        return self.__toQDate(self.__toPublicDateTime(self.__controller.minimumDateTime()))
 
     def minimumDateTime(self) -> QDateTime:
         """Gets minimum datetime as QDateTime.
@@ -349,7 +784,7 @@ class ClearableDateTimeEdit(QLineEdit):
             QDateTime: Minimum datetime.
 
         """
-        return self.__dateTimeEdit.minimumDateTime()
+        return self.__toQDateTime(self.__controller.minimumDateTime())
 
     def minimumTime(self) -> QTime:
         """Gets minimum time as QTime.
@@ -358,7 +793,16 @@ class ClearableDateTimeEdit(QLineEdit):
             QTime: Minimum time.
 
         """
-        return self.__popup.timeWidget.minimumTime()
+        return self.__toQTime(self.__toPublicDateTime(self.__controller.minimumDateTime()))
+
+    def minuteStep(self) -> int:
+        """Gets the step between the minutes in the time widget.
+
+        Returns:
+            int: Step in minutes.
+
+        """
+        return self.__timeSteps["minute"]
 
     def mode(self) -> Mode:
         """Gets current mode of DateTimeEdit as enum "Mode". Possible is Mode.date, Mode.datetime or Mode.time.
@@ -369,6 +813,39 @@ class ClearableDateTimeEdit(QLineEdit):
         """
         return self.__mode
 
+    def msecStep(self) -> int:
+        """Gets the step between the milliseconds in the time widget.
+
+        Returns:
+            int: Step in milliseconds, 0 if the milliseconds are entered in a line edit.
+
+        """
+        return self.__timeSteps["msec"]
+
+    def parseMany(self, texts):
+        """Converts texts in the current display format and mode into datetimes without changing the widget.
+
+        Args:
+            texts: List or NumPy array of texts.
+
+        Raises:
+            ImportError if NumPy is not installed.
+
+        Returns:
+            Tuple of a datetime64[ms] array, NaT for invalid texts, and a boolean array which is True for valid texts.
+
+        """
+        return Arrays.parseMany(texts, self.__controller.displayFormat(), self.__mode)
+
+    def secondStep(self) -> int:
+        """Gets the step between the seconds in the time widget.
+
+        Returns:
+            int: Step in seconds.
+
+        """
+        return self.__timeSteps["second"]
+
     def sectionAt(self, index):
         raise NotImplementedError("Not implemented yet")
 
@@ -391,11 +868,74 @@ class ClearableDateTimeEdit(QLineEdit):
         self.__showPopup = enable
         if self.__showPopup:
             self.__popupBtn.setEnabled(True)
-            self.__popup.initUi()
-            self.__popupBtn.clicked.connect(self.__openCalendar)
+            if self.__popup is not None:
+                self.__popup.initUi()
         else:
             self.__popupBtn.setEnabled(False)
 
+    def coalesceChanges(self) -> bool:
+        """Returns whether changes made by setDate, setDateTime and setTime are coalesced.
+
+        Returns:
+            True if valueChanged is sent once per event loop turn for changes made by setters, False otherwise.
+
+        """
+        return self.__coalesceChanges
+
+    def setCoalesceChanges(self, enable: bool):
+        """Enables coalescing of changes made by setDate, setDateTime and setTime.
+
+        Notes:
+            While coalescing is enabled, a burst of setter calls sends one valueChanged with the value before the
+            first and after the last call in the next event loop turn. Commits in the line edit or the pop-up send
+            pending changes at once. Disabling coalescing sends a pending change immediately.
+
+        Args:
+            enable (bool): Flag to enable coalescing.
+
+        """
+        self.__coalesceChanges = enable
+        if self.__coalesceChanges:
+            if self.__flushTimer is None:
+                self.__flushTimer = QtCore.QTimer(self)
+                self.__flushTimer.setSingleShot(True)
+                self.__flushTimer.setInterval(0)
+                self.__flushTimer.timeout.connect(self.__flushValueChange)
+        else:
+            self.__flushValueChange()
+
+    def popupShared(self) -> bool:
+        """Returns whether the calendar pop-up is shared with other DateTimeEdits of the same mode.
+
+        Returns:
+            True if the shared pop-up of the process-wide pool is used, False otherwise.
+
+        """
+        return self.__sharedPopup
+
+    def setPopupShared(self, enable: bool):
+        """Enables the use of the calendar pop-up shared by all DateTimeEdits of the same mode.
+
+        Notes:
+            The shared pop-up is loaded with the format, ranges and value of the DateTimeEdit every time it is opened.
+            Changes made to the widgets returned by calendarWidget() and timeWidget() affect all DateTimeEdits using
+            the shared pop-up of the same mode.
+
+        Args:
+            enable (bool): Flag to enable the shared pop-up. If flag is True, the pop-up of the process-wide pool is
+                used, otherwise the DateTimeEdit builds its own pop-up.
+
+        """
+        if enable == self.__sharedPopup:
+            return
+        self.__sharedPopup = enable
+        if self.__sharedPopup:
+            if self.__popup is not None:
+                self.__popup.deleteLater()
+                self.__popup = None
+        else:
+            DateTimePopupPool.instance().release(self.__mode, self)
+
     def setCalendarWidget(self, calendarWidget: QCalendarWidget):
         """Sets the given calendarWidget as the widget to be used for the calendar pop-up.
 
@@ -403,8 +943,23 @@ class ClearableDateTimeEdit(QLineEdit):
             calendarWidget (QCalendarWidget): QCalendarWidget.
 
         """
-        self.__dateTimeEdit.setCalendarWidget(calendarWidget)
-        self.__popup.calendarWidget = calendarWidget
+        self.__ensurePopup().calendarWidget = calendarWidget
+
+    def setCategoryColor(self, category: Hashable, color: Optional[QColor]):
+        """Sets the background color of the dates of given category in the calendar.
+
+        Args:
+            category (Hashable): Category.
+            color (Optional[QColor]): Color, None for the default color.
+
+        """
+        if color is None:
+            self.__categoryColors.pop(category, None)
+        else:
+            self.__categoryColors[category] = QColor(color)
+        popup = self.__loadedPopup()
+        if popup is not None:
+            popup.setDateCategories(self.__dateCategories, self.__categoryColors)
 
     def setCurrentSection(self, section):
         raise NotImplementedError("Not implemented yet")
@@ -430,9 +985,45 @@ class ClearableDateTimeEdit(QLineEdit):
                 Supported signatures:\n\t
                 DateTimeEdit.setDate(PySide2.QtCore.QDate)"""
             )
-        self.__dateTimeEdit.setDate(date)
-        self.__popup.calendarWidget.setSelectedDate(date)
-        self.setText(date.toString(self.__popup.dtHelper.format))
+        current = self.__toPublicDateTime(self.__controller.current())
+        change = self.__controller.setValue(
+            self.__fromPublicDateTime(datetime.combine(date.toPython(), current.time()))
+        )
+        if self.__popup is not None:
+            self.__popup.calendarWidget.setSelectedDate(self.__toQDate(self.__controller.value()))
+        self.setText(self.__controller.text())
+        self.__notifyValueChange(change, deferrable=True)
+
+    def setDateCategories(
+        self,
+        categories: Union[DateCategoryIndex, Mapping[Hashable, Iterable], None],
+        colors: Optional[Mapping[Hashable, QColor]] = None,
+    ):
+        """Replaces all dates highlighted in the calendar, e.g. holidays or booked days. The categories and colors are
+        kept by the DateTimeEdit and loaded into a shared pop-up when it is opened.
+
+        Args:
+            categories (Union[DateCategoryIndex, Mapping[Hashable, Iterable], None]): Index or dates, QDates and
+                (first, last) intervals by category, None removes all highlights. An index can be shared by many
+                DateTimeEdits.
+            colors (Optional[Mapping[Hashable, QColor]], optional): Background colors by category, which replace
+                the colors set before, the colors are kept if not given.
+
+        Raises:
+            TypeError if a date is neither date nor QDate.
+            ValueError if the first date of an interval is after the last one.
+
+        """
+        if categories is None:
+            categories = _NO_DATE_CATEGORIES
+        elif not isinstance(categories, DateCategoryIndex):
+            categories = DateCategoryIndex(categories)
+        self.__dateCategories = categories
+        if colors is not None:
+            self.__categoryColors = {category: QColor(color) for category, color in colors.items()}
+        popup = self.__loadedPopup()
+        if popup is not None:
+            popup.setDateCategories(self.__dateCategories, self.__categoryColors)
 
     def setDateRange(self, min: QDate, max: QDate):
         """Sets minimum and maximum dates.
@@ -482,10 +1073,14 @@ class ClearableDateTimeEdit(QLineEdit):
                 Supported signatures:\n\t
                 DateTimeEdit.setDateTime(PySide2.QtCore.QDateTime)"""
             )
-        self.__dateTimeEdit.setDateTime(dt)
-        self.__popup.calendarWidget.setSelectedDate(dt.date())
-        self.__popup.timeWidget.setTime(dt.time())
-        self.setText(dt.toString(self.__popup.dtHelper.format))
+        # Invalid datetimes are ignored like in QDateTimeEdit, the current datetime is committed instead.
+        change = self.__controller.setValue(self.__fromQDateTime(dt) if dt.isValid() else self.__controller.current())
+        if self.__popup is not None:
+            wall_dt = self.__toWallDateTime(self.__controller.value())
+            self.__popup.calendarWidget.setSelectedDate(wall_dt.date())
+            self.__popup.timeWidget.setTime(wall_dt.time())
+        self.setText(self.__controller.text())
+        self.__notifyValueChange(change, deferrable=True)
 
     def setDateTimeRange(self, min: QDateTime, max: QDateTime):
         """Sets minimum and maximum datetime.
@@ -517,6 +1112,58 @@ class ClearableDateTimeEdit(QLineEdit):
         self.setMinimumDateTime(min)
         self.setMaximumDateTime(max)
 
+    def setDisabledIntervals(self, intervals: Union[IntervalIndex, Iterable[Tuple], None]):
+        """Replaces the disabled intervals, e.g. closed periods or maintenance windows. Entered texts and values
+        selected in the pop-up are not committed if they lie in a disabled interval, the committed value is kept.
+
+        Args:
+            intervals (Union[IntervalIndex, Iterable[Tuple], None]): Index or (first, last) tuples of dates,
+                datetimes, QDates or QDateTimes including both bounds, dates stand for whole days. None enables all
+                datetimes. An index can be shared by many DateTimeEdits.
+
+        Raises:
+            TypeError if a bound is neither date nor datetime.
+            ValueError if an interval ends before it starts.
+
+        """
+        if intervals is not None and not isinstance(intervals, IntervalIndex):
+            intervals = IntervalIndex(intervals)
+        self.__controller.setDisabledIntervals(intervals)
+        if self.__popup is not None:
+            self.__popup.calendarWidget.setDisabledIntervals(self.__controller.disabledIntervals())
+
+    def setDisplayTimeZone(self, key: Optional[str]):
+        """Sets the time zone in which the values are displayed and entered in datetime mode, e.g. to store the values
+        in UTC and show them in the time zone of the user. The committed value is kept as wall time.
+
+        Notes:
+            With a display time zone, all getters, setters and signals use UTC, e.g. date and dateChanged give the
+            date of dateTime in UTC and setTime keeps the UTC date, the QDateTimes of the setters are converted from
+            their time specification. Only the line edit and the pop-up show wall times. Entered wall times which are
+            skipped when the clocks are put forward are not valid and repeated wall times are taken with their first
+            occurrence. Dates and times without date have no time zone, so the setting is not used in date and time
+            mode.
+
+        Args:
+            key (Optional[str]): IANA key, e.g. "Europe/Berlin", None to display the values in their time
+                specification.
+
+        Raises:
+            TypeError if given key is neither str nor None.
+            zoneinfo.ZoneInfoNotFoundError if the zone is not known.
+
+        """
+        if key is not None and not isinstance(key, str):
+            key_type = str(type(key)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeEdit.setDisplayTimeZone' called with wrong argument types:\n\t
+                DateTimeEdit.setDisplayTimeZone({key_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeEdit.setDisplayTimeZone(str)"""
+            )
+        self.__displayTimeZone = timeZone(key) if key is not None else None
+        self.__controller.setTimeZone(self.__displayTimeZone if self.__mode == Mode.datetime else None)
+
     def setDisplayFormat(self, format: str):
         """Sets the display format.
 
@@ -524,8 +1171,28 @@ class ClearableDateTimeEdit(QLineEdit):
             format (str): New display format.
 
         """
-        self.__dateTimeEdit.setDisplayFormat(format)
-        self.__popup.dtHelper.format = format
+        self.__controller.setDisplayFormat(format)
+        self.__updateValidator()
+        if not self.__controller.isEmpty():
+            self.setText(self.__controller.text())
+        if self.__popup is not None:
+            self.__popup.dtHelper.format = format
+
+    def setHourStep(self, step: int):
+        """Sets the step between the hours in the time widget.
+
+        Args:
+            step (int): Step in hours.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 1.
+
+        """
+        TimeWidget.checkStep("ClearableDateTimeEdit.setHourStep", step)
+        self.__timeSteps["hour"] = step
+        if self.__popup is not None:
+            self.__popup.timeWidget.setHourStep(step)
 
     def setMaximumDate(self, max: QDate):
         """Sets maximum date in calendar pop-up.
@@ -534,8 +1201,11 @@ class ClearableDateTimeEdit(QLineEdit):
             max (QDate): Maximum date as QDate.
 
         """
-        self.__dateTimeEdit.setMaximumDate(max)
-        self.__popup.calendarWidget.setMaximumDate(max)
+        bound = self.__toPublicDateTime(self.__controller.maximumDateTime())
+        self.__controller.setMaximumDateTime(self.__fromPublicDateTime(datetime.combine(max.toPython(), bound.time())))
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def setMaximumDateTime(self, dt: QDateTime):
         """Sets maximum date in calendar pop-up and maximum time in time widget.
@@ -544,9 +1214,10 @@ class ClearableDateTimeEdit(QLineEdit):
             dt (QDateTime): Maximum datetime as QDateTime.
 
         """
-        self.__dateTimeEdit.setMaximumDateTime(dt)
-        self.__popup.calendarWidget.setMaximumDate(dt.date())
-        self.__popup.timeWidget.setMaximumTime(dt.time())
+        self.__controller.setMaximumDateTime(self.__fromQDateTime(dt))
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def setMaximumTime(self, max: QTime):
         """Sets maximum time in time widget.
@@ -555,8 +1226,11 @@ class ClearableDateTimeEdit(QLineEdit):
             max (QTime): Maximum time as QTime.
 
         """
-        self.__dateTimeEdit.setMaximumTime(max)
-        self.__popup.timeWidget.setMaximumTime(max)
+        bound = self.__toPublicDateTime(self.__controller.maximumDateTime())
+        self.__controller.setMaximumDateTime(self.__fromPublicDateTime(datetime.combine(bound.date(), max.toPython())))
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def setMinimumDate(self, min: QDate):
         """Sets minimum date in calendar pop-up.
@@ -565,8 +1239,11 @@ class ClearableDateTimeEdit(QLineEdit):
             min (QDate): Minimum date as QDate.
 
         """
-        self.__dateTimeEdit.setMinimumDate(min)
-        self.__popup.calendarWidget.setMinimumDate(min)
+        bound = self.__toPublicDateTime(self.__controller.minimumDateTime())
+        self.__controller.setMinimumDateTime(self.__fromPublicDateTime(datetime.combine(min.toPython(), bound.time())))
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def setMinimumDateTime(self, dt: QDateTime):
         """Sets minimum date in calendar pop-up and minimum time in time widget.
@@ -575,9 +1252,10 @@ class ClearableDateTimeEdit(QLineEdit):
             dt (QDateTime): Minimum datetime as QDateTime.
 
         """
-        self.__dateTimeEdit.setMinimumDateTime(dt)
-        self.__popup.calendarWidget.setMinimumDate(dt.date())
-        self.__popup.timeWidget.setMinimumTime(dt.time())
+        self.__controller.setMinimumDateTime(self.__fromQDateTime(dt))
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
 
     def setMinimumTime(self, min: QTime):
         """Sets minimum time in time widget.
@@ -586,8 +1264,27 @@ class ClearableDateTimeEdit(QLineEdit):
             min (QTime): Minimum time as QTime.
 
         """
-        self.__dateTimeEdit.setMinimumTime(min)
-        self.__popup.timeWidget.setMinimumTime(min)
+        bound = self.__toPublicDateTime(self.__controller.minimumDateTime())
+        self.__controller.setMinimumDateTime(self.__fromPublicDateTime(datetime.combine(bound.date(), min.toPython())))
+        self.__updateValidator()
+        if self.__popup is not None:
+            self.__loadRange(self.__popup)
+
+    def setMinuteStep(self, step: int):
+        """Sets the step between the minutes in the time widget, e.g. 5 or 15 for scheduling.
+
+        Args:
+            step (int): Step in minutes.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 1.
+
+        """
+        TimeWidget.checkStep("ClearableDateTimeEdit.setMinuteStep", step)
+        self.__timeSteps["minute"] = step
+        if self.__popup is not None:
+            self.__popup.timeWidget.setMinuteStep(step)
 
     def setMode(self, mode: Mode):
         """Sets mode of DateTimeEdit. Possible is Mode.date, Mode.datetime or Mode.time.
@@ -607,15 +1304,58 @@ class ClearableDateTimeEdit(QLineEdit):
                 Supported signatures:\n\t
                 DateTimeEdit.setMode(Mode)"""
             )
+        if self.__sharedPopup:
+            DateTimePopupPool.instance().release(self.__mode, self)
         self.__mode = mode
-        self.__popup = DateTimePopup(self.__mode, self)
-        self.__popupBtn.setIcon(QtGui.QIcon(self.__popup.dtHelper.icon))
+        self.__controller.setMode(self.__mode)
+        self.__controller.setTimeZone(self.__displayTimeZone if self.__mode == Mode.datetime else None)
+        self.__updateValidator()
+        if self.__popup is not None:
+            # The pop-up is kept with its connections, only its helper is exchanged.
+            self.__popup.setMode(self.__mode)
+            self.__loadRange(self.__popup)
+        # The value is shown in the default format of the new mode.
+        self.setText(self.__controller.text())
+        self.__popupBtn.setIcon(Icons.icon(self.__mode, self.__popupBtn.iconSize(), self.devicePixelRatioF()))
+
+    def setMsecStep(self, step: int):
+        """Sets the step between the milliseconds in the time widget. With a step the milliseconds are selected in a
+        list, step 1 allows to select every millisecond.
+
+        Args:
+            step (int): Step in milliseconds, 0 for entering the milliseconds in a line edit.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 0.
+
+        """
+        TimeWidget.checkStep("ClearableDateTimeEdit.setMsecStep", step, 0)
+        self.__timeSteps["msec"] = step
+        if self.__popup is not None:
+            self.__popup.timeWidget.setMsecStep(step)
+
+    def setSecondStep(self, step: int):
+        """Sets the step between the seconds in the time widget.
+
+        Args:
+            step (int): Step in seconds.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 1.
+
+        """
+        TimeWidget.checkStep("ClearableDateTimeEdit.setSecondStep", step)
+        self.__timeSteps["second"] = step
+        if self.__popup is not None:
+            self.__popup.timeWidget.setSecondStep(step)
 
     def setSelectedSection(self, section):
         raise NotImplementedError("Not implemented yet")
 
     def setTime(self, time: QTime):
-        """Sets given time in time widget and line edit.
+        """Sets given time in time widget and line edit, moved to the nearest step of the time lists.
 
         Args:
             time (QTime): Given time.
@@ -632,9 +1372,21 @@ class ClearableDateTimeEdit(QLineEdit):
                 Supported signatures:\n\t
                 DateTimeEdit.setTime(PySide2.QtCore.QTime)"""
             )
-        self.__dateTimeEdit.setTime(time)
-        self.__popup.timeWidget.setTime(time)
-        self.setText(time.toString(self.__popup.dtHelper.format))
+        current = self.__toPublicDateTime(self.__controller.current())
+        dt = self.__fromPublicDateTime(datetime.combine(current.date(), time.toPython()))
+        # The wall time is snapped like in the time lists, so that the text, the value and the pop-up agree.
+        snapped = TimeWidget.snapToSteps(
+            self.__toQTime(dt),
+            self.__timeSteps["hour"],
+            self.__timeSteps["minute"],
+            self.__timeSteps["second"],
+            self.__timeSteps["msec"],
+        )
+        change = self.__controller.setValue(datetime.combine(dt.date(), snapped.toPython()))
+        if self.__popup is not None:
+            self.__popup.timeWidget.setTime(self.__toQTime(self.__controller.value()))
+        self.setText(self.__controller.text())
+        self.__notifyValueChange(change, deferrable=True)
 
     def setTimeRange(self, min: QTime, max: QTime):
         """Sets minimum and maximum time.
@@ -654,7 +1406,38 @@ class ClearableDateTimeEdit(QLineEdit):
             spec (Qt.TimeSpec): New time specification.
 
         """
-        self.__dateTimeEdit.setTimeSpec(spec)
+        self.__timeSpec = spec
+
+    def setValue(self, value: DateTimeValue):
+        """Sets given compact value like setDate, setDateTime or setTime depending on the mode of the value, a null
+        value clears the DateTimeEdit.
+
+        Args:
+            value (DateTimeValue): Given value, in UTC if a display time zone is set.
+
+        Raises:
+            TypeError if given value is not DateTimeValue.
+
+        """
+        if not isinstance(value, DateTimeValue):
+            value_type = str(type(value)).split("'")[1]
+            raise TypeError(
+                f"""'DateTimeEdit.setValue' called with wrong argument types:\n\t
+                DateTimeEdit.setValue({value_type})\n\t\t
+                Supported signatures:\n\t
+                DateTimeEdit.setValue(ClearableDateTimeEdit.Values.DateTimeValue)"""
+            )
+        if value.isNull():
+            super(ClearableDateTimeEdit, self).clear()
+            self.__notifyValueChange(self.__controller.clear(), deferrable=True)
+            return
+        dt = value.toQDateTime(Qt.UTC if self.__controller.timeZone() is not None else self.__timeSpec)
+        if value.mode() == Mode.date:
+            self.setDate(dt.date())
+        elif value.mode() == Mode.time:
+            self.setTime(dt.time())
+        else:
+            self.setDateTime(dt)
 
     def textFromDateTime(self, dt: QDateTime) -> str:
         """Converts given datetime in string.
@@ -666,7 +1449,7 @@ class ClearableDateTimeEdit(QLineEdit):
             Datetime as string.
 
         """
-        return self.__dateTimeEdit.textFromDateTime(dt)
+        return self.__controller.toText(self.__fromQDateTime(dt))
 
     def time(self) -> Union[QTime, None]:
         """Gets current selected time or None if line edit is empty.
@@ -675,10 +1458,10 @@ class ClearableDateTimeEdit(QLineEdit):
             Union[QTime, None]: Current selected time or None if LineEdit is empty.
 
         """
-        if not self.__dateTimeText:
+        if self.__controller.isEmpty():
             return None
         else:
-            return self.__dateTimeEdit.time()
+            return self.__toQTime(self.__toPublicDateTime(self.__controller.value()))
 
     def timeSpec(self) -> Qt.TimeSpec:
         """Returns the time specification of the datetime.
@@ -687,4 +1470,15 @@ class ClearableDateTimeEdit(QLineEdit):
             Qt.TimeSpec: Time specification.
 
         """
-        return self.__dateTimeEdit.timeSpec()
+        return self.__timeSpec
+
+    def value(self) -> DateTimeValue:
+        """Gets current selected value as compact immutable value, which is null if line edit is empty.
+
+        Returns:
+            DateTimeValue: Current selected value in the mode of the DateTimeEdit, in UTC if a display time zone is set.
+
+        """
+        if self.__controller.isEmpty():
+            return DateTimeValue(None, self.__mode)
+        return DateTimeValue.fromQDateTime(self.__toQDateTime(self.__controller.value()), self.__mode)
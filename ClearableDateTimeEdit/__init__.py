@@ -1,5 +1,42 @@
 # -*- coding: utf-8 -*-
+"""ClearableDateTimeEdit package, the submodules are imported on first access, so modules without Qt dependency like
+Core can be used without loading the Qt widgets."""
+import importlib
 
-from ClearableDateTimeEdit import Settings, Widgets
+__all__ = [
+    "Arrays",
+    "Binders",
+    "Core",
+    "Delegates",
+    "Formats",
+    "Highlights",
+    "Icons",
+    "Intervals",
+    "Labels",
+    "Models",
+    "Settings",
+    "Stats",
+    "Styles",
+    "TimeZones",
+    "Validators",
+    "Values",
+    "Widgets",
+]
 
-__all__ = ["Settings", "Widgets"]
+
+def __getattr__(name: str):
+    """Imports the submodule with given name on first access.
+
+    Args:
+        name (str): Name of the submodule.
+
+    Raises:
+        AttributeError if the package has no submodule with given name.
+
+    Returns:
+        Submodule.
+
+    """
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
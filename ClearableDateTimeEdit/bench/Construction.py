@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""This module measures the construction time of the DateTimeEdit widgets and of their calendar pop-ups.
+
+$ python -m ClearableDateTimeEdit.bench.Construction --count 1000
+"""
+__all__ = ["constructionTime", "main", "popupConstructionTime"]
+import argparse
+import gc
+import json
+import sys
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+from PySide2.QtWidgets import QApplication, QWidget
+
+from ClearableDateTimeEdit.popup import DateTimePopup
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+
+def _application() -> QApplication:
+    """Gets the running application or creates one.
+
+    Returns:
+        QApplication: Application.
+
+    """
+    return QApplication.instance() or QApplication([])
+
+
+def constructionTime(
+    mode: Mode,
+    count: int = 1000,
+    repeat: int = 3,
+    factory: Callable[[QWidget, Mode], QWidget] = ClearableDateTimeEdit,
+) -> Dict:
+    """Measures the time of constructing and polishing given number of DateTimeEdits in one window.
+
+    Args:
+        mode (Mode): Mode of the DateTimeEdits.
+        count (int, optional): Number of DateTimeEdits.
+        repeat (int, optional): Number of measurements, the fastest one is reported.
+        factory (Callable[[QWidget, Mode], QWidget], optional): Function creating a DateTimeEdit from parent and mode,
+            e.g. to measure a QDateTimeEdit for comparison.
+
+    Returns:
+        Dict: Total time in milliseconds and time per DateTimeEdit in microseconds.
+
+    """
+    _application()
+    best = None
+    for _ in range(repeat):
+        window = QWidget()
+        gc.collect()
+        start = time.perf_counter()
+        edits = [factory(window, mode) for _ in range(count)]
+        for edit in edits:
+            # The style is applied when a widget is shown the first time, it is part of the construction cost.
+            edit.ensurePolished()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        window.deleteLater()
+        del edits, window
+        QApplication.processEvents()
+    return {
+        "mode": mode.value,
+        "count": count,
+        "totalMs": round(best * 1000.0, 3),
+        "perWidgetUs": round(best * 1e6 / count, 3),
+    }
+
+
+def popupConstructionTime(mode: Mode, count: int = 100, repeat: int = 3) -> Dict:
+    """Measures the time of constructing and polishing given number of calendar pop-ups.
+
+    Args:
+        mode (Mode): Mode of the pop-ups.
+        count (int, optional): Number of pop-ups.
+        repeat (int, optional): Number of measurements, the fastest one is reported.
+
+    Returns:
+        Dict: Total time in milliseconds and time per pop-up in microseconds.
+
+    """
+    _application()
+    best = None
+    for _ in range(repeat):
+        window = QWidget()
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(count):
+            popup = DateTimePopup(mode, window)
+            popup.initUi()
+            for widget in popup.findChildren(QWidget):
+                widget.ensurePolished()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        window.deleteLater()
+        del window
+        QApplication.processEvents()
+    return {
+        "mode": mode.value,
+        "count": count,
+        "totalMs": round(best * 1000.0, 3),
+        "perPopupUs": round(best * 1e6 / count, 3),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Prints the construction times of the DateTimeEdits and pop-ups of all modes as JSON.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Command line arguments, sys.argv is used if not given.
+
+    """
+    parser = argparse.ArgumentParser(description="Construction time of the ClearableDateTimeEdit widgets.")
+    parser.add_argument("--count", type=int, default=1000, help="number of DateTimeEdits per mode")
+    parser.add_argument("--popups", type=int, default=100, help="number of pop-ups per mode")
+    parser.add_argument("--repeat", type=int, default=3, help="number of measurements")
+    args = parser.parse_args(argv)
+    results = {
+        "widgets": [constructionTime(mode, args.count, args.repeat) for mode in Mode],
+        "popups": [popupConstructionTime(mode, args.popups, args.repeat) for mode in Mode],
+    }
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
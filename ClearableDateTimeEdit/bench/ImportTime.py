@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""This module measures the import time of the package modules with the import time profile of Python.
+
+$ python -m ClearableDateTimeEdit.bench.ImportTime ClearableDateTimeEdit.Settings --profile 10
+"""
+__all__ = ["IMPORT_TARGETS", "ImportRecord", "importProfile", "importTime", "main"]
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+IMPORT_TARGETS = (
+    "ClearableDateTimeEdit",
+    "ClearableDateTimeEdit.Settings",
+    "ClearableDateTimeEdit.Core",
+    "ClearableDateTimeEdit.Widgets",
+)
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+
+class ImportRecord(NamedTuple):
+    """Line of the import time profile, times in microseconds."""
+
+    module: str
+    self: int
+    cumulative: int
+    depth: int
+
+
+def importProfile(statement: str) -> List[ImportRecord]:
+    """Runs given statement in a new interpreter with "-X importtime" and parses the recorded profile.
+
+    Args:
+        statement (str): Python statement, e.g. "import ClearableDateTimeEdit.Settings".
+
+    Raises:
+        subprocess.CalledProcessError if the statement fails.
+
+    Returns:
+        List[ImportRecord]: Imported modules in the order their import has finished.
+
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_PACKAGE_ROOT, env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    records = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            # Header line of the profile.
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def importTime(module: str, repeat: int = 5) -> Dict:
+    """Measures the time of importing given module in a new interpreter, modules imported at interpreter startup are
+    not counted.
+
+    Args:
+        module (str): Name of the module.
+        repeat (int, optional): Number of measurements, the fastest one is reported.
+
+    Returns:
+        Dict: Import time in milliseconds, number of imported modules and whether PySide2 has been imported.
+
+    """
+    startup = {record.module for record in importProfile("pass")}
+    best: Optional[List[ImportRecord]] = None
+    best_us = 0
+    for _ in range(repeat):
+        records = [record for record in importProfile(f"import {module}") if record.module not in startup]
+        total_us = sum(record.self for record in records)
+        if best is None or total_us < best_us:
+            best, best_us = records, total_us
+    return {
+        "module": module,
+        "importMs": round(best_us / 1000.0, 3),
+        "modules": len(best),
+        "qt": any(record.module.split(".")[0] == "PySide2" for record in best),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Prints the import times of given modules as JSON.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Command line arguments, sys.argv is used if not given.
+
+    """
+    parser = argparse.ArgumentParser(description="Import time of the ClearableDateTimeEdit modules.")
+    parser.add_argument("modules", nargs="*", default=list(IMPORT_TARGETS), help="modules to import")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements per module")
+    parser.add_argument("--profile", type=int, default=0, metavar="N", help="print the N slowest imports per module")
+    args = parser.parse_args(argv)
+    results = []
+    for module in args.modules:
+        result = importTime(module, args.repeat)
+        if args.profile:
+            records = sorted(importProfile(f"import {module}"), key=lambda record: record.self, reverse=True)
+            result["profile"] = [record._asdict() for record in records[: args.profile]]
+        results.append(result)
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
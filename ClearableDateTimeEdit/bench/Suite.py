@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""This module contains the benchmark suite of the DateTimeEdit, every figure is compared with a QDateTimeEdit of the
+same mode.
+
+$ python -m ClearableDateTimeEdit.bench --output results.json
+
+Notes:
+    The suite runs on the offscreen platform of Qt unless QT_QPA_PLATFORM is set. The memory per instance is measured
+    in a new interpreter for every mode, it is only available with psutil or on systems with /proc.
+"""
+__all__ = ["BENCHMARKS", "compare", "main", "residentMemory", "runSuite"]
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import PySide2
+from PySide2.QtCore import QDate, QDateTime, QEvent, QObject, QPoint, Qt, QTime
+from PySide2.QtTest import QTest
+from PySide2.QtWidgets import (
+    QApplication,
+    QDateTimeEdit,
+    QTimeEdit,
+    QToolButton,
+    QWidget,
+)
+
+from ClearableDateTimeEdit.bench.Construction import constructionTime
+from ClearableDateTimeEdit.bench.ImportTime import _PACKAGE_ROOT
+from ClearableDateTimeEdit.Core import DEFAULT_FORMATS
+from ClearableDateTimeEdit.popup import TimeWidget
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+BENCHMARKS = (
+    "constructionUs",
+    "memoryBytes",
+    "popupFirstOpenUs",
+    "popupOpenUs",
+    "setDateTimePerSecond",
+    "commitUs",
+    "setModeUs",
+    "setModeObjects",
+)
+_DATETIMES = [
+    QDateTime(QDate(2000 + index % 50, 1 + index % 12, 1 + index % 28), QTime(index % 24, 30)) for index in range(100)
+]
+
+
+def _edit(parent: QWidget, mode: Mode) -> ClearableDateTimeEdit:
+    """Creates a DateTimeEdit.
+
+    Args:
+        parent (QWidget): Parent widget.
+        mode (Mode): Mode of the DateTimeEdit.
+
+    Returns:
+        ClearableDateTimeEdit: DateTimeEdit.
+
+    """
+    return ClearableDateTimeEdit(parent, mode)
+
+
+def _baselineEdit(parent: QWidget, mode: Mode) -> QDateTimeEdit:
+    """Creates a QDateTimeEdit with the display format and the calendar pop-up of a DateTimeEdit of given mode.
+
+    Args:
+        parent (QWidget): Parent widget.
+        mode (Mode): Mode of the DateTimeEdit.
+
+    Returns:
+        QDateTimeEdit: QDateTimeEdit.
+
+    """
+    edit = QDateTimeEdit(parent)
+    edit.setDisplayFormat(DEFAULT_FORMATS[mode])
+    edit.setCalendarPopup(True)
+    return edit
+
+
+def _openPopup(edit: QWidget) -> bool:
+    """Opens the calendar pop-up of given DateTimeEdit or QDateTimeEdit like a click of the user.
+
+    Args:
+        edit (QWidget): DateTimeEdit or QDateTimeEdit.
+
+    Returns:
+        bool: True if a pop-up has been opened.
+
+    """
+    if isinstance(edit, ClearableDateTimeEdit):
+        edit.findChild(QToolButton).click()
+    else:
+        QTest.mouseClick(edit, Qt.LeftButton, Qt.NoModifier, QPoint(edit.width() - 5, edit.height() // 2))
+    popup = QApplication.activePopupWidget()
+    if popup is None:
+        return False
+    popup.close()
+    return True
+
+
+def _shownEdit(factory: Callable[[QWidget, Mode], QWidget], mode: Mode) -> Tuple[QWidget, QWidget]:
+    """Creates a DateTimeEdit in a shown window.
+
+    Args:
+        factory (Callable[[QWidget, Mode], QWidget]): Function creating the DateTimeEdit from parent and mode.
+        mode (Mode): Mode of the DateTimeEdit.
+
+    Returns:
+        Tuple[QWidget, QWidget]: Window, which has to be kept, and DateTimeEdit.
+
+    """
+    window = QWidget()
+    edit = factory(window, mode)
+    edit.resize(200, 25)
+    window.show()
+    QApplication.processEvents()
+    return window, edit
+
+
+def _bestTime(function: Callable[[int], None], number: int, repeat: int) -> float:
+    """Measures the time per call of given function.
+
+    Args:
+        function (Callable[[int], None]): Function called with the number of the call.
+        number (int): Number of calls per measurement.
+        repeat (int): Number of measurements, the fastest one is reported.
+
+    Returns:
+        float: Time per call in seconds.
+
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for index in range(number):
+            function(index)
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def residentMemory() -> Optional[int]:
+    """Gets the resident memory of the process.
+
+    Returns:
+        Optional[int]: Resident memory in bytes or None if it cannot be determined on this system.
+
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _memoryPerInstance(baseline: bool, mode: Mode, count: int):
+    """Prints the growth of the resident memory per DateTimeEdit when creating given number of DateTimeEdits, it is
+    called in a new interpreter by _memory.
+
+    Args:
+        baseline (bool): Flag for measuring QDateTimeEdits instead of DateTimeEdits.
+        mode (Mode): Mode of the DateTimeEdits.
+        count (int): Number of DateTimeEdits.
+
+    """
+    QApplication.instance() or QApplication([])
+    factory = _baselineEdit if baseline else _edit
+    window = QWidget()
+    # Imports, caches and styles are loaded by the first instances.
+    warm_up = [factory(window, mode) for _ in range(10)]
+    gc.collect()
+    before = residentMemory()
+    edits = [factory(window, mode) for _ in range(count)]
+    for edit in edits:
+        edit.ensurePolished()
+    QApplication.processEvents()
+    gc.collect()
+    after = residentMemory()
+    print(json.dumps(None if before is None else (after - before) / count))
+    del warm_up
+
+
+def _memory(baseline: bool, mode: Mode, count: int) -> Optional[float]:
+    """Measures the memory per DateTimeEdit in a new interpreter, so that memory freed by other benchmarks is not
+    reused.
+
+    Args:
+        baseline (bool): Flag for measuring QDateTimeEdits instead of DateTimeEdits.
+        mode (Mode): Mode of the DateTimeEdits.
+        count (int): Number of DateTimeEdits.
+
+    Returns:
+        Optional[float]: Bytes per DateTimeEdit or None if the memory cannot be determined on this system.
+
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_PACKAGE_ROOT, env.get("PYTHONPATH")]))
+    statement = (
+        "from ClearableDateTimeEdit.bench.Suite import _memoryPerInstance; "
+        f"from ClearableDateTimeEdit.Settings import Mode; _memoryPerInstance({baseline}, Mode.{mode.value}, {count})"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", statement],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def _popupOpenTimes(factory: Callable[[QWidget, Mode], QWidget], mode: Mode, count: int):
+    """Measures the time of opening the calendar pop-up the first time and again.
+
+    Args:
+        factory (Callable[[QWidget, Mode], QWidget]): Function creating the DateTimeEdit from parent and mode.
+        mode (Mode): Mode of the DateTimeEdit.
+        count (int): Number of DateTimeEdits and of openings.
+
+    Returns:
+        Tuple[Optional[float], Optional[float]]: Median times of the first and of the following openings in seconds,
+            None if the DateTimeEdit has no pop-up in given mode.
+
+    """
+    first_times = []
+    times = []
+    for _ in range(count):
+        window, edit = _shownEdit(factory, mode)
+        start = time.perf_counter()
+        if not _openPopup(edit):
+            window.deleteLater()
+            return None, None
+        first_times.append(time.perf_counter() - start)
+        window.deleteLater()
+    QApplication.processEvents()
+    window, edit = _shownEdit(factory, mode)
+    _openPopup(edit)
+    for _ in range(count):
+        start = time.perf_counter()
+        _openPopup(edit)
+        times.append(time.perf_counter() - start)
+    window.deleteLater()
+    QApplication.processEvents()
+    return statistics.median(first_times), statistics.median(times)
+
+
+def _benchmarks(factory: Callable[[QWidget, Mode], QWidget], mode: Mode, count: int, repeat: int) -> Dict:
+    """Measures the benchmarks of one mode except the memory.
+
+    Args:
+        factory (Callable[[QWidget, Mode], QWidget]): Function creating the DateTimeEdit from parent and mode.
+        mode (Mode): Mode of the DateTimeEdit.
+        count (int): Number of instances or calls per measurement.
+        repeat (int): Number of measurements.
+
+    Returns:
+        Dict: Results by benchmark name.
+
+    """
+    results = {"constructionUs": constructionTime(mode, count, repeat, factory)["perWidgetUs"]}
+    first_open, open_ = _popupOpenTimes(factory, mode, max(count // 50, 5))
+    results["popupFirstOpenUs"] = None if first_open is None else first_open * 1e6
+    results["popupOpenUs"] = None if open_ is None else open_ * 1e6
+
+    window, edit = _shownEdit(factory, mode)
+    set_time = _bestTime(lambda index: edit.setDateTime(_DATETIMES[index % len(_DATETIMES)]), count, repeat)
+    results["setDateTimePerSecond"] = 1.0 / set_time
+
+    texts = [_DATETIMES[index].toString(DEFAULT_FORMATS[mode]) for index in range(2)]
+    line_edit = edit if isinstance(edit, ClearableDateTimeEdit) else edit.lineEdit()
+    edit.setFocus()
+
+    def commit(index: int):
+        line_edit.setText(texts[index % 2])
+        QTest.keyClick(edit, Qt.Key_Return)
+
+    results["commitUs"] = _bestTime(commit, count, repeat) * 1e6
+
+    other_mode = Mode.date if mode != Mode.date else Mode.time
+    _openPopup(edit)
+    if isinstance(edit, ClearableDateTimeEdit):
+        modes = [edit.setMode, other_mode, mode]
+    else:
+        modes = [edit.setDisplayFormat, DEFAULT_FORMATS[other_mode], DEFAULT_FORMATS[mode]]
+
+    def switch(index: int):
+        modes[0](modes[1 + index % 2])
+        # Pop-ups rebuilt or deleted because of the switch are part of its cost.
+        _openPopup(edit)
+        QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    # Pop-ups of both modes are built lazily by the first switches.
+    switch(0)
+    switch(1)
+    objects = len(window.findChildren(QObject))
+    results["setModeUs"] = _bestTime(switch, max(count // 10, 2) * 2, repeat) * 1e6
+    # The mode is switched back and forth, so every object left over has leaked.
+    results["setModeObjects"] = len(window.findChildren(QObject)) - objects
+    window.deleteLater()
+    QApplication.processEvents()
+    return results
+
+
+def _setupTime(count: int, repeat: int) -> Dict:
+    """Measures the update of the time lists after a change of the time range, which is done by TimeWidget.setupTime,
+    and compares it with a change of the time range of QTimeEdit.
+
+    Args:
+        count (int): Number of range changes per measurement.
+        repeat (int): Number of measurements.
+
+    Returns:
+        Dict: Results of the TimeWidget and of the QTimeEdit.
+
+    """
+    minimum_times = [QTime(0, 0), QTime(6, 15, 30)]
+    time_widget = TimeWidget()
+    time_edit = QTimeEdit()
+    widget_time = _bestTime(lambda index: time_widget.setMinimumTime(minimum_times[index % 2]), count, repeat)
+    baseline_time = _bestTime(lambda index: time_edit.setMinimumTime(minimum_times[index % 2]), count, repeat)
+    time_widget.deleteLater()
+    time_edit.deleteLater()
+    return compare(widget_time * 1e6, baseline_time * 1e6)
+
+
+def compare(widget: Optional[float], baseline: Optional[float]) -> Dict:
+    """Compares the figure of the DateTimeEdit with the figure of the QDateTimeEdit.
+
+    Args:
+        widget (Optional[float]): Figure of the DateTimeEdit.
+        baseline (Optional[float]): Figure of the QDateTimeEdit, None if it is not available.
+
+    Returns:
+        Dict: Both figures and their ratio.
+
+    """
+    ratio = None
+    if widget is not None and baseline:
+        ratio = round(widget / baseline, 3)
+    return {
+        "widget": None if widget is None else round(widget, 3),
+        "baseline": None if baseline is None else round(baseline, 3),
+        "ratio": ratio,
+    }
+
+
+def runSuite(modes: Sequence[Mode] = tuple(Mode), count: int = 1000, repeat: int = 3, memory: bool = True) -> Dict:
+    """Runs all benchmarks for given modes.
+
+    Args:
+        modes (Sequence[Mode], optional): Modes of the DateTimeEdits.
+        count (int, optional): Number of instances or calls per measurement.
+        repeat (int, optional): Number of measurements, the fastest one is reported.
+        memory (bool, optional): Flag for measuring the memory per instance, which starts new interpreters.
+
+    Returns:
+        Dict: Environment and results by mode and benchmark name, every result contains the figure of the
+            DateTimeEdit, the figure of the QDateTimeEdit and their ratio.
+
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    application = QApplication.instance() or QApplication([])
+    results = {
+        "python": platform.python_version(),
+        "pyside": PySide2.__version__,
+        "platform": application.platformName(),
+        "count": count,
+        "modes": {},
+    }
+    for mode in modes:
+        widget = _benchmarks(_edit, mode, count, repeat)
+        baseline = _benchmarks(_baselineEdit, mode, count, repeat)
+        if memory:
+            widget["memoryBytes"] = _memory(False, mode, count)
+            baseline["memoryBytes"] = _memory(True, mode, count)
+        results["modes"][mode.value] = {
+            name: compare(widget[name], baseline[name]) for name in BENCHMARKS if name in widget
+        }
+    results["setupTimeUs"] = _setupTime(count, repeat)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Runs the benchmark suite and prints or writes the results as JSON.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Command line arguments, sys.argv is used if not given.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ClearableDateTimeEdit.bench", description="Benchmarks of the ClearableDateTimeEdit."
+    )
+    parser.add_argument("--modes", nargs="+", choices=[mode.value for mode in Mode], help="modes to measure")
+    parser.add_argument("--count", type=int, default=1000, help="number of instances or calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="number of measurements")
+    parser.add_argument("--no-memory", action="store_true", help="skip the memory per instance")
+    parser.add_argument("--output", help="file for the results, they are printed if not given")
+    args = parser.parse_args(argv)
+    modes = [Mode(mode) for mode in args.modes] if args.modes else list(Mode)
+    results = runSuite(modes, args.count, args.repeat, not args.no_memory)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
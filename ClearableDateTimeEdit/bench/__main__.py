@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""Runs the benchmark suite, see "python -m ClearableDateTimeEdit.bench --help"."""
+from ClearableDateTimeEdit.bench.Suite import main
+
+main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""This module contains the calendar of the pop-ups, which highlights dates by category and shows disabled dates."""
+
+__all__ = ["DEFAULT_CATEGORY_COLOR", "DISABLED_DATE_COLOR", "CalendarWidget"]
+from typing import Dict, Hashable, Iterable, Mapping, Optional, Union
+
+from PySide2.QtCore import QDate, QRect
+from PySide2.QtGui import QColor, QPainter
+from PySide2.QtWidgets import QCalendarWidget
+
+from ClearableDateTimeEdit.Highlights import DateCategoryIndex
+from ClearableDateTimeEdit.Intervals import IntervalIndex
+
+# Background of highlighted dates whose category has no color.
+DEFAULT_CATEGORY_COLOR = QColor(255, 224, 130)
+# Veil over dates which are disabled for the whole day.
+DISABLED_DATE_COLOR = QColor(255, 255, 255, 170)
+
+
+class CalendarWidget(QCalendarWidget):
+    """This class contains the calendar of the pop-ups.
+
+    Notes:
+        Highlighted dates are looked up in a DateCategoryIndex when the cells are painted instead of being stored with
+        setDateTextFormat, which keeps one text format per date and is slow for thousands of dates. Dates which are
+        disabled for the whole day are faded out the same way, they can still be clicked but are not committed.
+
+    """
+
+    def __init__(self, parent=None):
+        super(CalendarWidget, self).__init__(parent)
+        self.__dateCategories = DateCategoryIndex()
+        self.__categoryColors: Dict[Hashable, QColor] = {}
+        self.__disabledIntervals = IntervalIndex()
+
+    def dateCategories(self) -> DateCategoryIndex:
+        """Gets the index of the highlighted dates.
+
+        Returns:
+            DateCategoryIndex: Index of the highlighted dates.
+
+        """
+        return self.__dateCategories
+
+    def setDateCategories(self, categories: Union[DateCategoryIndex, Mapping[Hashable, Iterable], None]):
+        """Replaces all highlighted dates.
+
+        Args:
+            categories (Union[DateCategoryIndex, Mapping[Hashable, Iterable], None]): Index or dates, QDates and
+                (first, last) intervals by category, None removes all highlights.
+
+        """
+        if not isinstance(categories, DateCategoryIndex):
+            categories = DateCategoryIndex(categories)
+        if categories is not self.__dateCategories:
+            self.__dateCategories = categories
+            self.updateCells()
+
+    def categoryColors(self) -> Dict[Hashable, QColor]:
+        """Gets the background colors of the categories.
+
+        Returns:
+            Dict[Hashable, QColor]: Colors by category.
+
+        """
+        return dict(self.__categoryColors)
+
+    def setCategoryColors(self, colors: Optional[Mapping[Hashable, QColor]]):
+        """Replaces the background colors of the categories, categories without color get DEFAULT_CATEGORY_COLOR.
+
+        Args:
+            colors (Optional[Mapping[Hashable, QColor]]): Colors by category.
+
+        """
+        colors = dict(colors or {})
+        if colors != self.__categoryColors:
+            self.__categoryColors = colors
+            self.updateCells()
+
+    def disabledIntervals(self) -> IntervalIndex:
+        """Gets the index of the disabled intervals.
+
+        Returns:
+            IntervalIndex: Index of the disabled intervals.
+
+        """
+        return self.__disabledIntervals
+
+    def setDisabledIntervals(self, intervals: IntervalIndex):
+        """Replaces the disabled intervals.
+
+        Args:
+            intervals (IntervalIndex): Index of the disabled intervals.
+
+        """
+        if intervals is not self.__disabledIntervals:
+            self.__disabledIntervals = intervals
+            self.updateCells()
+
+    def paintCell(self, painter: QPainter, rect: QRect, date: QDate):
+        """Paints the cell, tints highlighted dates with the color of their category and fades out disabled dates.
+
+        Args:
+            painter (QPainter): Painter.
+            rect (QRect): Rectangle of the cell.
+            date (QDate): Date of the cell.
+
+        """
+        super(CalendarWidget, self).paintCell(painter, rect, date)
+        if len(self.__dateCategories):
+            category = self.__dateCategories.categoryAt(DateCategoryIndex.ordinalOfJulianDay(date.toJulianDay()))
+            if category is not None:
+                painter.save()
+                # The cell background is painted by the base class, multiplying tints it and keeps the text readable.
+                painter.setCompositionMode(QPainter.CompositionMode_Multiply)
+                painter.fillRect(rect, self.__categoryColors.get(category, DEFAULT_CATEGORY_COLOR))
+                painter.restore()
+        if len(self.__disabledIntervals) and self.__disabledIntervals.coversDate(date.toPython()):
+            painter.fillRect(rect, DISABLED_DATE_COLOR)
@@ -1,18 +1,19 @@
 # -*- coding: utf-8 -*-
 """This module contains implementation of calendar pop-ups."""
+
 __all__ = ["DateTimePopup"]
+from typing import Hashable, Iterable, Mapping, Optional, Union
+
 from PySide2.QtCore import QDate, QObject
-from PySide2.QtWidgets import QCalendarWidget, QWidget
+from PySide2.QtGui import QColor
+from PySide2.QtWidgets import QWidget
 
+from ClearableDateTimeEdit.Highlights import DateCategoryIndex
+from ClearableDateTimeEdit.popup.CalendarWidget import CalendarWidget
 from ClearableDateTimeEdit.popup.DateTimePopupUi import (
     DateTimePopupUi as _DateTimePopupUi,
 )
-from ClearableDateTimeEdit.popup.Helpers import (
-    AbstractHelper,
-    CustomDateHelper,
-    CustomDateTimeHelper,
-    CustomTimeHelper,
-)
+from ClearableDateTimeEdit.popup.Helpers import AbstractHelper, helperClass
 from ClearableDateTimeEdit.Settings import Mode
 
 
@@ -21,17 +22,17 @@ class DateTimePopup(QWidget):
 
     def __init__(self, mode: Mode, parent):
         super(DateTimePopup, self).__init__(parent)
+        self.__mode = mode
         self.ui = _DateTimePopupUi()
         self.ui.setupUi(self)
-        self.__mode = mode
         self.__dtHelper = self._getDtHelper()
 
     @property
-    def calendarWidget(self) -> QCalendarWidget:
+    def calendarWidget(self) -> CalendarWidget:
         """Gets calendar widget from popup.
 
         Returns:
-             QCalendarWidget: Calendar widget.
+             CalendarWidget: Calendar widget.
 
         """
         return self.ui.calendarWidget
@@ -66,10 +67,66 @@ class DateTimePopup(QWidget):
         """
         return self.__dtHelper
 
+    def dateCategories(self) -> DateCategoryIndex:
+        """Gets the index of the dates highlighted in the calendar.
+
+        Returns:
+            DateCategoryIndex: Index of the highlighted dates.
+
+        """
+        return self.ui.calendarWidget.dateCategories()
+
+    def setDateCategories(
+        self,
+        categories: Union[DateCategoryIndex, Mapping[Hashable, Iterable], None],
+        colors: Optional[Mapping[Hashable, QColor]] = None,
+    ):
+        """Replaces the dates highlighted in the calendar.
+
+        Args:
+            categories (Union[DateCategoryIndex, Mapping[Hashable, Iterable], None]): Index or dates, QDates and
+                (first, last) intervals by category, None removes all highlights.
+            colors (Optional[Mapping[Hashable, QColor]], optional): Background colors by category, the colors are kept
+                if not given.
+
+        """
+        self.ui.calendarWidget.setDateCategories(categories)
+        if colors is not None:
+            self.ui.calendarWidget.setCategoryColors(colors)
+
     def initUi(self):
         """Initializes calendar pop-ups ui."""
         self.__dtHelper.initUi()
 
+    def mode(self) -> Mode:
+        """Gets mode of the pop-up.
+
+        Returns:
+            Mode: Mode as enum "Mode".
+
+        """
+        return self.__mode
+
+    def setMode(self, mode: Mode):
+        """Sets mode of the pop-up, only the helper is exchanged and the widgets are reused.
+
+        Args:
+            mode (Mode): Mode as enum "Mode".
+
+        """
+        if mode == self.__mode:
+            return
+        self.hide()
+        self.__mode = mode
+        # The previous helper is deleted with its last reference.
+        self.__dtHelper.setParent(None)
+        self.__dtHelper = self._getDtHelper()
+        self.__dtHelper.initUi()
+        # The minimum size of the previous mode is kept until the layout is activated, the size of the new mode can only
+        # be applied afterwards.
+        self.layout().activate()
+        self.__dtHelper.initUi()
+
     def _getDtHelper(self) -> AbstractHelper:
         """Gets helper to handle date/time data.
 
@@ -77,12 +134,7 @@ class DateTimePopup(QWidget):
             AbstractHelper (CustomTimeHelper, CustomDateHelper or CustomDateTimeHelper)
 
         """
-        mode_class_map = {
-            Mode.time.value: CustomTimeHelper,
-            Mode.date.value: CustomDateHelper,
-            Mode.datetime.value: CustomDateTimeHelper,
-        }
-        return mode_class_map.get(self.__mode.value, CustomDateTimeHelper)(self)
+        return helperClass(self.__mode)(self)
 
     def reset(self):
         """Resets calendar and time widgets."""
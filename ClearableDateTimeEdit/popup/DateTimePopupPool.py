@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""This module contains the process-wide pool of calendar pop-ups shared by DateTimeEdit widgets."""
+__all__ = ["DateTimePopupPool"]
+import weakref
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide2.QtCore import QObject
+from PySide2.QtWidgets import QApplication
+
+from ClearableDateTimeEdit.popup.DateTimePopup import DateTimePopup
+from ClearableDateTimeEdit.Settings import Mode
+
+_instance = None
+
+
+class DateTimePopupPool(QObject):
+    """This class keeps one calendar pop-up per mode for all DateTimeEdit widgets using a shared pop-up.
+
+    Notes:
+        Only one pop-up can be visible at a time because of the Qt.Popup window flag, so widgets can borrow the
+        pop-up of their mode when it is opened. The buttons of the pop-up are connected to the handlers of the
+        widget which acquired the pop-up last.
+
+    """
+
+    def __init__(self, parent=None):
+        super(DateTimePopupPool, self).__init__(parent)
+        self.__popups: Dict[str, DateTimePopup] = {}
+        self.__owners: Dict[str, weakref.ref] = {}
+        self.__handlers: Dict[str, Tuple[Callable, Callable, Callable, Callable]] = {}
+
+    @classmethod
+    def instance(cls) -> "DateTimePopupPool":
+        """Gets the process-wide pop-up pool.
+
+        Returns:
+            DateTimePopupPool: Process-wide pop-up pool.
+
+        """
+        global _instance
+        if _instance is None:
+            app = QApplication.instance()
+            # The application deletes the pool and its pop-ups before it is deleted itself.
+            _instance = cls(app)
+            _instance.destroyed.connect(_forgetInstance)
+            if app is not None:
+                app.aboutToQuit.connect(_instance.clear)
+        return _instance
+
+    def clear(self):
+        """Releases and deletes all shared pop-ups, e.g. when the application quits."""
+        for mode in Mode:
+            self.release(mode)
+        # The pop-ups have no parent, so they would outlive the application.
+        for popup in self.__popups.values():
+            popup.deleteLater()
+        self.__popups.clear()
+
+    def popup(self, mode: Mode) -> DateTimePopup:
+        """Gets the shared pop-up for given mode and builds it on first use.
+
+        Args:
+            mode (Mode): Mode of DateTimeEdit.
+
+        Returns:
+            DateTimePopup: Shared pop-up for given mode.
+
+        """
+        popup = self.__popups.get(mode.value)
+        if popup is None:
+            popup = DateTimePopup(mode, None)
+            popup.initUi()
+            self.__popups[mode.value] = popup
+        return popup
+
+    def owner(self, mode: Mode) -> Optional[QObject]:
+        """Gets the widget which acquired the shared pop-up for given mode last.
+
+        Args:
+            mode (Mode): Mode of DateTimeEdit.
+
+        Returns:
+            Optional[QObject]: Widget owning the pop-up or None if the pop-up is not owned.
+
+        """
+        owner_ref = self.__owners.get(mode.value)
+        return owner_ref() if owner_ref is not None else None
+
+    def acquire(
+        self,
+        mode: Mode,
+        owner: QObject,
+        submit: Callable,
+        cancel: Callable,
+        now: Callable,
+        clear: Callable,
+    ) -> DateTimePopup:
+        """Hands the shared pop-up for given mode over to given widget.
+
+        Notes:
+            The buttons of the pop-up are disconnected from the handlers of the previous owner, so submit, clear and
+            now are only sent back to the widget which opened the pop-up.
+
+        Args:
+            mode (Mode): Mode of DateTimeEdit.
+            owner (QObject): Widget opening the pop-up.
+            submit (Callable): Handler of the ok button.
+            cancel (Callable): Handler of the cancel button.
+            now (Callable): Handler of the now button.
+            clear (Callable): Handler of the clear button.
+
+        Returns:
+            DateTimePopup: Shared pop-up for given mode.
+
+        """
+        popup = self.popup(mode)
+        if self.owner(mode) is not owner:
+            self.release(mode)
+            handlers = (submit, cancel, now, clear)
+            for button, handler in zip(self.__buttons(popup), handlers):
+                button.clicked.connect(handler)
+            self.__owners[mode.value] = weakref.ref(owner)
+            self.__handlers[mode.value] = handlers
+        return popup
+
+    def release(self, mode: Mode, owner: QObject = None):
+        """Disconnects the shared pop-up for given mode from its owner.
+
+        Args:
+            mode (Mode): Mode of DateTimeEdit.
+            owner (QObject, optional): If given, the pop-up is only released if it is owned by this widget.
+
+        """
+        if owner is not None and self.owner(mode) is not owner:
+            return
+        handlers = self.__handlers.pop(mode.value, None)
+        self.__owners.pop(mode.value, None)
+        popup = self.__popups.get(mode.value)
+        if handlers is None or popup is None:
+            return
+        popup.hide()
+        for button, handler in zip(self.__buttons(popup), handlers):
+            try:
+                button.clicked.disconnect(handler)
+            except RuntimeError:
+                # The owner has already been deleted together with its connections.
+                pass
+
+    @staticmethod
+    def __buttons(popup: DateTimePopup) -> tuple:
+        """Gets the buttons of given pop-up in the order of the handlers.
+
+        Args:
+            popup (DateTimePopup): Pop-up.
+
+        Returns:
+            tuple: Submit, cancel, now and clear buttons.
+
+        """
+        return popup.ui.submitButton, popup.ui.cancelButton, popup.ui.nowButton, popup.ui.clearButton
+
+
+def _forgetInstance():
+    """Deletes the pop-ups of the pool deleted by the application, so that a new application gets a new pool."""
+    global _instance
+    if _instance is not None:
+        _instance.clear()
+    _instance = None
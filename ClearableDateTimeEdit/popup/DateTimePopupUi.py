@@ -7,6 +7,8 @@ from PySide2 import QtCore, QtWidgets
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QWidget
 
+from ClearableDateTimeEdit import Styles
+from ClearableDateTimeEdit.popup.CalendarWidget import CalendarWidget
 from ClearableDateTimeEdit.popup.TimeWidget import TimeWidget
 
 
@@ -24,6 +26,7 @@ class DateTimePopupUi(object):
 
         """
         Form.setObjectName("Form")
+        Form.setStyleSheet(Styles.POPUP_STYLE_SHEET)
         Form.setWindowFlags(Qt.Popup)
         Form.resize(510, 235)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
@@ -40,14 +43,13 @@ class DateTimePopupUi(object):
         self.verticalLayout_2.setObjectName("verticalLayout_2")
         self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
-        self.calendarWidget = QtWidgets.QCalendarWidget(Form)
+        self.calendarWidget = CalendarWidget(Form)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(self.calendarWidget.sizePolicy().hasHeightForWidth())
         self.calendarWidget.setSizePolicy(sizePolicy)
         self.calendarWidget.setMaximumSize(QtCore.QSize(312, 16777215))
-        self.calendarWidget.setStyleSheet("margin: 0px;")
         self.calendarWidget.setObjectName("calendarWidget")
         self.horizontalLayout_2.addWidget(self.calendarWidget)
         self.timeWidget = TimeWidget(Form)
@@ -82,8 +84,8 @@ class DateTimePopupUi(object):
             Form (QWidget): widget.
 
         """
-        Form.setWindowTitle(QtWidgets.QApplication.translate("Form", "Form", None, -1))
-        self.nowButton.setText(QtWidgets.QApplication.translate("Form", "Now", None, -1))
-        self.clearButton.setText(QtWidgets.QApplication.translate("Form", "Clear", None, -1))
-        self.submitButton.setText(QtWidgets.QApplication.translate("Form", "Ok", None, -1))
-        self.cancelButton.setText(QtWidgets.QApplication.translate("Form", "Cancel", None, -1))
+        Form.setWindowTitle(Styles.translate("Form", "Form"))
+        self.nowButton.setText(Styles.translate("Form", "Now"))
+        self.clearButton.setText(Styles.translate("Form", "Clear"))
+        self.submitButton.setText(Styles.translate("Form", "Ok"))
+        self.cancelButton.setText(Styles.translate("Form", "Cancel"))
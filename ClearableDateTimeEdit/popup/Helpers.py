@@ -1,18 +1,26 @@
 # -*- coding: utf-8 -*-
 """This module contains date/datetime/time helpers for handling data in calendar pop-up."""
-__all_ = ["AbstractHelper", "CustomDateHelper", "CustomTimeHelper", "CustomDateTimeHelper"]
+
+__all_ = ["AbstractHelper", "CustomDateHelper", "CustomTimeHelper", "CustomDateTimeHelper", "helperClass"]
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import Union
+from typing import Type, Union
 
 from PySide2.QtCore import QDate, QDateTime, QObject, QRegExp, QSize, QTime
 from PySide2.QtGui import QRegExpValidator
 from PySide2.QtWidgets import QDateEdit, QDateTimeEdit, QListWidgetItem, QTimeEdit
 
+from ClearableDateTimeEdit import Icons
+from ClearableDateTimeEdit.Core import DEFAULT_FORMATS
+from ClearableDateTimeEdit.Formats import compileFormat
+from ClearableDateTimeEdit.Settings import Mode
+
 
 class AbstractHelper(QObject):
     """Abstract class with methods handling the settings or date and time inputs depending on DateTimeEdit mode."""
 
+    defaultFormat = ""
+    iconPath = ""
+
     @property
     @abstractmethod
     def icon(self) -> str:
@@ -94,11 +102,15 @@ class AbstractHelper(QObject):
 class CustomDateHelper(AbstractHelper):
     """Class with methods handling the settings or date inputs depending on date mode."""
 
+    defaultFormat = DEFAULT_FORMATS[Mode.date]
+    iconPath = Icons.iconPath(Mode.date)
+
     def __init__(self, parent):
         super().__init__(parent)
         self.__parent = parent
-        self.__icon = str(Path(__file__).resolve().parent / r"..\resources\icon\datepicker-widget-icons_calendar.svg")
-        self.__format = "dd.MM.yyyy"
+        self.__icon = self.iconPath
+        self.__format = self.defaultFormat
+        self.__dtFormat = compileFormat(self.__format)
 
     @property
     def icon(self) -> str:
@@ -129,6 +141,7 @@ class CustomDateHelper(AbstractHelper):
 
         """
         self.__format = fmt
+        self.__dtFormat = compileFormat(self.__format)
 
     def initUi(self):
         """Initializes ui."""
@@ -164,23 +177,21 @@ class CustomDateHelper(AbstractHelper):
             True if the conversion is successful, False otherwise.
 
         """
-        try:
-            dt = QDate.fromString(datetime_str, self.__format)
-            if not dt.isValid():
-                return False
-            return True
-        except Exception:
-            return False
+        return self.__dtFormat.fromText(datetime_str) is not None
 
 
 class CustomTimeHelper(AbstractHelper):
     """Class with methods handling the settings or time inputs depending on time mode."""
 
+    defaultFormat = DEFAULT_FORMATS[Mode.time]
+    iconPath = Icons.iconPath(Mode.time)
+
     def __init__(self, parent):
         super().__init__(parent)
         self.__parent = parent
-        self.__icon = str(Path(__file__).resolve().parent / r"..\resources\icon\datepicker-widget-icons_clock.svg")
-        self.__format = "HH:mm:ss"
+        self.__icon = self.iconPath
+        self.__format = self.defaultFormat
+        self.__dtFormat = compileFormat(self.__format)
 
     @property
     def icon(self) -> str:
@@ -211,12 +222,15 @@ class CustomTimeHelper(AbstractHelper):
 
         """
         self.__format = fmt
+        self.__dtFormat = compileFormat(self.__format)
 
     def initUi(self):
         """Initializes ui."""
         self.__parent.resize(300, 221)
         self.__parent.calendarWidget.setVisible(False)
         self.__parent.timeWidget.setVisible(True)
+        # The pop-up may have been used in datetime mode before.
+        self.__parent.timeWidget.setMaximumSize(QSize(320, 182))
 
     def getDateTime(self) -> QTime:
         """Returns selected time from calendar pop-up.
@@ -225,10 +239,7 @@ class CustomTimeHelper(AbstractHelper):
             QTime: Selected time.
 
         """
-        selected_hour = self.__parent.timeWidget.hourListWidget.selectedItems()[0].text()
-        selected_min = self.__parent.timeWidget.minListWidget.selectedItems()[0].text()
-        selected_sec = self.__parent.timeWidget.secListWidget.selectedItems()[0].text()
-        return QTime.fromString(f"{selected_hour}:{selected_min}:{selected_sec}", "h:m:s")
+        return self.__parent.timeWidget.time()
 
     def setDateTime(self, datetime: QTime):
         """Sets time in calendar pop-up.
@@ -249,25 +260,21 @@ class CustomTimeHelper(AbstractHelper):
             True if the conversion is successful, False otherwise.
 
         """
-        try:
-            dt = QTime.fromString(datetime_str, self.__format)
-            if not dt.isValid():
-                return False
-            return True
-        except Exception:
-            return False
+        return self.__dtFormat.fromText(datetime_str) is not None
 
 
 class CustomDateTimeHelper(AbstractHelper):
     """Class with methods handling the settings or date and time inputs depending on datetime mode."""
 
+    defaultFormat = DEFAULT_FORMATS[Mode.datetime]
+    iconPath = Icons.iconPath(Mode.datetime)
+
     def __init__(self, parent):
         super().__init__(parent)
         self.__parent = parent
-        self.__icon = str(
-            Path(__file__).resolve().parent / r"..\resources\icon\datepicker-widget-icons_calendar+clock.svg"
-        )
-        self.__format = "dd.MM.yyyy HH:mm:ss"
+        self.__icon = self.iconPath
+        self.__format = self.defaultFormat
+        self.__dtFormat = compileFormat(self.__format)
 
     @property
     def icon(self) -> str:
@@ -298,6 +305,7 @@ class CustomDateTimeHelper(AbstractHelper):
 
         """
         self.__format = fmt
+        self.__dtFormat = compileFormat(self.__format)
 
     def initUi(self):
         """Initializes ui."""
@@ -313,14 +321,7 @@ class CustomDateTimeHelper(AbstractHelper):
             QDateTime: Selected datetime.
 
         """
-        selected_date = self.__parent.calendarWidget.selectedDate()
-        selected_hour = self.__parent.timeWidget.hourListWidget.selectedItems()[0].text()
-        selected_min = self.__parent.timeWidget.minListWidget.selectedItems()[0].text()
-        selected_sec = self.__parent.timeWidget.secListWidget.selectedItems()[0].text()
-        return QDateTime.fromString(
-            f"{selected_date.toString()} {selected_hour}:{selected_min}:{selected_sec}",
-            "ddd MMM d yyyy h:m:s",
-        )
+        return QDateTime(self.__parent.calendarWidget.selectedDate(), self.__parent.timeWidget.time())
 
     def setDateTime(self, datetime: QDateTime):
         """Sets datetime in calendar pop-up.
@@ -342,10 +343,22 @@ class CustomDateTimeHelper(AbstractHelper):
             True if the conversion is successful, False otherwise.
 
         """
-        try:
-            dt = QDateTime.fromString(datetime_str, self.__format)
-            if not dt.isValid():
-                return False
-            return True
-        except Exception:
-            return False
+        return self.__dtFormat.fromText(datetime_str) is not None
+
+
+def helperClass(mode: Mode) -> Type[AbstractHelper]:
+    """Gets the helper class handling date/time data for the given DateTimeEdit mode.
+
+    Args:
+        mode (Mode): Mode of DateTimeEdit.
+
+    Returns:
+        Type[AbstractHelper]: CustomTimeHelper, CustomDateHelper or CustomDateTimeHelper.
+
+    """
+    mode_class_map = {
+        Mode.time.value: CustomTimeHelper,
+        Mode.date.value: CustomDateHelper,
+        Mode.datetime.value: CustomDateTimeHelper,
+    }
+    return mode_class_map.get(mode.value, CustomDateTimeHelper)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""This module contains the model and view of the hour, minute, second and millisecond lists of the time widget."""
+__all__ = ["TimeListModel", "TimeListView"]
+import weakref
+from typing import Tuple
+
+from PySide2.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide2.QtWidgets import QAbstractItemView, QListView
+
+# The views keep their models alive, so a model is dropped when no list shows it anymore.
+_sharedModels: "weakref.WeakValueDictionary[Tuple[int, int, int], TimeListModel]" = weakref.WeakValueDictionary()
+
+
+class TimeListModel(QAbstractListModel):
+    """This class contains a list model of the multiples of a step between a first and a last value.
+
+    Notes:
+        The items are not stored, the text of a row is computed when it is displayed, so even lists with thousands of
+        values cost nothing until they are scrolled. Models with the same range and step are shared by all time
+        widgets, see shared(), so the range and the step of a model can not be changed.
+
+    """
+
+    def __init__(self, first: int = 0, last: int = -1, step: int = 1, parent=None):
+        super(TimeListModel, self).__init__(parent)
+        self.__first = first
+        self.__last = last
+        self.__step = step
+        self.__start = self.__alignedStart()
+
+    @classmethod
+    def shared(cls, first: int, last: int, step: int = 1) -> "TimeListModel":
+        """Gets the model shared by all time widgets for given range and step.
+
+        Args:
+            first (int): Lower bound of the values.
+            last (int): Upper bound of the values.
+            step (int, optional): Step between the values, the values are multiples of the step.
+
+        Returns:
+            TimeListModel: Shared model for given range and step.
+
+        """
+        model = _sharedModels.get((first, last, step))
+        if model is None:
+            model = cls(first, last, step)
+            _sharedModels[(first, last, step)] = model
+        return model
+
+    def __alignedStart(self) -> int:
+        """Gets the first multiple of the step which is not less than the lower bound.
+
+        Returns:
+            int: First value of the list.
+
+        """
+        return -(-self.__first // self.__step) * self.__step
+
+    def first(self) -> int:
+        """Gets the first value of the list.
+
+        Returns:
+            int: First value.
+
+        """
+        return self.__start
+
+    def last(self) -> int:
+        """Gets the last value of the list.
+
+        Returns:
+            int: Last value.
+
+        """
+        return self.__start + (self.rowCount() - 1) * self.__step
+
+    def step(self) -> int:
+        """Gets the step between the values of the list.
+
+        Returns:
+            int: Step.
+
+        """
+        return self.__step
+
+    def value(self, row: int) -> int:
+        """Gets the value of given row.
+
+        Args:
+            row (int): Row of the list.
+
+        Returns:
+            int: Value of the row.
+
+        """
+        return self.__start + row * self.__step
+
+    def row(self, value: int) -> int:
+        """Gets the row of given value.
+
+        Args:
+            value (int): Value of the list.
+
+        Returns:
+            int: Row of the value or -1 if the value is out of range or not a multiple of the step.
+
+        """
+        if self.__start <= value <= self.__last and not (value - self.__start) % self.__step:
+            return (value - self.__start) // self.__step
+        return -1
+
+    def nearestRow(self, value: int) -> int:
+        """Gets the row of the value next to given value.
+
+        Args:
+            value (int): Any value.
+
+        Returns:
+            int: Row of the nearest value, the first or last row for values out of range, -1 if the list is empty.
+
+        """
+        row_count = self.rowCount()
+        if not row_count:
+            return -1
+        row = (value - self.__start + self.__step // 2) // self.__step
+        return min(max(row, 0), row_count - 1)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Gets number of rows.
+
+        Args:
+            parent (QModelIndex, optional): Parent index.
+
+        Returns:
+            int: Number of values in the range.
+
+        """
+        if parent.isValid() or self.__last < self.__start:
+            return 0
+        return (self.__last - self.__start) // self.__step + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Gets the data of given index.
+
+        Args:
+            index (QModelIndex): Index.
+            role (int, optional): Item data role.
+
+        Returns:
+            Text of the value for the display role, value for the user role, otherwise None.
+
+        """
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self.value(index.row()))
+        if role == Qt.UserRole:
+            return self.value(index.row())
+        return None
+
+
+class TimeListView(QListView):
+    """This class contains the list view of hours, minutes, seconds or milliseconds of the time widget."""
+
+    def __init__(self, parent=None):
+        super(TimeListView, self).__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+    def setModel(self, model: TimeListModel):
+        """Sets the model of the view and deletes the selection model of the previous model.
+
+        Args:
+            model (TimeListModel): New model.
+
+        """
+        selection_model = self.selectionModel()
+        super(TimeListView, self).setModel(model)
+        if selection_model is not None:
+            selection_model.deleteLater()
+
+    def currentRow(self) -> int:
+        """Gets the current row.
+
+        Returns:
+            int: Current row or -1 if there is no current row.
+
+        """
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int):
+        """Selects given row and makes it the current row.
+
+        Args:
+            row (int): Row.
+
+        """
+        self.setCurrentIndex(self.model().index(row, 0))
+
+    def currentValue(self) -> int:
+        """Gets the value of the current row or the first value if there is no current row.
+
+        Returns:
+            int: Current value.
+
+        """
+        return self.model().value(max(self.currentRow(), 0))
+
+    def setCurrentValue(self, value: int):
+        """Selects the row of given value and makes it the current row.
+
+        Args:
+            value (int): Value.
+
+        """
+        self.setCurrentRow(self.model().row(value))
+
+    def setNearestValue(self, value: int):
+        """Selects the row of the value next to given value and makes it the current row.
+
+        Args:
+            value (int): Any value, it is moved to the nearest multiple of the step within the range.
+
+        """
+        self.setCurrentRow(self.model().nearestRow(value))
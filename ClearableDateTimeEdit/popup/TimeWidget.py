@@ -4,31 +4,41 @@ __all__ = ["TimeWidget"]
 from PySide2.QtCore import QSize, Qt, QTime
 from PySide2.QtGui import QFont, QIntValidator
 from PySide2.QtWidgets import (
-    QApplication,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
     QSizePolicy,
     QVBoxLayout,
     QWidget,
 )
 
+from ClearableDateTimeEdit import Styles
+from ClearableDateTimeEdit.popup.TimeList import TimeListModel, TimeListView
+
 
 class TimeWidget(QWidget):
     """This class contains functionality of time widget."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.__hourStep = 1
+        self.__minuteStep = 1
+        self.__secondStep = 1
+        # Milliseconds are entered in the line edit as long as no step is set for them.
+        self.__msecStep = 0
+        self.__msecShown = True
         self.init_ui()
         self.__maximumTime = QTime(23, 59, 59, 999)
         self.__minimumTime = QTime(0, 0, 0, 0)
+        self.__msecValidator = QIntValidator(self)
+        self.msecLineEdit.setValidator(self.__msecValidator)
         self.setupTime()
 
     def init_ui(self):
         """Initializes ui layout."""
         self.setObjectName("TimeWidget")
+        # One style sheet for all parts, its rules are selected by the object names of the parts.
+        self.setStyleSheet(Styles.TIME_WIDGET_STYLE_SHEET)
         sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -51,27 +61,20 @@ class TimeWidget(QWidget):
         font.setWeight(75)
         font.setBold(True)
         self.timeLabel.setFont(font)
-        self.timeLabel.setStyleSheet(
-            "background-color: rgb(0, 122, 212);\ncolor: rgb(255, 255, 255);\nmargin: 0px;"
-        )
         self.timeLabel.setAlignment(Qt.AlignCenter)
         self.timeLabel.setObjectName("timeLabel")
         self.verticalLayout.addWidget(self.timeLabel)
 
         self.horizontalLayout_3 = QHBoxLayout()
         self.horizontalLayout_3.setObjectName("horizontalLayout_3")
-        labelStylesheet = "border: 1px solid grey;"
         self.hourVerticalLayout = QVBoxLayout()
         self.hourVerticalLayout.setObjectName("hourVerticalLayout")
         self.hourLabel = QLabel()
         self.hourLabel.setAlignment(Qt.AlignCenter)
-        self.hourLabel.setStyleSheet(labelStylesheet)
         self.hourLabel.setObjectName("hourLabel")
         self.hourVerticalLayout.addWidget(self.hourLabel)
-        self.hourListWidget = QListWidget(self)
+        self.hourListWidget = TimeListView(self)
         # self.hourListWidget.setMaximumSize(QtCore.QSize(50, 16777215))
-        self.hourListWidget.setStyleSheet("margin: 0px;")
-        self.hourListWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.hourListWidget.setObjectName("hourListWidget")
         self.hourVerticalLayout.addWidget(self.hourListWidget)
         self.horizontalLayout_3.addLayout(self.hourVerticalLayout)
@@ -79,28 +82,39 @@ class TimeWidget(QWidget):
         self.minVerticalLayout.setObjectName("minVerticalLayout")
         self.minLabel = QLabel(self)
         self.minLabel.setAlignment(Qt.AlignCenter)
-        self.minLabel.setStyleSheet(labelStylesheet)
         self.minLabel.setObjectName("minLabel")
         self.minVerticalLayout.addWidget(self.minLabel)
-        self.minListWidget = QListWidget(self)
+        self.minListWidget = TimeListView(self)
         # self.minListWidget.setMaximumSize(QtCore.QSize(50, 16777215))
         self.minListWidget.setObjectName("minListWidget")
-        self.minListWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.minVerticalLayout.addWidget(self.minListWidget)
         self.horizontalLayout_3.addLayout(self.minVerticalLayout)
         self.secVerticalLayout = QVBoxLayout()
         self.secVerticalLayout.setObjectName("secVerticalLayout")
         self.secLabel = QLabel(self)
         self.secLabel.setAlignment(Qt.AlignCenter)
-        self.secLabel.setStyleSheet(labelStylesheet)
         self.secLabel.setObjectName("secLabel")
         self.secVerticalLayout.addWidget(self.secLabel)
-        self.secListWidget = QListWidget(self)
+        self.secListWidget = TimeListView(self)
         # self.secListWidget.setMaximumSize(QtCore.QSize(50, 16777215))
         self.secListWidget.setObjectName("secListWidget")
-        self.secListWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.secVerticalLayout.addWidget(self.secListWidget)
         self.horizontalLayout_3.addLayout(self.secVerticalLayout)
+        self.msecVerticalLayout = QVBoxLayout()
+        self.msecVerticalLayout.setObjectName("msecVerticalLayout")
+        self.msecListLabel = QLabel(self)
+        self.msecListLabel.setAlignment(Qt.AlignCenter)
+        self.msecListLabel.setObjectName("msecListLabel")
+        self.msecVerticalLayout.addWidget(self.msecListLabel)
+        self.msecListWidget = TimeListView(self)
+        self.msecListWidget.setObjectName("msecListWidget")
+        # Three digits do not fit next to a scroll bar, the list is scrolled with the wheel and the keys.
+        self.msecListWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.msecListWidget.setMinimumWidth(
+            self.msecListWidget.fontMetrics().horizontalAdvance("0000") + 2 * self.msecListWidget.frameWidth()
+        )
+        self.msecVerticalLayout.addWidget(self.msecListWidget)
+        self.horizontalLayout_3.addLayout(self.msecVerticalLayout)
         self.verticalLayout.addLayout(self.horizontalLayout_3)
         self.msecHorizontalLayout = QHBoxLayout()
         self.msecHorizontalLayout.setObjectName("msecHorizontalLayout")
@@ -111,7 +125,6 @@ class TimeWidget(QWidget):
         sizePolicy.setHeightForWidth(self.msecLabel.sizePolicy().hasHeightForWidth())
         self.msecLabel.setSizePolicy(sizePolicy)
         self.msecLabel.setAlignment(Qt.AlignCenter)
-        self.msecLabel.setStyleSheet(labelStylesheet)
         self.msecLabel.setMaximumSize(QSize(40, 22))
         self.msecLabel.setMinimumWidth(30)
         self.msecLabel.setObjectName("msecLabel")
@@ -122,11 +135,13 @@ class TimeWidget(QWidget):
         self.msecHorizontalLayout.addWidget(self.msecLineEdit)
         self.verticalLayout.addLayout(self.msecHorizontalLayout)
 
-        self.timeLabel.setText(QApplication.translate("TimeWidget", "Time", None, -1))
-        self.hourLabel.setText(QApplication.translate("TimeWidget", "h", None, -1))
-        self.minLabel.setText(QApplication.translate("TimeWidget", "m", None, -1))
-        self.secLabel.setText(QApplication.translate("TimeWidget", "s", None, -1))
-        self.msecLabel.setText(QApplication.translate("TimeWidget", "ms:", None, -1))
+        self.timeLabel.setText(Styles.translate("TimeWidget", "Time"))
+        self.hourLabel.setText(Styles.translate("TimeWidget", "h"))
+        self.minLabel.setText(Styles.translate("TimeWidget", "m"))
+        self.secLabel.setText(Styles.translate("TimeWidget", "s"))
+        self.msecLabel.setText(Styles.translate("TimeWidget", "ms:"))
+        self.msecListLabel.setText(Styles.translate("TimeWidget", "ms"))
+        self.__updateMsecInput()
 
     def minimumTime(self) -> QTime:
         """Gets minimum time.
@@ -198,42 +213,240 @@ class TimeWidget(QWidget):
         self.__maximumTime = QTime(23, 59, 59, 999)
         self.setupTime()
 
+    @staticmethod
+    def checkStep(method: str, step: int, minimum: int = 1):
+        """Checks given step of a time unit.
+
+        Args:
+            method (str): Name of the method setting the step, used in the error messages.
+            step (int): Step.
+            minimum (int, optional): Smallest allowed step.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than the minimum.
+
+        """
+        if not isinstance(step, int):
+            step_type = str(type(step)).split("'")[1]
+            raise TypeError(
+                f"""'{method}' called with wrong argument types:\n\t
+                {method}({step_type})\n\t\t
+                Supported signatures:\n\t
+                {method}(int)"""
+            )
+        if step < minimum:
+            raise ValueError(f"'{method}' called with step {step}, the step must be at least {minimum}")
+
+    def hourStep(self) -> int:
+        """Gets the step between the hours of the list.
+
+        Returns:
+            int: Step in hours.
+
+        """
+        return self.__hourStep
+
+    def setHourStep(self, step: int):
+        """Sets the step between the hours of the list, the selected time is moved to the nearest step.
+
+        Args:
+            step (int): Step in hours.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 1.
+
+        """
+        self.checkStep("TimeWidget.setHourStep", step)
+        if step != self.__hourStep:
+            current = self.time()
+            self.__hourStep = step
+            self.__updateSteps(current)
+
+    def minuteStep(self) -> int:
+        """Gets the step between the minutes of the list.
+
+        Returns:
+            int: Step in minutes.
+
+        """
+        return self.__minuteStep
+
+    def setMinuteStep(self, step: int):
+        """Sets the step between the minutes of the list, e.g. 5 or 15 for scheduling. The selected time is moved to
+        the nearest step.
+
+        Args:
+            step (int): Step in minutes.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 1.
+
+        """
+        self.checkStep("TimeWidget.setMinuteStep", step)
+        if step != self.__minuteStep:
+            current = self.time()
+            self.__minuteStep = step
+            self.__updateSteps(current)
+
+    def secondStep(self) -> int:
+        """Gets the step between the seconds of the list.
+
+        Returns:
+            int: Step in seconds.
+
+        """
+        return self.__secondStep
+
+    def setSecondStep(self, step: int):
+        """Sets the step between the seconds of the list, the selected time is moved to the nearest step.
+
+        Args:
+            step (int): Step in seconds.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 1.
+
+        """
+        self.checkStep("TimeWidget.setSecondStep", step)
+        if step != self.__secondStep:
+            current = self.time()
+            self.__secondStep = step
+            self.__updateSteps(current)
+
+    def msecStep(self) -> int:
+        """Gets the step between the milliseconds of the list.
+
+        Returns:
+            int: Step in milliseconds, 0 if the milliseconds are entered in the line edit.
+
+        """
+        return self.__msecStep
+
+    def setMsecStep(self, step: int):
+        """Sets the step between the milliseconds. With a step the milliseconds are selected in a list instead of
+        being entered in the line edit, step 1 allows to select every millisecond.
+
+        Args:
+            step (int): Step in milliseconds, 0 for entering the milliseconds in the line edit.
+
+        Raises:
+            TypeError if given step is not int.
+            ValueError if given step is less than 0.
+
+        """
+        self.checkStep("TimeWidget.setMsecStep", step, 0)
+        if step != self.__msecStep:
+            current = self.time()
+            self.__msecStep = step
+            self.__updateMsecInput()
+            self.__updateSteps(current)
+
+    def __updateSteps(self, current: QTime):
+        """Rebuilds the lists for the current steps and selects the nearest time to given time.
+
+        Args:
+            current (QTime): Time selected before the steps have been changed.
+
+        """
+        self.setupTime()
+        self.setTime(current)
+
+    def __updateMsecInput(self):
+        """Shows the list or the line edit for the milliseconds depending on the millisecond step."""
+        list_shown = self.__msecShown and self.__msecStep > 0
+        line_shown = self.__msecShown and self.__msecStep == 0
+        self.msecListLabel.setVisible(list_shown)
+        self.msecListWidget.setVisible(list_shown)
+        self.msecLabel.setVisible(line_shown)
+        self.msecLineEdit.setVisible(line_shown)
+
     def setupTime(self):
-        """Creates the lists for hours, minutes and seconds based on the minimum and maximum time and fills the time
-        widget with the lists."""
-        hours = [QListWidgetItem(str(i)) for i in range(self.__minimumTime.hour(), self.__maximumTime.hour() + 1)]
-        minutes = [QListWidgetItem(str(i)) for i in range(self.__minimumTime.minute(), self.__maximumTime.minute() + 1)]
-        seconds = [QListWidgetItem(str(i)) for i in range(self.__minimumTime.second(), self.__maximumTime.second() + 1)]
-        for time_widget, time_list in zip(
-            [
-                self.hourListWidget,
-                self.minListWidget,
-                self.secListWidget,
-            ],
-            [hours, minutes, seconds],
-        ):
-            time_widget.clear()
-            for item in time_list:
-                time_widget.addItem(item)
-            time_widget.setCurrentItem(time_list[0])
-        int_val = QIntValidator()
-        int_val.setRange(self.__minimumTime.msec(), self.__maximumTime.msec())
-        self.msecLineEdit.setValidator(int_val)
+        """Sets the ranges of the lists for hours, minutes, seconds and milliseconds based on the minimum and maximum
+        time and the steps and selects the first entry of each list.
+
+        Notes:
+            The lists show models shared by all time widgets with the same ranges and steps, so only the models of the
+            views are exchanged and no list items are created.
+
+        """
+        lists = [
+            (self.hourListWidget, self.__minimumTime.hour(), self.__maximumTime.hour(), self.__hourStep),
+            (self.minListWidget, self.__minimumTime.minute(), self.__maximumTime.minute(), self.__minuteStep),
+            (self.secListWidget, self.__minimumTime.second(), self.__maximumTime.second(), self.__secondStep),
+        ]
+        if self.__msecStep:
+            lists.append((self.msecListWidget, self.__minimumTime.msec(), self.__maximumTime.msec(), self.__msecStep))
+        for time_widget, first, last, step in lists:
+            model = TimeListModel.shared(first, last, step)
+            if time_widget.model() is not model:
+                time_widget.setModel(model)
+            time_widget.setCurrentRow(0)
+        self.__msecValidator.setRange(self.__minimumTime.msec(), self.__maximumTime.msec())
+
+    def snapTime(self, value: QTime) -> QTime:
+        """Moves given time to the nearest time which can be selected with the steps of the lists, a time which would
+        be moved into the next day is moved back to the previous step.
+
+        Args:
+            value (QTime): Time.
+
+        Returns:
+            QTime: Time consisting of multiples of the steps.
+
+        """
+        return self.snapToSteps(value, self.__hourStep, self.__minuteStep, self.__secondStep, self.__msecStep)
+
+    @staticmethod
+    def snapToSteps(value: QTime, hourStep: int, minuteStep: int, secondStep: int, msecStep: int) -> QTime:
+        """Moves given time to the nearest time consisting of multiples of given steps, like snapTime does it for the
+        steps of a time widget.
+
+        Args:
+            value (QTime): Time.
+            hourStep (int): Step in hours.
+            minuteStep (int): Step in minutes.
+            secondStep (int): Step in seconds.
+            msecStep (int): Step in milliseconds, 0 keeps the milliseconds.
+
+        Returns:
+            QTime: Time consisting of multiples of the steps.
+
+        """
+        steps = [hourStep, minuteStep, secondStep, msecStep or 1]
+        parts = [value.hour(), value.minute(), value.second(), value.msec()]
+        bases = [24, 60, 60, 1000]
+        snapped = [0, 0, 0, 0]
+        carry = 0
+        for index in reversed(range(4)):
+            part = parts[index] + carry
+            lower = part // steps[index] * steps[index]
+            upper = min(lower + steps[index], bases[index])
+            snapped[index] = upper if part - lower >= upper - part else lower
+            carry = 0
+            if snapped[index] >= bases[index]:
+                snapped[index] = 0
+                carry = 1
+        if carry:
+            # The end of the day cannot be reached, the last step before it is taken.
+            snapped = [part // step * step for part, step in zip(parts, steps)]
+        return QTime(*snapped)
 
     def reset(self):
         """Resets the selection in the time widget."""
         self.hourListWidget.setCurrentRow(0)
         self.minListWidget.setCurrentRow(0)
         self.secListWidget.setCurrentRow(0)
+        if self.__msecStep:
+            self.msecListWidget.setCurrentRow(0)
         self.msecLineEdit.setText("")
 
     def setToday(self):
-        """Sets time in time widget to current time."""
-        now = QTime.currentTime()
-        self.hourListWidget.setCurrentRow(now.hour())
-        self.minListWidget.setCurrentRow(now.minute())
-        self.secListWidget.setCurrentRow(now.second())
-        self.msecLineEdit.setText(str(now.msec()))
+        """Sets time in time widget to current time, moved to the nearest step."""
+        self.setTime(QTime.currentTime())
 
     def showMsec(self, show: bool = True):
         """Shows or hides milliseconds.
@@ -243,17 +456,40 @@ class TimeWidget(QWidget):
                 otherwise they are hidden.
 
         """
-        self.msecLineEdit.setVisible(show)
-        self.msecLabel.setVisible(show)
+        self.__msecShown = show
+        self.__updateMsecInput()
+
+    def time(self) -> QTime:
+        """Gets the time selected in the lists for hours, minutes, seconds and milliseconds or the entered
+        milliseconds.
+
+        Returns:
+            QTime: Selected time, milliseconds which are not entered are 0.
+
+        """
+        if self.__msecStep:
+            msec = self.msecListWidget.currentValue()
+        else:
+            msec_text = self.msecLineEdit.text()
+            msec = int(msec_text) if msec_text.isdigit() else 0
+        return QTime(
+            self.hourListWidget.currentValue(),
+            self.minListWidget.currentValue(),
+            self.secListWidget.currentValue(),
+            msec,
+        )
 
     def setTime(self, new_time: QTime):
-        """Sets time in time widget to given time.
+        """Sets time in time widget to given time, moved to the nearest step.
 
         Args:
             new_time (QTime): Time.
 
         """
-        self.hourListWidget.setCurrentRow(new_time.hour())
-        self.minListWidget.setCurrentRow(new_time.minute())
-        self.secListWidget.setCurrentRow(new_time.second())
+        new_time = self.snapTime(new_time)
+        self.hourListWidget.setNearestValue(new_time.hour())
+        self.minListWidget.setNearestValue(new_time.minute())
+        self.secListWidget.setNearestValue(new_time.second())
+        if self.__msecStep:
+            self.msecListWidget.setNearestValue(new_time.msec())
         self.msecLineEdit.setText(str(new_time.msec()))
@@ -1,5 +1,40 @@
 # -*- coding: utf-8 -*-
+"""Calendar pop-up of the ClearableDateTimeEdit, the classes are imported from their submodules on first access."""
+import importlib
+import sys
+from types import ModuleType
 
-from ClearableDateTimeEdit.popup.DateTimePopup import DateTimePopup
-from ClearableDateTimeEdit.popup.DateTimePopupUi import DateTimePopupUi
-from ClearableDateTimeEdit.popup.TimeWidget import TimeWidget
+__all__ = ["CalendarWidget", "DateTimePopup", "DateTimePopupPool", "DateTimePopupUi", "TimeWidget"]
+
+
+class _Package(ModuleType):
+    """Package module which keeps the exported classes bound to their names."""
+
+    def __setattr__(self, name: str, value):
+        # The import system binds loaded submodules to the package, the classes of the same name are kept instead.
+        if name in __all__ and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super(_Package, self).__setattr__(name, value)
+
+
+def __getattr__(name: str):
+    """Imports the class with given name from the submodule of the same name on first access.
+
+    Args:
+        name (str): Name of the class.
+
+    Raises:
+        AttributeError if the package exports no class with given name.
+
+    Returns:
+        Class.
+
+    """
+    if name in __all__:
+        value = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""This module contains the fixtures shared by the tests."""
+import os
+
+import pytest
+from PySide2.QtWidgets import QApplication
+
+# The widgets are tested without a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    """Gets the application which has to exist before any widget is built.
+
+    Returns:
+        QApplication: Application of the test session.
+
+    """
+    return QApplication.instance() or QApplication([])
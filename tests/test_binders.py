@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests of the ClearableDateTimeBinder."""
+from datetime import datetime
+
+import pytest
+from PySide2.QtCore import QDate, QDateTime, QTime
+
+from ClearableDateTimeEdit.Binders import ClearableDateTimeBinder
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+
+@pytest.fixture
+def binder(qapp) -> ClearableDateTimeBinder:
+    """Gets a binder with the empty fields "start", "end" and "due".
+
+    Returns:
+        ClearableDateTimeBinder: Binder.
+
+    """
+    binder = ClearableDateTimeBinder()
+    for name in ["start", "end", "due"]:
+        binder.addField(name, ClearableDateTimeEdit())
+    return binder
+
+
+def test_load_sends_changes_once(binder):
+    received = []
+    binder.valuesChanged.connect(received.append)
+    binder.load({"start": datetime(2022, 12, 24, 18), "end": QDateTime(QDate(2022, 12, 26), QTime(8, 0))})
+    assert len(received) == 1
+    assert sorted(received[0]) == ["end", "start"]
+    assert received[0]["start"][1] == QDateTime(QDate(2022, 12, 24), QTime(18, 0))
+
+
+def test_failed_load_sends_changes_of_applied_fields(binder):
+    received = []
+    binder.valuesChanged.connect(received.append)
+    with pytest.raises(TypeError):
+        binder.load({"start": datetime(2022, 12, 24, 18), "end": "26.12.2022", "due": datetime(2022, 12, 31)})
+    assert len(received) == 1
+    assert list(received[0]) == ["start"]
+    assert received[0]["start"][1] == binder.field("start").dateTime()
+    assert not binder.field("start").signalsBlocked()
+    assert not binder.field("end").signalsBlocked()
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests of the DateTimeController."""
+from datetime import datetime, time
+
+import pytest
+
+from ClearableDateTimeEdit.Core import DateTimeController
+from ClearableDateTimeEdit.Settings import Mode
+
+
+@pytest.mark.parametrize("mode", [Mode.date, Mode.datetime])
+def test_bound_keeps_times_between_first_and_last_day(mode):
+    controller = DateTimeController(mode)
+    controller.setDateTimeRange(datetime(2020, 1, 1, 8), datetime(2020, 1, 5, 18))
+    assert controller.bound(datetime(2020, 1, 3, 3)) == datetime(2020, 1, 3, 3)
+    assert controller.bound(datetime(2020, 1, 1, 3)) == datetime(2020, 1, 1, 8)
+    assert controller.bound(datetime(2020, 1, 5, 20)) == datetime(2020, 1, 5, 18)
+
+
+def test_bound_keeps_time_range_in_time_mode():
+    controller = DateTimeController(Mode.time)
+    controller.setMinimumTime(time(8))
+    controller.setMaximumTime(time(17))
+    assert controller.bound(datetime(2000, 1, 1, 20)) == datetime(2000, 1, 1, 17)
+    assert controller.bound(datetime(2000, 1, 1, 3)) == datetime(2000, 1, 1, 8)
+    assert controller.bound(datetime(2000, 1, 1, 12)) == datetime(2000, 1, 1, 12)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""This module contains the property-based tests comparing the display format engine with QDateTime."""
+from datetime import datetime
+
+from hypothesis import given
+from hypothesis import strategies as st
+from PySide2.QtCore import QDateTime, QLocale
+
+from ClearableDateTimeEdit.Formats import compileFormat
+
+# The engine uses English names like Qt in the C locale, so names are only compared if the system locale is English.
+_ENGLISH = QLocale.system().dayName(1) == "Monday"
+_FIELDS = ["d", "dd", "M", "MM", "yy", "yyyy", "h", "hh", "H", "HH", "m", "mm", "s", "ss", "z", "zzz", "AP", "ap"]
+if _ENGLISH:
+    _FIELDS += ["ddd", "dddd", "MMM", "MMMM"]
+# Fields are separated by literals, so that adjacent letters do not form one field.
+_SEPARATORS = [".", "-", "/", ":", " ", ", ", "'T'", "'at' "]
+
+
+def _formats(separators: list) -> st.SearchStrategy:
+    """Gets the strategy building display formats of up to eight fields.
+
+    Args:
+        separators (list): Literals which follow the fields.
+
+    Returns:
+        st.SearchStrategy: Strategy of display formats.
+
+    """
+    parts = st.tuples(st.sampled_from(_FIELDS), st.sampled_from(separators))
+    return st.lists(parts, min_size=1, max_size=8).map(lambda x: "".join(field + separator for field, separator in x))
+
+
+formats = _formats(_SEPARATORS + ["''"])
+# QDateTime.fromString of Qt 5 does not parse escaped quotes.
+parsedFormats = _formats(_SEPARATORS)
+
+
+def _values(first: int, last: int) -> st.SearchStrategy:
+    """Gets the strategy building datetimes with milliseconds like QDateTime.
+
+    Args:
+        first (int): First year.
+        last (int): Last year.
+
+    Returns:
+        st.SearchStrategy: Strategy of datetimes.
+
+    """
+    dts = st.datetimes(min_value=datetime(first, 1, 1), max_value=datetime(last, 12, 31, 23, 59, 59))
+    return dts.map(lambda dt: dt.replace(microsecond=dt.microsecond // 1000 * 1000))
+
+
+values = _values(1000, 9999)
+# Two digit years are parsed into the 20th century.
+centuryValues = _values(1900, 1999)
+
+
+@given(formats, values)
+def test_to_text_matches_qt(fmt, value):
+    assert compileFormat(fmt).toText(value) == QDateTime(value).toString(fmt)
+
+
+@given(parsedFormats, values)
+def test_from_text_matches_qt(fmt, value):
+    text = QDateTime(value).toString(fmt)
+    expected = QDateTime.fromString(text, fmt)
+    parsed = compileFormat(fmt).fromText(text)
+    if expected.isValid():
+        assert parsed == expected.toPython()
+    else:
+        assert parsed is None
+
+
+@given(formats, centuryValues)
+def test_round_trip_keeps_value(fmt, value):
+    compiled = compileFormat(fmt)
+    text = compiled.toText(value)
+    # The parts which are not displayed are taken from the value.
+    assert compiled.fromText(text, value) == value
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests of the IntervalIndex."""
+from datetime import date, datetime, time
+
+import pytest
+from PySide2.QtCore import QDate, QDateTime, QTime
+
+from ClearableDateTimeEdit.Intervals import IntervalIndex
+
+
+def test_overlapping_intervals_are_merged():
+    index = IntervalIndex(
+        [(datetime(2022, 1, 1, 8), datetime(2022, 1, 1, 12)), (datetime(2022, 1, 1, 10), datetime(2022, 1, 1, 14))]
+    )
+    assert list(index) == [(datetime(2022, 1, 1, 8), datetime(2022, 1, 1, 14))]
+
+
+def test_contained_interval_is_merged():
+    index = IntervalIndex(
+        [(datetime(2022, 1, 1, 8), datetime(2022, 1, 1, 18)), (datetime(2022, 1, 1, 10), datetime(2022, 1, 1, 12))]
+    )
+    assert list(index) == [(datetime(2022, 1, 1, 8), datetime(2022, 1, 1, 18))]
+
+
+def test_adjacent_days_are_merged():
+    index = IntervalIndex([(date(2022, 1, 3), date(2022, 1, 4)), (date(2022, 1, 1), date(2022, 1, 2))])
+    assert list(index) == [(datetime(2022, 1, 1), datetime.combine(date(2022, 1, 4), time.max))]
+
+
+def test_intervals_with_gap_are_kept():
+    index = IntervalIndex([(date(2022, 1, 1), date(2022, 1, 1)), (date(2022, 1, 3), date(2022, 1, 3))])
+    assert len(index) == 2
+    assert not index.contains(datetime(2022, 1, 2, 12))
+
+
+def test_date_bounds_include_whole_days():
+    index = IntervalIndex([(date(2022, 12, 24), date(2022, 12, 26))])
+    assert index.contains(datetime(2022, 12, 24))
+    assert index.contains(datetime(2022, 12, 26, 23, 59, 59, 999999))
+    assert not index.contains(datetime(2022, 12, 27))
+    assert not index.contains(datetime(2022, 12, 23, 23, 59, 59, 999999))
+
+
+def test_datetime_bounds_are_included():
+    index = IntervalIndex([(datetime(2023, 1, 2, 8), datetime(2023, 1, 2, 10))])
+    assert index.contains(datetime(2023, 1, 2, 8))
+    assert index.contains(datetime(2023, 1, 2, 10))
+    assert not index.contains(datetime(2023, 1, 2, 10, 0, 0, 1))
+    assert not index.coversDate(date(2023, 1, 2))
+
+
+def test_date_and_datetime_bounds_are_merged():
+    index = IntervalIndex([(date(2022, 1, 1), date(2022, 1, 1)), (datetime(2022, 1, 2), datetime(2022, 1, 2, 6))])
+    assert list(index) == [(datetime(2022, 1, 1), datetime(2022, 1, 2, 6))]
+
+
+def test_qt_bounds_are_converted():
+    index = IntervalIndex([(QDate(2022, 1, 1), QDateTime(QDate(2022, 1, 1), QTime(12, 0)))])
+    assert list(index) == [(datetime(2022, 1, 1), datetime(2022, 1, 1, 12))]
+
+
+def test_covers_does_not_span_gap():
+    index = IntervalIndex([(date(2022, 1, 1), date(2022, 1, 2)), (date(2022, 1, 4), date(2022, 1, 5))])
+    assert index.covers(datetime(2022, 1, 1, 12), datetime(2022, 1, 2, 12))
+    assert not index.covers(datetime(2022, 1, 1, 12), datetime(2022, 1, 4, 12))
+    assert not index.covers(datetime(2022, 1, 3), datetime(2022, 1, 3, 1))
+    assert index.coversDate(date(2022, 1, 4))
+    assert not index.coversDate(date(2022, 1, 3))
+
+
+def test_reversed_interval_is_rejected():
+    with pytest.raises(ValueError):
+        IntervalIndex([(date(2022, 1, 2), date(2022, 1, 1))])
+
+
+def test_unsupported_bound_is_rejected():
+    with pytest.raises(TypeError):
+        IntervalIndex([("2022-01-01", date(2022, 1, 2))])
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests of the time list models shared by the time widgets."""
+import gc
+import weakref
+
+from PySide2.QtWidgets import QListView
+
+from ClearableDateTimeEdit.popup.TimeList import TimeListModel
+
+
+def test_shared_model_is_reused_for_same_range(qapp):
+    model = TimeListModel.shared(0, 59, 15)
+    assert TimeListModel.shared(0, 59, 15) is model
+    assert TimeListModel.shared(0, 59, 5) is not model
+    assert [model.value(row) for row in range(model.rowCount())] == [0, 15, 30, 45]
+
+
+def test_shared_model_can_not_be_changed(qapp):
+    assert not hasattr(TimeListModel.shared(0, 23, 1), "setRange")
+
+
+def test_shared_model_is_dropped_when_no_list_shows_it(qapp):
+    view = QListView()
+    view.setModel(TimeListModel.shared(0, 999, 7))
+    gc.collect()
+    model = weakref.ref(view.model())
+    assert TimeListModel.shared(0, 999, 7) is model()
+    view.setModel(TimeListModel.shared(0, 999, 9))
+    gc.collect()
+    assert model() is None
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests comparing the cached time zones with zoneinfo."""
+from datetime import datetime, timezone
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ClearableDateTimeEdit.TimeZones import timeZone
+
+zoneinfo = pytest.importorskip("zoneinfo")
+
+_KEYS = ["Europe/Berlin", "America/New_York", "Australia/Lord_Howe", "Asia/Kolkata"]
+
+
+def _utc(local: datetime, key: str, fold: int) -> datetime:
+    """Converts given wall time into naive UTC with zoneinfo.
+
+    Args:
+        local (datetime): Naive wall time.
+        key (str): IANA key.
+        fold (int): Fold of the wall time.
+
+    Returns:
+        datetime: Naive UTC datetime.
+
+    """
+    aware = local.replace(tzinfo=zoneinfo.ZoneInfo(key), fold=fold)
+    return aware.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.mark.parametrize("fold", [0, 1])
+def test_gap_is_missing_and_converted_like_zoneinfo(fold):
+    berlin = timeZone("Europe/Berlin")
+    local = datetime(2022, 3, 27, 2, 30)
+    assert berlin.isMissing(local)
+    assert not berlin.isAmbiguous(local)
+    assert berlin.toUtc(local, fold) == _utc(local, "Europe/Berlin", fold)
+
+
+def test_gap_is_left_forwards():
+    berlin = timeZone("Europe/Berlin")
+    assert berlin.toLocal(datetime(2022, 3, 27, 0, 59, 59)) == datetime(2022, 3, 27, 1, 59, 59)
+    assert berlin.toLocal(datetime(2022, 3, 27, 1)) == datetime(2022, 3, 27, 3)
+
+
+@pytest.mark.parametrize("fold, utc", [(0, datetime(2022, 10, 30, 0, 30)), (1, datetime(2022, 10, 30, 1, 30))])
+def test_fold_is_ambiguous_and_converted_like_zoneinfo(fold, utc):
+    berlin = timeZone("Europe/Berlin")
+    local = datetime(2022, 10, 30, 2, 30)
+    assert berlin.isAmbiguous(local)
+    assert not berlin.isMissing(local)
+    assert berlin.toUtc(local, fold) == _utc(local, "Europe/Berlin", fold) == utc
+    converted = berlin.toLocal(utc)
+    assert converted == local
+    assert converted.fold == fold
+
+
+@pytest.mark.parametrize(
+    "utc",
+    [
+        datetime(2022, 3, 27, 0, 59, 59),
+        datetime(2022, 3, 27, 1),
+        datetime(2022, 10, 30, 0, 59, 59),
+        datetime(2022, 10, 30, 1),
+        datetime(2022, 10, 30, 1, 59, 59),
+        datetime(2022, 10, 30, 2),
+    ],
+)
+def test_transitions_match_zoneinfo(utc):
+    local = timeZone("Europe/Berlin").toLocal(utc)
+    expected = utc.replace(tzinfo=timezone.utc).astimezone(zoneinfo.ZoneInfo("Europe/Berlin"))
+    assert (local, local.fold) == (expected.replace(tzinfo=None), expected.fold)
+
+
+@given(st.sampled_from(_KEYS), st.datetimes(min_value=datetime(1970, 1, 1), max_value=datetime(2037, 12, 31)))
+def test_utc_round_trip_matches_zoneinfo(key, utc):
+    zone = timeZone(key)
+    local = zone.toLocal(utc)
+    expected = utc.replace(tzinfo=timezone.utc).astimezone(zoneinfo.ZoneInfo(key))
+    assert local == expected.replace(tzinfo=None)
+    assert local.fold == expected.fold
+    assert zone.toUtc(local) == utc
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests of the DateTimeValidator."""
+from datetime import datetime
+
+import pytest
+from PySide2.QtGui import QValidator
+
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.Validators import DateTimeValidator
+
+_MINIMUM = datetime(1752, 9, 14)
+_MAXIMUM = datetime(9999, 12, 31, 23, 59, 59, 999000)
+
+
+@pytest.mark.parametrize("text", ["", "24.12.2022 18:00:00", "29.02.2024 00:00:00"])
+def test_complete_texts_are_acceptable(text):
+    assert DateTimeValidator("dd.MM.yyyy HH:mm:ss", _MINIMUM, _MAXIMUM).validate(text, 0) == QValidator.Acceptable
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["2", "24", "24.", "24.1", "24.12.2022 1", "24..2022 18:00:00", "24.13.2022 18:00:00", "31.02.2022 18:00:00"],
+)
+def test_prefixes_and_edited_texts_are_intermediate(text):
+    assert DateTimeValidator("dd.MM.yyyy HH:mm:ss", _MINIMUM, _MAXIMUM).validate(text, 0) == QValidator.Intermediate
+
+
+@pytest.mark.parametrize("text", ["x", "24x", "24.12.2022x", "24.12.2022 18:00:00x", "24-12"])
+def test_characters_which_can_not_match_are_invalid(text):
+    assert DateTimeValidator("dd.MM.yyyy HH:mm:ss", _MINIMUM, _MAXIMUM).validate(text, 0) == QValidator.Invalid
+
+
+@pytest.mark.parametrize(
+    "text, state",
+    [
+        ("01.01.2020 03:00:00", QValidator.Intermediate),
+        ("01.01.2020 08:00:00", QValidator.Acceptable),
+        ("03.01.2020 03:00:00", QValidator.Acceptable),
+        ("05.01.2020 20:00:00", QValidator.Intermediate),
+        ("06.01.2020 12:00:00", QValidator.Intermediate),
+    ],
+)
+def test_datetime_mode_checks_datetime_range(text, state):
+    validator = DateTimeValidator("dd.MM.yyyy HH:mm:ss", datetime(2020, 1, 1, 8), datetime(2020, 1, 5, 18))
+    assert validator.validate(text, 0) == state
+
+
+@pytest.mark.parametrize(
+    "text, state",
+    [("07:59:59", QValidator.Intermediate), ("08:00:00", QValidator.Acceptable), ("18:00:01", QValidator.Intermediate)],
+)
+def test_time_mode_checks_time_range(text, state):
+    validator = DateTimeValidator("HH:mm:ss", datetime(2000, 1, 1, 8), datetime(2000, 1, 1, 18), Mode.time)
+    assert validator.validate(text, 0) == state
+
+
+def test_date_mode_checks_date_range():
+    validator = DateTimeValidator("dd.MM.yyyy", datetime(2020, 1, 1, 8), datetime(2020, 1, 5, 18), Mode.date)
+    assert validator.validate("01.01.2020", 0) == QValidator.Acceptable
+    assert validator.validate("06.01.2020", 0) == QValidator.Intermediate
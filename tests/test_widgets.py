@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""This module contains the tests of the ClearableDateTimeEdit widget."""
+from PySide2.QtCore import (
+    QCoreApplication,
+    QDate,
+    QDateTime,
+    QEvent,
+    QObject,
+    Qt,
+    QTime,
+)
+from PySide2.QtTest import QTest
+from PySide2.QtWidgets import QApplication
+
+from ClearableDateTimeEdit.Core import Part
+from ClearableDateTimeEdit.Settings import Mode
+from ClearableDateTimeEdit.Values import DateTimeValue
+from ClearableDateTimeEdit.Widgets import ClearableDateTimeEdit
+
+
+def _liveObjects(widget: ClearableDateTimeEdit) -> int:
+    """Counts the QObjects owned by given widget and the top level widgets after the deferred deletions.
+
+    Args:
+        widget (ClearableDateTimeEdit): DateTimeEdit.
+
+    Returns:
+        int: Number of live QObjects.
+
+    """
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    return len(widget.findChildren(QObject)) + len(QApplication.topLevelWidgets())
+
+
+def _commitText(widget: ClearableDateTimeEdit, text: str):
+    """Enters given text into given widget and commits it with the return key.
+
+    Args:
+        widget (ClearableDateTimeEdit): DateTimeEdit.
+        text (str): Text in the display format of the widget.
+
+    """
+    widget.setText(text)
+    QTest.keyClick(widget, Qt.Key_Return)
+
+
+def test_date_time_changed_is_sent_once_per_commit(qapp):
+    edit = ClearableDateTimeEdit()
+    received = []
+    values = []
+    edit.dateTimeChanged.connect(received.append)
+    edit.dateTimeValueChanged.connect(values.append)
+    _commitText(edit, "03.01.2020 08:00:00")
+    assert [type(dt) for dt in received] == [QDateTime]
+    assert received[0].toPython().isoformat() == "2020-01-03T08:00:00"
+    assert [type(value) for value in values] == [DateTimeValue]
+
+
+def _dateTime(*args: int) -> QDateTime:
+    """Builds a QDateTime from year, month, day, hour, minute and second.
+
+    Args:
+        *args (int): Year, month, day, hour, minute and second.
+
+    Returns:
+        QDateTime: Datetime.
+
+    """
+    return QDateTime(QDate(*args[:3]), QTime(*args[3:]))
+
+
+def test_value_changed_sends_changed_date_parts(qapp):
+    edit = ClearableDateTimeEdit()
+    edit.setDateTime(_dateTime(2020, 1, 3, 8, 0))
+    received = []
+    typed = []
+    edit.valueChanged.connect(lambda old, new, parts: received.append((old, new, parts)))
+    edit.valueChanged[QDateTime, QDateTime, int].connect(lambda old, new, parts: typed.append(parts))
+    edit.setDate(QDate(2020, 2, 4))
+    assert received == [(_dateTime(2020, 1, 3, 8, 0), _dateTime(2020, 2, 4, 8, 0), Part.month | Part.day)]
+    assert typed == [int(Part.month | Part.day)]
+
+
+def test_value_changed_sends_changed_time_parts(qapp):
+    edit = ClearableDateTimeEdit()
+    edit.setDateTime(_dateTime(2020, 1, 3, 8, 0))
+    received = []
+    edit.valueChanged.connect(lambda old, new, parts: received.append(parts))
+    edit.setTime(QTime(8, 30))
+    edit.setTime(QTime(8, 30))
+    assert received == [Part.minute]
+
+
+def test_coalesced_changes_are_sent_once(qapp):
+    edit = ClearableDateTimeEdit()
+    edit.setDateTime(_dateTime(2020, 1, 3, 8, 0))
+    edit.setCoalesceChanges(True)
+    received = []
+    edit.valueChanged.connect(lambda old, new, parts: received.append((old, new, parts)))
+    edit.setDate(QDate(2020, 1, 4))
+    edit.setTime(QTime(9, 0))
+    edit.setDateTime(_dateTime(2020, 1, 5, 9, 0))
+    assert received == []
+    QCoreApplication.processEvents()
+    assert received == [(_dateTime(2020, 1, 3, 8, 0), _dateTime(2020, 1, 5, 9, 0), Part.day | Part.hour)]
+    edit.setTime(QTime(10, 0))
+    edit.setCoalesceChanges(False)
+    assert received[1:] == [(_dateTime(2020, 1, 5, 9, 0), _dateTime(2020, 1, 5, 10, 0), Part.hour)]
+
+
+def test_date_time_range_keeps_times_of_days_between(qapp):
+    edit = ClearableDateTimeEdit()
+    edit.setDateTimeRange(_dateTime(2020, 1, 1, 8, 0), _dateTime(2020, 1, 5, 18, 0))
+    edit.setDateTime(_dateTime(2020, 1, 3, 3, 0))
+    assert edit.dateTime() == _dateTime(2020, 1, 3, 3, 0)
+    assert edit.text() == "03.01.2020 03:00:00"
+
+
+def test_set_mode_keeps_number_of_objects(qapp):
+    edit = ClearableDateTimeEdit()
+    popup = edit.calendarWidget().window()
+    modes = [Mode.date, Mode.datetime, Mode.time]
+    # Every mode is used once, so that the helpers built on first use are counted.
+    for mode in modes:
+        edit.setMode(mode)
+    count = _liveObjects(edit)
+    for _ in range(20):
+        for mode in modes:
+            edit.setMode(mode)
+    assert _liveObjects(edit) == count
+    assert edit.calendarWidget().window() is popup
+
+
+def test_set_mode_shows_value_in_format_of_mode(qapp):
+    edit = ClearableDateTimeEdit()
+    _commitText(edit, "03.01.2020 08:00:00")
+    edit.setMode(Mode.date)
+    assert edit.text() == "03.01.2020"
+    edit.setMode(Mode.time)
+    assert edit.text() == "08:00:00"
+
+
+def test_set_mode_keeps_popup_connected(qapp):
+    edit = ClearableDateTimeEdit()
+    popup = edit.calendarWidget().window()
+    edit.setMode(Mode.date)
+    popup.calendarWidget.setSelectedDate(QDate(2022, 12, 24))
+    popup.ui.submitButton.click()
+    assert edit.date() == QDate(2022, 12, 24)
+    assert edit.text() == "24.12.2022"
+    edit.setMode(Mode.datetime)
+    popup.ui.nowButton.click()
+    assert edit.date() == QDate.currentDate()
+    assert edit.text() == edit.dateTime().toString("dd.MM.yyyy HH:mm:ss")